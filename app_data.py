@@ -1,14 +1,22 @@
 import json
 import os
-from pathlib import Path
+
+from instrumentation import timed
+from script_record import ScriptRecord
 
 class AppData:
     def __init__(self):
         self.data_file = 'app_settings.json'
         data = self.load_data()
         self.folders = data.get('folders', [])
-        self.favorites = data.get('favorites', [])
+        # A set, shared with every ScriptRecord, so favorite lookups don't scan a list
+        self.favorites = set(data.get('favorites', []))
         self.last_script_count = data.get('last_script_count', 0)
+        self.max_concurrent_runs = data.get('max_concurrent_runs', 4)
+        self.fast_run = data.get('fast_run', False)
+        self.fast_run_hosts = data.get('fast_run_hosts', 1)
+        self.preload_modules = data.get('preload_modules', [])
+        self.module_feed = data.get('module_feed', '')
         
     def load_data(self):
         try:
@@ -24,8 +32,13 @@ class AppData:
             with open(self.data_file, 'w') as f:
                 json.dump({
                     'folders': self.folders,
-                    'favorites': self.favorites,
-                    'last_script_count': self.last_script_count
+                    'favorites': sorted(self.favorites),
+                    'last_script_count': self.last_script_count,
+                    'max_concurrent_runs': self.max_concurrent_runs,
+                    'fast_run': self.fast_run,
+                    'fast_run_hosts': self.fast_run_hosts,
+                    'preload_modules': self.preload_modules,
+                    'module_feed': self.module_feed
                 }, f)
         except Exception as e:
             print(f"Error saving data: {e}")
@@ -34,6 +47,20 @@ class AppData:
         self.last_script_count = count
         self.save_data()
             
+    def set_max_concurrent_runs(self, count):
+        self.max_concurrent_runs = max(1, int(count))
+        self.save_data()
+            
+    def set_fast_run(self, enabled, hosts, preload_modules):
+        self.fast_run = bool(enabled)
+        self.fast_run_hosts = max(1, int(hosts))
+        self.preload_modules = list(preload_modules)
+        self.save_data()
+            
+    def set_module_feed(self, source):
+        self.module_feed = source.strip()
+        self.save_data()
+            
     def add_folder(self, folder_path):
         if folder_path not in self.folders:
             self.folders.append(folder_path)
@@ -46,14 +73,15 @@ class AppData:
             
     def toggle_favorite(self, script_path):
         if script_path in self.favorites:
-            self.favorites.remove(script_path)
+            self.favorites.discard(script_path)
         else:
-            self.favorites.append(script_path)
+            self.favorites.add(script_path)
         self.save_data()
         
     def is_favorite(self, script_path):
         return script_path in self.favorites
             
+    @timed('scan.folders')
     def get_all_powershell_scripts(self):
         scripts = []
         for folder in self.folders:
@@ -61,13 +89,5 @@ class AppData:
                 for root, _, files in os.walk(folder):
                     for file in files:
                         if file.endswith('.ps1'):
-                            full_path = os.path.join(root, file)
-                            relative_path = os.path.relpath(full_path, folder)
-                            scripts.append({
-                                'name': file,
-                                'full_path': full_path,
-                                'relative_path': relative_path,
-                                'folder': folder,
-                                'is_favorite': self.is_favorite(full_path)
-                            })
+                            scripts.append(ScriptRecord(os.path.join(root, file), folder, self.favorites))
         return scripts
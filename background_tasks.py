@@ -0,0 +1,104 @@
+import os
+import subprocess
+import sys
+import threading
+
+
+class TaskCancelled(Exception):
+    """Raised by work that noticed its task was cancelled or superseded"""
+
+
+def kill_process(process):
+    """Kill a process and the processes it started, such as a profile's child shells"""
+    try:
+        if process.poll() is not None:
+            return
+        if sys.platform == 'win32':
+            subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)],
+                           capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW)
+        elif os.getpgid(process.pid) == process.pid:
+            # Started with start_new_session (see new_session_kwargs), so its group is its tree
+            import signal
+            os.killpg(process.pid, signal.SIGKILL)
+        if process.poll() is None:
+            process.kill()
+    except OSError:
+        pass
+
+
+def new_session_kwargs():
+    """Popen arguments that let kill_process reach a process's children outside Windows"""
+    return {} if sys.platform == 'win32' else {'start_new_session': True}
+
+
+class TaskToken:
+    """One generation of a background task that can be restarted.
+
+    Workers check `cancelled` (or pass `cancel_event` to functions that take a
+    cancelled event) and attach the processes they start, so cancelling the
+    token also kills them.
+    """
+
+    def __init__(self, generation):
+        self.generation = generation
+        self.cancel_event = threading.Event()
+        self.processes = []
+        self.lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def attach(self, process):
+        """Kill process when the token is cancelled, right away if it already is"""
+        with self.lock:
+            if not self.cancelled:
+                self.processes.append(process)
+                return
+        kill_process(process)
+
+    def detach(self, process):
+        with self.lock:
+            if process in self.processes:
+                self.processes.remove(process)
+
+    def cancel(self):
+        with self.lock:
+            self.cancel_event.set()
+            processes, self.processes = self.processes, []
+        for process in processes:
+            kill_process(process)
+
+
+class TaskGenerations:
+    """Hands out tokens for a repeatable task, such as loading the module list.
+
+    Starting a new generation cancels the previous one, so overlapping
+    requests never race: only results for the current token are applied.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.current = None
+
+    def start(self):
+        """Cancel the running generation, if any, and return the token of a new one"""
+        with self.lock:
+            previous = self.current
+            self.generation += 1
+            self.current = TaskToken(self.generation)
+            token = self.current
+        if previous:
+            previous.cancel()
+        return token
+
+    def cancel(self):
+        with self.lock:
+            previous, self.current = self.current, None
+        if previous:
+            previous.cancel()
+
+    def is_current(self, token):
+        """True if no newer generation has been started and token hasn't been cancelled"""
+        return token is self.current and not token.cancelled
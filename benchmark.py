@@ -0,0 +1,316 @@
+"""Benchmarks for scanning, rendering and preview loading on synthetic script trees.
+
+Generates a reproducible folder tree of .ps1 files in a temporary directory,
+runs the app's hot paths against it with fake_powershell.py standing in for
+PowerShell, and writes the timings as JSON. GUI benchmarks need a display and
+are skipped without one.
+
+Usage:
+    python benchmark.py [--output results.json] [--baseline baseline.json]
+                        [--depth 3] [--fanout 4] [--files 10] [--file-size 2048]
+                        [--duplicates 0.1] [--modules 500] [--repeat 5] [--seed 1]
+
+With --baseline, each result is compared against the saved run and the exit
+code is 1 if any benchmark got slower than --threshold (default 10%). Changes
+of less than --min-delta-ms (default 1 ms), or where the fastest run didn't
+slow down as well, are reported as noise.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
+
+from execution import INTERPRETER_ENV
+
+FAKE_INTERPRETER = f'"{sys.executable}" "{os.path.join(BASE_DIR, "fake_powershell.py")}"'
+
+SCRIPT_TEMPLATE = '''<#
+.SYNOPSIS
+    Synthetic script {index}.
+.DESCRIPTION
+    Generated by benchmark.py.
+#>
+#Requires -Version 5.1
+param(
+    [Parameter(Mandatory=$true)]
+    [string]$Path,
+    [int]$Count = 3,
+    [switch]$Force
+)
+Import-Module -Name Module{module}
+Write-Output "script {index}"
+'''
+
+
+def generate_tree(root, depth=3, fanout=4, files_per_folder=10, file_size=2048, duplicates=0.1, seed=1):
+    """Create a folder tree of .ps1 files and return the number of files written.
+
+    Every folder down to `depth` levels has `fanout` subfolders and
+    `files_per_folder` scripts padded to about `file_size` bytes. A fraction
+    `duplicates` of the scripts reuse a file name from elsewhere in the tree.
+    """
+    rng = random.Random(seed)
+    names = []
+    count = 0
+
+    def fill(folder, level):
+        nonlocal count
+        os.makedirs(folder, exist_ok=True)
+        for _ in range(files_per_folder):
+            if names and rng.random() < duplicates:
+                name = rng.choice(names)
+            else:
+                name = f"Invoke-Task{count:06d}.ps1"
+                names.append(name)
+            content = SCRIPT_TEMPLATE.format(index=count, module=rng.randrange(50))
+            padding = max(0, file_size - len(content))
+            content += ('# ' + 'x' * 76 + '\n') * (padding // 79)
+            with open(os.path.join(folder, name), 'w', encoding='utf-8') as f:
+                f.write(content)
+            count += 1
+        if level < depth:
+            for index in range(fanout):
+                fill(os.path.join(folder, f"folder{index}"), level + 1)
+
+    fill(root, 0)
+    return count
+
+
+def generate_modules(count, seed=1):
+    """Return a fake Get-Module -ListAvailable result with `count` modules"""
+    rng = random.Random(seed)
+    modules = []
+    for index in range(count):
+        name = f"Contoso.Module{index:04d}"
+        version = f"{rng.randrange(1, 10)}.{rng.randrange(20)}.{rng.randrange(100)}"
+        if rng.random() < 0.05:
+            version += f"-preview{rng.randrange(5)}"
+        modules.append({
+            'Name': name,
+            'Version': version,
+            'Description': f"Synthetic module {index} for {rng.choice(['Azure', 'Exchange', 'SQL', 'Active Directory'])}",
+            'Path': f"C:\\Program Files\\WindowsPowerShell\\Modules\\{name}\\{version}\\{name}.psd1",
+            'RepositorySourceLocation': 'https://www.powershellgallery.com/api/v2'
+        })
+    return modules
+
+
+def measure(function, repeat):
+    """Run function `repeat` times and return timing statistics in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        'min_ms': round(min(times), 3),
+        'median_ms': round(statistics.median(times), 3),
+        'mean_ms': round(statistics.mean(times), 3),
+        'max_ms': round(max(times), 3),
+        'repeat': repeat
+    }
+
+
+def measure_scan_memory(app_data):
+    """Return the memory held by the scan result, in bytes per script"""
+    import gc
+    import tracemalloc
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    scripts = app_data.get_all_powershell_scripts()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return {'scripts': len(scripts), 'bytes_per_script': round(held / max(1, len(scripts)), 1)}
+
+
+def run_core_benchmarks(tree, repeat, results, memory):
+    from app_data import AppData
+    from script_metadata import extract_file
+
+    app_data = AppData()
+    app_data.folders = [tree]
+    scripts = app_data.get_all_powershell_scripts()
+
+    results['scan'] = measure(app_data.get_all_powershell_scripts, repeat)
+    memory['scan'] = measure_scan_memory(app_data)
+
+    paths = [script.full_path for script in scripts]
+    results['metadata_extract'] = measure(lambda: [extract_file(path) for path in paths], repeat)
+
+    # Preview loading reads the whole file, as selecting a script does
+    sample = paths[:200]
+
+    def load_previews():
+        for path in sample:
+            with open(path, 'r', encoding='utf-8') as f:
+                f.read()
+    results['preview_read'] = measure(load_previews, repeat)
+
+
+def run_gui_benchmarks(tree, modules, repeat, results, skipped):
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        for name in ('refresh_script_list', 'refresh_folder_list', 'filter_modules', 'preview_select'):
+            skipped[name] = f"no display: {e}"
+        return
+
+    root.withdraw()
+    try:
+        from powershell_manager import PowerShellManager
+        app = PowerShellManager(root)
+        app.app_data.folders = [tree]
+        # Notifications would pop up (or fail) on every refresh
+        app.show_notification = lambda title, msg: None
+
+        results['refresh_script_list'] = measure(
+            lambda: app.refresh_script_list(suppress_notification=True), repeat)
+
+        app.ensure_tab(app.folders_tab)
+        results['refresh_folder_list'] = measure(app.refresh_folder_list, repeat)
+
+        app.ensure_tab(app.modules_tab)
+        app.update_modules_ui(modules)
+        terms = ['azure', 'module01', '1.2', 'zzz', '']
+
+        def filter_all():
+            for term in terms:
+                app.module_filter_var.set(term)
+        results['filter_modules'] = measure(filter_all, repeat)
+
+        class Event:
+            widget = app.scripts_tree
+        items = app.scripts_tree.get_children()[:50]
+
+        def select_scripts():
+            for item in items:
+                app.scripts_tree.selection_set(item)
+                app.on_tree_select(Event())
+        results['preview_select'] = measure(select_scripts, repeat)
+    finally:
+        root.destroy()
+
+
+def compare(results, baseline, threshold, min_delta_ms=1.0):
+    """Print a comparison with a baseline run and return the names of regressed benchmarks.
+
+    A benchmark regressed if its median is more than `threshold` and
+    `min_delta_ms` slower and its fastest run is also more than `threshold` slower.
+    """
+    regressions = []
+    print(f"{'benchmark':<24}{'baseline ms':>14}{'current ms':>14}{'change':>10}")
+    for name, current in results.items():
+        previous = baseline.get('results', {}).get(name)
+        if not previous:
+            print(f"{name:<24}{'-':>14}{current['median_ms']:>14.2f}{'new':>10}")
+            continue
+        change = (current['median_ms'] - previous['median_ms']) / previous['median_ms'] if previous['median_ms'] else 0
+        flag = ''
+        if change > threshold:
+            slower_by_ms = current['median_ms'] - previous['median_ms']
+            if slower_by_ms > min_delta_ms and current['min_ms'] > previous['min_ms'] * (1 + threshold):
+                regressions.append(name)
+                flag = '  SLOWER'
+            else:
+                flag = '  (noise)'
+        print(f"{name:<24}{previous['median_ms']:>14.2f}{current['median_ms']:>14.2f}{change:>+10.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the app on a synthetic script tree")
+    parser.add_argument('--output', default='benchmark_results.json', help="where to write the results")
+    parser.add_argument('--baseline', help="compare against results saved by an earlier run")
+    parser.add_argument('--threshold', type=float, default=0.10, help="allowed slowdown against the baseline")
+    parser.add_argument('--min-delta-ms', type=float, default=1.0,
+                        help="slowdowns smaller than this are treated as noise")
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--fanout', type=int, default=4)
+    parser.add_argument('--files', type=int, default=10, help="scripts per folder")
+    parser.add_argument('--file-size', type=int, default=2048, help="approximate bytes per script")
+    parser.add_argument('--duplicates', type=float, default=0.1, help="fraction of scripts with a duplicate name")
+    parser.add_argument('--modules', type=int, default=500, help="number of fake installed modules")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--no-gui', action='store_true', help="skip the benchmarks that need Tk")
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output)
+    baseline_file = os.path.abspath(args.baseline) if args.baseline else None
+    work_dir = tempfile.mkdtemp(prefix='psm-benchmark-')
+    previous_dir = os.getcwd()
+    results = {}
+    memory = {}
+    skipped = {}
+    try:
+        # The app keeps its settings and caches in the working directory
+        os.chdir(work_dir)
+        tree = os.path.join(work_dir, 'scripts')
+        file_count = generate_tree(tree, args.depth, args.fanout, args.files, args.file_size,
+                                   args.duplicates, args.seed)
+        modules = generate_modules(args.modules, args.seed)
+        modules_file = os.path.join(work_dir, 'modules.json')
+        with open(modules_file, 'w', encoding='utf-8') as f:
+            json.dump(modules, f)
+        os.environ[INTERPRETER_ENV] = FAKE_INTERPRETER
+        os.environ['PSM_FAKE_MODULES'] = modules_file
+        print(f"Generated {file_count} scripts and {len(modules)} modules in {work_dir}")
+
+        run_core_benchmarks(tree, args.repeat, results, memory)
+        if args.no_gui:
+            skipped['gui'] = "--no-gui"
+        else:
+            run_gui_benchmarks(tree, modules, args.repeat, results, skipped)
+    finally:
+        os.chdir(previous_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'parameters': {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')},
+            'scripts': file_count
+        },
+        'results': results,
+        'memory': memory,
+        'skipped': skipped
+    }
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    for name, stats in results.items():
+        print(f"{name:<24}median {stats['median_ms']:9.2f} ms   min {stats['min_ms']:9.2f} ms")
+    for name, stats in memory.items():
+        print(f"{name + ' memory':<24}{stats['bytes_per_script']:.0f} bytes per script")
+    for name, reason in skipped.items():
+        print(f"{name:<24}skipped ({reason})")
+    print(f"Wrote {output}")
+
+    if baseline_file:
+        with open(baseline_file, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('meta', {}).get('parameters') != report['meta']['parameters']:
+            print("Warning: the baseline was recorded with different parameters")
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"FAIL: slower than the baseline: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""Regenerate icon_assets.py from the PNG files in icons/.
+
+The app loads icons straight from the bytes in icon_assets.py with
+tk.PhotoImage(data=...), so no decoding or Pillow is needed at startup.
+Run this after adding or changing an icon:
+
+    python build_icon_assets.py
+"""
+import os
+
+ICONS_DIR = 'icons'
+OUTPUT_FILE = 'icon_assets.py'
+BYTES_PER_LINE = 60
+
+
+def build(icons_dir=ICONS_DIR, output_file=OUTPUT_FILE):
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    icons_dir = os.path.join(base_dir, icons_dir)
+
+    lines = [
+        '# Generated by build_icon_assets.py from icons/*.png - do not edit',
+        '',
+        'ICONS = {',
+    ]
+    for file in sorted(os.listdir(icons_dir)):
+        if not file.endswith('.png'):
+            continue
+        with open(os.path.join(icons_dir, file), 'rb') as f:
+            data = f.read()
+        lines.append(f"    '{file[:-4]}': (")
+        for start in range(0, len(data), BYTES_PER_LINE):
+            lines.append(f"        {data[start:start + BYTES_PER_LINE]!r}")
+        lines.append('    ),')
+    lines.append('}')
+
+    with open(os.path.join(base_dir, output_file), 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    print(f"Wrote {output_file}")
+
+
+if __name__ == '__main__':
+    build()
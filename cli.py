@@ -0,0 +1,199 @@
+"""Headless command line for the script inventory, without Tk.
+
+    python main.py list [--favorites] [--rescan] [--json]
+    python main.py search QUERY [--rescan] [--json]
+    python main.py run SCRIPT [--json]
+    python main.py modules [--json]
+
+The script list comes from the snapshot the app saved last time (fast); pass
+--rescan to walk the script folders instead.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from app_data import AppData
+
+
+def load_scripts(app_data, rescan=False):
+    """Return the scripts from the last snapshot, or from a scan of the script folders"""
+    scripts = None
+    if not rescan:
+        from ui_snapshot import UISnapshot
+        scripts = UISnapshot().get_scripts(app_data.favorites)
+    if not scripts:
+        scripts = app_data.get_all_powershell_scripts()
+    scripts.sort(key=lambda x: x.name.lower())
+    return scripts
+
+
+def describe_scripts(scripts):
+    """Return script records as dicts, with cached metadata from the script index"""
+    from script_index import ScriptIndex
+    index = ScriptIndex()
+    rows = []
+    for script in scripts:
+        metadata = index.get(script.full_path) or {}
+        rows.append({
+            'name': script.name,
+            'path': script.full_path,
+            'folder': script.folder,
+            'favorite': script.is_favorite,
+            'synopsis': metadata.get('synopsis', ''),
+            'parameters': [param['name'] for param in metadata.get('params', [])],
+            'requires': metadata.get('requires', [])
+        })
+    return rows
+
+
+def print_table(rows, columns):
+    """Print dicts as a plain text table"""
+    def cell(value):
+        if isinstance(value, bool):
+            return 'yes' if value else ''
+        if isinstance(value, list):
+            return ', '.join(str(item) for item in value)
+        return '' if value is None else str(value)
+
+    lines = [[cell(row.get(column)) for column in columns] for row in rows]
+    widths = [max([len(column)] + [len(line[i]) for line in lines]) for i, column in enumerate(columns)]
+    print('  '.join(column.upper().ljust(width) for column, width in zip(columns, widths)).rstrip())
+    for line in lines:
+        print('  '.join(value.ljust(width) for value, width in zip(line, widths)).rstrip())
+
+
+def output(rows, columns, as_json):
+    if as_json:
+        json.dump(rows, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        print_table(rows, columns)
+
+
+def find_script(scripts, name):
+    """Resolve a script given by path or by (case-insensitive) file name"""
+    if os.path.isfile(name):
+        return os.path.abspath(name)
+    matches = [s.full_path for s in scripts if s.name.lower() in (name.lower(), name.lower() + '.ps1')]
+    if len(matches) > 1:
+        raise SystemExit(f"'{name}' matches several scripts:\n" + '\n'.join(matches))
+    return matches[0] if matches else None
+
+
+def command_list(args, app_data):
+    scripts = load_scripts(app_data, args.rescan)
+    if args.favorites:
+        scripts = [script for script in scripts if script.is_favorite]
+    output(describe_scripts(scripts), ('name', 'favorite', 'synopsis', 'path'), args.json)
+    return 0
+
+
+def command_search(args, app_data):
+    query = args.query.lower()
+    rows = [row for row in describe_scripts(load_scripts(app_data, args.rescan))
+            if query in row['name'].lower() or query in row['path'].lower()
+            or query in (row['synopsis'] or '').lower()]
+    output(rows, ('name', 'synopsis', 'path'), args.json)
+    return 0
+
+
+def command_run(args, app_data):
+    from execution import ExecutionManager, COMPLETED
+    from run_history import RunHistory
+
+    script_path = find_script(load_scripts(app_data), args.script)
+    if not script_path:
+        print(f"Script not found: {args.script}", file=sys.stderr)
+        return 2
+
+    def on_output(run, stream, line):
+        if not args.json:
+            print(line, file=sys.stderr if stream == 'stderr' else sys.stdout, flush=True)
+
+    history = RunHistory()
+    manager = ExecutionManager(max_concurrent=1, on_output=on_output, history=history)
+    run = manager.submit(script_path)
+    try:
+        run.done.wait()
+    except KeyboardInterrupt:
+        manager.cancel(run)
+        run.done.wait()
+    finally:
+        history.close()
+
+    if args.json:
+        output({
+            'script': run.script_path,
+            'status': run.status,
+            'exit_code': run.exit_code,
+            'duration': run.duration,
+            'error': run.error,
+            'output': [{'stream': stream, 'line': line} for stream, line in run.output]
+        }, None, True)
+    elif run.error:
+        print(run.error, file=sys.stderr)
+
+    if run.exit_code is not None:
+        return run.exit_code
+    return 0 if run.status == COMPLETED else 1
+
+
+def command_modules(args, app_data):
+    from module_jobs import list_modules
+    from module_versions import format_version, parse_version
+
+    try:
+        modules = list_modules()
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"Error listing modules: {e}", file=sys.stderr)
+        return 1
+    rows = [{
+        'name': module.get('Name'),
+        'version': format_version(module.get('Version')),
+        'path': module.get('Path'),
+        'description': module.get('Description')
+    } for module in modules]
+    # Versions may come as System.Version objects, so parse the formatted text; 10.0.0 sorts after 9.0.0
+    rows.sort(key=lambda row: ((row['name'] or '').lower(), parse_version(row['version'])))
+    output(rows, ('name', 'version', 'path'), args.json)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='main.py', description="PowerShell Script Manager without the GUI",
+        epilog="Without a command the GUI starts; 'main.py --open SCRIPT' or 'main.py --run SCRIPT' "
+               "selects or runs a script in it (handing over to the window if it is already open).")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = subparsers.add_parser('list', help="list the scripts in the configured folders")
+    list_parser.add_argument('--favorites', action='store_true', help="only list favorite scripts")
+    list_parser.add_argument('--rescan', action='store_true', help="scan the folders instead of using the last snapshot")
+    list_parser.set_defaults(handler=command_list)
+
+    search_parser = subparsers.add_parser('search', help="find scripts by name, path or synopsis")
+    search_parser.add_argument('query')
+    search_parser.add_argument('--rescan', action='store_true', help="scan the folders instead of using the last snapshot")
+    search_parser.set_defaults(handler=command_search)
+
+    run_parser = subparsers.add_parser('run', help="run a script and exit with its exit code")
+    run_parser.add_argument('script', help="script name or path")
+    run_parser.set_defaults(handler=command_run)
+
+    modules_parser = subparsers.add_parser('modules', help="list the installed PowerShell modules")
+    modules_parser.set_defaults(handler=command_modules)
+
+    for subparser in (list_parser, search_parser, run_parser, modules_parser):
+        subparser.add_argument('--json', action='store_true', help="print JSON instead of a table")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args, AppData())
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,551 @@
+import itertools
+import os
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+
+from background_tasks import kill_process, new_session_kwargs
+
+# Set to a command line (e.g. "python fake_powershell.py") to run scripts with a fake interpreter
+INTERPRETER_ENV = 'PSM_INTERPRETER'
+DEFAULT_INTERPRETER = ['powershell.exe', '-NoLogo', '-NonInteractive']
+
+# Run statuses
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+
+def resolve_interpreter(interpreter=None):
+    """Return the interpreter command line used to run scripts"""
+    if interpreter:
+        return list(interpreter)
+    override = os.environ.get(INTERPRETER_ENV)
+    if override:
+        return shlex.split(override, posix=(os.name != 'nt'))
+    return list(DEFAULT_INTERPRETER)
+
+
+def powershell_command(executable='powershell.exe'):
+    """Return the command prefix for a PowerShell probe or query, e.g. ['powershell.exe'].
+
+    Honours the interpreter override, so benchmarks and tests can run without PowerShell.
+    """
+    override = os.environ.get(INTERPRETER_ENV)
+    if override:
+        return shlex.split(override, posix=(os.name != 'nt'))
+    return [executable]
+
+
+class ScriptRun:
+    """A single execution of a script, from queueing to exit"""
+
+    def __init__(self, run_id, script_path):
+        self.id = run_id
+        self.script_path = script_path
+        self.name = os.path.basename(script_path)
+        self.status = QUEUED
+        self.exit_code = None
+        self.error = None
+        self.queued_time = time.time()
+        self.start_time = None
+        self.end_time = None
+        self.output = []  # (stream, line) tuples
+        self.output_size = 0
+        self.peak_memory = None
+        self.elevated = False
+        self.fast = False
+        self.process = None
+        self.host = None
+        self.telemetry = None
+        self.done = threading.Event()
+
+    @property
+    def duration(self):
+        if self.start_time is None:
+            return None
+        end = self.end_time if self.end_time is not None else time.time()
+        return end - self.start_time
+
+    @property
+    def finished(self):
+        return self.status in (COMPLETED, FAILED, CANCELLED)
+
+    def output_tail(self, lines=5):
+        return '\n'.join(line for _, line in self.output[-lines:])
+
+
+class ExecutionManager:
+    """Launches scripts, captures their output and limits how many run at once.
+
+    Finished runs are appended to `history` (a RunHistory) when given. When
+    fast run is enabled, runs are dispatched to a pre-warmed PowerShell host and
+    fall back to a regular launch when no host is free.
+    Callbacks are invoked from worker threads:
+      on_output(run, stream, line) for every stdout/stderr line
+      on_status(run) whenever a run is queued, started or finished
+    """
+
+    def __init__(self, max_concurrent=4, interpreter=None, on_output=None, on_status=None, history=None):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.interpreter = interpreter
+        self.history = history
+        self.warm_pool = None
+        self.on_output = on_output
+        self.on_status = on_status
+        self.runs = []
+        self.queue = deque()
+        self.running = set()
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+
+    def enable_fast_run(self, size=1, modules=(), on_failure=None):
+        """Keep `size` pre-warmed PowerShell hosts (no profile) for fast runs.
+
+        on_failure(error) is called from a worker thread if a host can't be started.
+        """
+        from warm_host import WarmHostPool
+        self.disable_fast_run()
+        # Like probes, hosts honour the interpreter override; they add their own options
+        command = list(self.interpreter) if self.interpreter else powershell_command()
+        self.warm_pool = WarmHostPool(command, size=size, modules=modules, on_failure=on_failure)
+
+    def disable_fast_run(self):
+        if self.warm_pool:
+            self.warm_pool.close()
+            self.warm_pool = None
+
+    def build_command(self, script_path):
+        return resolve_interpreter(self.interpreter) + ['-File', script_path]
+
+    def build_elevated_command(self, script_path):
+        # The elevated console is visible, so leave out -NonInteractive and keep prompts working
+        return resolve_interpreter(self.interpreter)[:1] + ['-File', script_path]
+
+    def submit(self, script_path):
+        """Queue a script for execution and return its ScriptRun"""
+        with self.lock:
+            run = ScriptRun(next(self.ids), script_path)
+            self.runs.append(run)
+            self.queue.append(run)
+        self.notify_status(run)
+        self.start_queued()
+        return run
+
+    def set_max_concurrent(self, value):
+        with self.lock:
+            self.max_concurrent = max(1, int(value))
+        self.start_queued()
+
+    def cancel(self, run):
+        """Cancel a queued run or kill a running one, with any processes it started"""
+        with self.lock:
+            if run in self.queue:
+                self.queue.remove(run)
+                run.status = CANCELLED
+                run.done.set()
+                queued = True
+            elif run.status == RUNNING and not run.elevated:
+                # A run that is still launching is killed by launch() once its process exists
+                run.status = CANCELLED
+                queued = False
+                host, process = run.host, run.process
+            else:
+                return
+        if queued:
+            self.notify_status(run)
+            return
+        if not host and not process:
+            return
+
+        # Killed outside the lock, since taking down a process tree can take a moment
+        try:
+            if host:
+                # The host is replaced once it is released
+                host.stop()
+            else:
+                kill_process(process)
+        except Exception as e:
+            print(f"Error cancelling run {run.id}: {e}")
+
+    def clear_finished(self):
+        """Forget finished runs and return them"""
+        with self.lock:
+            finished = [run for run in self.runs if run.finished]
+            self.runs = [run for run in self.runs if not run.finished]
+        return finished
+
+    def active_count(self):
+        with self.lock:
+            return len(self.running) + len(self.queue)
+
+    def start_queued(self):
+        """Start queued runs while there are free slots"""
+        while True:
+            with self.lock:
+                if not self.queue or len(self.running) >= self.max_concurrent:
+                    return
+                run = self.queue.popleft()
+                run.status = RUNNING
+                run.start_time = time.time()
+                self.running.add(run)
+            self.launch(run)
+
+    def launch(self, run):
+        if run.status == CANCELLED:
+            self.finish(run, CANCELLED)
+            return
+
+        pool = self.warm_pool
+        host = pool.acquire() if pool else None
+        if host:
+            run.fast = True
+            with self.lock:
+                run.host = host
+                cancelled = run.status == CANCELLED
+            if cancelled:
+                run.host = None
+                pool.release(host)
+                self.finish(run, CANCELLED)
+                return
+            self.notify_status(run)
+            threading.Thread(target=self.run_in_host, args=(run, pool, host), daemon=True).start()
+            return
+
+        from ps_runner import start_record
+        command = self.build_command(run.script_path)
+        run.telemetry = start_record(command)
+        kwargs = {}
+        if sys.platform == 'win32':
+            kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+        try:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                cwd=os.path.dirname(run.script_path) or None,
+                **new_session_kwargs(),
+                **kwargs
+            )
+        except Exception as e:
+            run.error = str(e)
+            run.telemetry.spawned()
+            run.telemetry.finish(None, error=run.error)
+            self.finish(run, FAILED)
+            return
+
+        run.telemetry.spawned()
+        with self.lock:
+            run.process = process
+            cancelled = run.status == CANCELLED
+        if cancelled:
+            # Cancelled while the process was starting
+            try:
+                kill_process(process)
+            except Exception as e:
+                print(f"Error cancelling run {run.id}: {e}")
+        self.notify_status(run)
+        readers = [
+            threading.Thread(target=self.read_stream, args=(run, run.process.stdout, 'stdout'), daemon=True),
+            threading.Thread(target=self.read_stream, args=(run, run.process.stderr, 'stderr'), daemon=True)
+        ]
+        for reader in readers:
+            reader.start()
+        threading.Thread(target=self.wait_for_exit, args=(run, readers), daemon=True).start()
+
+    def run_in_host(self, run, pool, host):
+        try:
+            run.exit_code = host.run_script(run.id, run.script_path,
+                                            lambda stream, line: self.record_output(run, stream, line))
+        except Exception as e:
+            if run.status != CANCELLED:
+                run.error = str(e)
+        pool.release(host)
+        run.host = None
+        if run.status == CANCELLED:
+            self.finish(run, CANCELLED)
+        else:
+            self.finish(run, COMPLETED if run.exit_code == 0 else FAILED)
+
+    def record_output(self, run, name, line):
+        run.output.append((name, line))
+        run.output_size += len(line) + 1
+        if self.on_output:
+            self.on_output(run, name, line)
+
+    def read_stream(self, run, stream, name):
+        try:
+            for line in stream:
+                self.record_output(run, name, line.rstrip('\r\n'))
+        except Exception as e:
+            print(f"Error reading {name} of run {run.id}: {e}")
+        finally:
+            stream.close()
+
+    def wait_for_exit(self, run, readers):
+        exit_code = self.wait_sampling_memory(run)
+        for reader in readers:
+            reader.join()
+        run.exit_code = exit_code
+        run.telemetry.finish(exit_code, sum(len(line) + 1 for stream, line in run.output if stream == 'stdout'))
+        if run.status == CANCELLED:
+            self.finish(run, CANCELLED)
+        else:
+            self.finish(run, COMPLETED if exit_code == 0 else FAILED)
+
+    def wait_sampling_memory(self, run, interval=0.25):
+        """Wait for the process to exit, tracking its peak memory when psutil is available"""
+        try:
+            import psutil
+        except ImportError:
+            return run.process.wait()
+        try:
+            ps_process = psutil.Process(run.process.pid)
+        except Exception:
+            return run.process.wait()
+
+        while True:
+            try:
+                memory = ps_process.memory_info()
+                # Windows reports the peak working set directly, elsewhere sample RSS
+                peak = getattr(memory, 'peak_wset', None) or memory.rss
+                run.peak_memory = max(run.peak_memory or 0, peak)
+            except Exception:
+                pass
+            try:
+                return run.process.wait(timeout=interval)
+            except subprocess.TimeoutExpired:
+                continue
+
+    def submit_elevated(self, script_path):
+        """Run a script as administrator (Windows only) and track its exit code and duration.
+
+        Elevated runs bypass the concurrency queue and don't take a slot, since they
+        run in their own console and their output can't be captured. They can't be
+        cancelled from here.
+        """
+        with self.lock:
+            run = ScriptRun(next(self.ids), script_path)
+            run.elevated = True
+            self.runs.append(run)
+            run.status = RUNNING
+            run.start_time = time.time()
+
+        from ps_runner import start_record
+        command = self.build_elevated_command(script_path)
+        run.telemetry = start_record(command, elevated=True)
+        params = subprocess.list2cmdline(command[1:])
+        try:
+            handle = shell_execute_elevated(command[0], params, os.path.dirname(script_path))
+        except Exception as e:
+            run.error = str(e)
+            run.telemetry.spawned()
+            run.telemetry.finish(None, error=run.error)
+            self.finish(run, FAILED)
+            raise
+
+        run.telemetry.spawned()
+        self.notify_status(run)
+        threading.Thread(target=self.wait_for_elevated, args=(run, handle), daemon=True).start()
+        return run
+
+    def wait_for_elevated(self, run, handle):
+        run.exit_code = wait_for_process_handle(handle)
+        run.telemetry.finish(run.exit_code)
+        self.finish(run, COMPLETED if run.exit_code == 0 else FAILED)
+
+    def finish(self, run, status):
+        with self.lock:
+            run.status = status
+            run.end_time = time.time()
+            self.running.discard(run)
+        if self.history:
+            self.history.record_run(run)
+        run.done.set()
+        self.notify_status(run)
+        self.start_queued()
+
+    def notify_status(self, run):
+        if self.on_status:
+            try:
+                self.on_status(run)
+            except Exception as e:
+                print(f"Error in run status callback: {e}")
+
+
+def shell_execute_elevated(executable, params, directory):
+    """Start a process with the 'runas' verb and return its process handle"""
+    import ctypes
+    from ctypes import wintypes
+
+    class SHELLEXECUTEINFOW(ctypes.Structure):
+        _fields_ = [
+            ('cbSize', wintypes.DWORD),
+            ('fMask', ctypes.c_ulong),
+            ('hwnd', wintypes.HWND),
+            ('lpVerb', wintypes.LPCWSTR),
+            ('lpFile', wintypes.LPCWSTR),
+            ('lpParameters', wintypes.LPCWSTR),
+            ('lpDirectory', wintypes.LPCWSTR),
+            ('nShow', ctypes.c_int),
+            ('hInstApp', wintypes.HINSTANCE),
+            ('lpIDList', ctypes.c_void_p),
+            ('lpClass', wintypes.LPCWSTR),
+            ('hkeyClass', wintypes.HKEY),
+            ('dwHotKey', wintypes.DWORD),
+            ('hIconOrMonitor', wintypes.HANDLE),
+            ('hProcess', wintypes.HANDLE),
+        ]
+
+    if not hasattr(ctypes, 'windll'):
+        raise OSError("Could not access Windows API for elevated privileges.")
+
+    SEE_MASK_NOCLOSEPROCESS = 0x00000040
+    SW_SHOWNORMAL = 1
+    info = SHELLEXECUTEINFOW()
+    info.cbSize = ctypes.sizeof(info)
+    info.fMask = SEE_MASK_NOCLOSEPROCESS
+    info.lpVerb = 'runas'
+    info.lpFile = executable
+    info.lpParameters = params
+    info.lpDirectory = directory
+    info.nShow = SW_SHOWNORMAL
+    if not ctypes.windll.shell32.ShellExecuteExW(ctypes.byref(info)):
+        raise ctypes.WinError()
+    return info.hProcess
+
+
+def wait_for_process_handle(handle, cancel_event=None):
+    """Wait for a process handle from shell_execute_elevated and return its exit code.
+
+    If cancel_event is set while waiting, the process is terminated.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    if not handle:
+        return None
+    INFINITE = 0xFFFFFFFF
+    WAIT_TIMEOUT = 0x102
+    kernel32 = ctypes.windll.kernel32
+    try:
+        if cancel_event is None:
+            kernel32.WaitForSingleObject(wintypes.HANDLE(handle), INFINITE)
+        else:
+            while kernel32.WaitForSingleObject(wintypes.HANDLE(handle), 250) == WAIT_TIMEOUT:
+                if cancel_event.is_set():
+                    kernel32.TerminateProcess(wintypes.HANDLE(handle), 1)
+        exit_code = wintypes.DWORD()
+        if kernel32.GetExitCodeProcess(wintypes.HANDLE(handle), ctypes.byref(exit_code)):
+            return exit_code.value
+        return None
+    finally:
+        kernel32.CloseHandle(wintypes.HANDLE(handle))
+
+
+class BatchItem:
+    """One script of a batch run"""
+
+    def __init__(self, script_path):
+        self.script_path = script_path
+        self.name = os.path.basename(script_path)
+        self.status = 'pending'
+        self.run = None
+
+    @property
+    def exit_code(self):
+        return self.run.exit_code if self.run else None
+
+    @property
+    def duration(self):
+        return self.run.duration if self.run else None
+
+    def output_tail(self, lines=5):
+        return self.run.output_tail(lines) if self.run else ''
+
+
+class BatchRun:
+    """Runs a selection of scripts through an ExecutionManager.
+
+    Scripts run on a worker pool of `parallelism` threads, each waiting on one
+    run. In sequential mode the scripts run in the given order, each one only
+    after the previous one succeeded; the rest are skipped after a failure.
+    on_update(item) is called from worker threads when an item changes.
+    """
+
+    def __init__(self, manager, script_paths, parallelism=4, sequential=False, on_update=None):
+        self.manager = manager
+        self.items = [BatchItem(path) for path in script_paths]
+        self.parallelism = 1 if sequential else max(1, int(parallelism))
+        self.sequential = sequential
+        self.on_update = on_update
+        self.cancelled = False
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+
+    def start(self):
+        threading.Thread(target=self.run_all, daemon=True).start()
+
+    def cancel(self):
+        with self.lock:
+            self.cancelled = True
+            runs = [item.run for item in self.items if item.run]
+        for run in runs:
+            if not run.finished:
+                self.manager.cancel(run)
+
+    def run_all(self):
+        try:
+            if self.sequential:
+                for item in self.items:
+                    if self.cancelled or self.has_failures():
+                        self.set_status(item, 'skipped')
+                        continue
+                    self.run_item(item)
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=self.parallelism) as executor:
+                    list(executor.map(self.run_item, self.items))
+        finally:
+            self.done.set()
+
+    def run_item(self, item):
+        if self.cancelled:
+            self.set_status(item, 'skipped')
+            return
+        run = self.manager.submit(item.script_path)
+        with self.lock:
+            item.run = run
+            cancelled = self.cancelled
+        if cancelled:
+            # cancel() ran while the script was being submitted and didn't see it
+            self.manager.cancel(run)
+        self.set_status(item, 'running')
+        item.run.done.wait()
+        self.set_status(item, item.run.status)
+
+    def has_failures(self):
+        return any(item.status in (FAILED, CANCELLED) for item in self.items)
+
+    def set_status(self, item, status):
+        item.status = status
+        if self.on_update:
+            try:
+                self.on_update(item)
+            except Exception as e:
+                print(f"Error in batch update callback: {e}")
+
+    def summary(self):
+        counts = {}
+        for item in self.items:
+            counts[item.status] = counts.get(item.status, 0) + 1
+        return counts
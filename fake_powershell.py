@@ -0,0 +1,144 @@
+"""Minimal stand-in for powershell.exe, used for testing without PowerShell.
+
+Usage: python fake_powershell.py [-NoLogo] [-NonInteractive] -File script.ps1
+       python fake_powershell.py [-NoProfile] -Command "..."
+       python fake_powershell.py -EncodedCommand ...   (warm host, see warm_host.py)
+
+Understands a tiny subset of PowerShell, one statement per line:
+  Write-Output / Write-Host "text"   -> stdout
+  Write-Error "text"                 -> stderr
+  Start-Sleep -Seconds N / -Milliseconds N
+  exit N
+Everything else is ignored.
+
+-EncodedCommand acts as a warm host: it prints READY, then runs the scripts
+requested on stdin with the warm host's "<id> O|E|X ..." output protocol.
+
+-Command answers the probes the app makes (execution policy, host version,
+$PROFILE, Get-Module -ListAvailable, ...) with canned values. Get-Module
+lists the modules in the JSON file named by PSM_FAKE_MODULES, if set.
+"""
+import json
+import os
+import re
+import sys
+import time
+
+FAKE_MODULES_ENV = 'PSM_FAKE_MODULES'
+
+DEFAULT_MODULES = [
+    {'Name': 'Microsoft.PowerShell.Management', 'Version': '3.1.0.0', 'Description': 'Management cmdlets',
+     'Path': r'C:\Windows\System32\WindowsPowerShell\v1.0\Modules\Microsoft.PowerShell.Management\Microsoft.PowerShell.Management.psd1',
+     'RepositorySourceLocation': None},
+    {'Name': 'PackageManagement', 'Version': '1.0.0.1', 'Description': 'PackageManagement (a.k.a. OneGet)',
+     'Path': r'C:\Program Files\WindowsPowerShell\Modules\PackageManagement\1.0.0.1\PackageManagement.psd1',
+     'RepositorySourceLocation': None},
+]
+
+# Substring of the command (lower case) -> canned output
+COMMAND_RESPONSES = [
+    ('get-executionpolicy', 'RemoteSigned'),
+    ('powershell_ise', 'Not installed'),
+    ('version.tostring()', '5.1.19041.1'),
+    ('$env:psmodulepath', r'C:\Users\user\Documents\WindowsPowerShell\Modules;C:\Program Files\WindowsPowerShell\Modules'),
+    ('$profile', r'C:\Users\user\Documents\WindowsPowerShell\Microsoft.PowerShell_profile.ps1'),
+    ('psedition', 'Desktop'),
+    ('.platform', 'Win32NT'),
+]
+
+
+def unquote(text):
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in '"\'':
+        return text[1:-1]
+    return text
+
+
+def write_console(stream, text):
+    print(text, file=sys.stderr if stream == 'stderr' else sys.stdout, flush=True)
+
+
+def run_script(path, write=write_console):
+    with open(path, 'r', encoding='utf-8-sig', errors='replace') as f:
+        lines = f.read().splitlines()
+
+    for line in lines:
+        statement = line.strip()
+        lowered = statement.lower()
+        if lowered.startswith(('write-output', 'write-host')):
+            write('stdout', unquote(statement.split(None, 1)[1] if ' ' in statement else ''))
+        elif lowered.startswith('write-error'):
+            write('stderr', unquote(statement.split(None, 1)[1] if ' ' in statement else ''))
+        elif lowered.startswith('start-sleep'):
+            match = re.search(r'-(seconds|milliseconds|s|ms)\s+([\d.]+)', statement, re.I)
+            if match:
+                value = float(match.group(2))
+                time.sleep(value / 1000 if match.group(1).lower() in ('milliseconds', 'ms') else value)
+        elif re.match(r'exit\b', lowered):
+            match = re.match(r'exit\s+(-?\d+)', lowered)
+            return int(match.group(1)) if match else 0
+    return 0
+
+
+def fake_modules():
+    path = os.environ.get(FAKE_MODULES_ENV)
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return DEFAULT_MODULES
+
+
+def run_command(command):
+    lowered = command.lower()
+    if 'get-module' in lowered and '-listavailable' in lowered:
+        modules = fake_modules()
+        match = re.search(r"-Name '([^']*)'", command)
+        if match:
+            modules = [module for module in modules if module['Name'].lower() == match.group(1).lower()]
+        print(json.dumps(modules))
+        return 0
+    if 'get-command' in lowered:
+        print('[]')
+        return 0
+    for pattern, response in COMMAND_RESPONSES:
+        if pattern in lowered:
+            print(response)
+            return 0
+    return 0
+
+
+def run_host():
+    print('READY', flush=True)
+    for request in sys.stdin:
+        run_id, _, path = request.rstrip('\r\n').partition('\t')
+
+        def write(stream, text):
+            print(f"{run_id} {'E' if stream == 'stderr' else 'O'} {text}", flush=True)
+
+        try:
+            exit_code = run_script(path, write)
+        except OSError as e:
+            write('stderr', str(e))
+            exit_code = 1
+        print(f"{run_id} X {exit_code}", flush=True)
+    return 0
+
+
+def main(argv):
+    args = list(argv)
+    if '-EncodedCommand' in args:
+        return run_host()
+    if '-File' in args:
+        index = args.index('-File')
+        if index + 1 < len(args):
+            return run_script(args[index + 1])
+    if '-Command' in args:
+        index = args.index('-Command')
+        if index + 1 < len(args):
+            return run_command(' '.join(args[index + 1:]))
+    print("fake_powershell: expected -File <script> or -Command <command>", file=sys.stderr)
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
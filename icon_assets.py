@@ -0,0 +1,56 @@
+# Generated by build_icon_assets.py from icons/*.png - do not edit
+
+ICONS = {
+    'folder_add': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\xa4IDAT8'
+        b'\x8d\xed\xd21\n\xc2@\x14\x04\xd0\x97ha#X\x089\x80\xe4\x04\xe6&\xde\xc0\xb4\x16^(\xbd\x85\x8d\x08\xa2\x8dh!\x88\x8d\x85\xd8\x08\x9e\xe0\r\x8c`b\x11\x16\x12\x16B \x85\xf9\x9b\x7f\x98\x9d\xd9'
+        b'\xd9\x1f\xfc\x0bQLqB\x07\x8b\xa0\x05\xfb\xb8b\x86.\xc6!\x04]\x0c\xf0\x0cR\xb0\x82+6\xe8E\x0e"],\xf1\xc09V\x90a\xedE\xc1F\xb3\xf0,j\\\x12\xf3\xc8\x8dJu\xdd\xc7\xb8\xac'
+        b"\xf3\x1d=\\\xb0O\x15l\xd1\xc7\x1d\xf7T\xc1\x01\x19\xf6\xb8\xa5\n\x0ehc\x84I\x8a \xc3\x1cS,b'mE\xb1\xc31q2\x89,\xce\xa8j)\x91\xe9\x00\x00\x00\x00IEND\xaeB`\x82"
+    ),
+    'folder_list': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x96IDAT8'
+        b'\x8dc`\x80\x82\xff\xff\xff3\xfe\xff\xff\x9f\x91X5L\xc4\x18\xcaH\xacf\\\x06\xfc\xff\xff\x9f\x05]\x03###\x13:\x9b\x11\x99\x8d\xcdp\x9c^@\xd7\xcc\xc0\xc0\xc0\xc0\x84M3\xb2fd>\x0c'
+        b'\xb0\xe0s>2\xd8\xb2s7\xc3\xb7\x1f?\xb1j\x88\r\ndHOIF\xb8\x00\xa7\x17\xf0i\x06\x03\x9c\x06\xe0\xd3\x8c\rp\x19\xc0B\xac\xe9\xc8.@\xf6\nN\x03\xb0i\xc6\xa6\x19\x06\xb0000'
+        b'0\xbc\xfd\xf8\x91\x81\x91\x91\x91\x81\x85\x99\x99\xe1\x1f\x8a<#\xc3\xdb\x8f\x1f\t\x1a\x08\x00\xb2_#\xc6cm\xc1H\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'folder_remove': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00_IDAT8'
+        b'\x8d\xed\xd2\xc1\t\xc0 \x0cF\xe1?\xeaH\x07\xeaH\x1dIG\xeaH\xdd\xa4\x9b\x94\xe2\x05\x0f\x82\x87\x16B=\xbcSH\x08_\x12\xe0\xf38a3\xb0\x8a\x88\xe77\x81bc\xc0\x8a\x1dwD<\xe9\x04'
+        b'\x19s\xbd\xa0\xa5s%\xc8\xf1\x84\xbd&\xc8+\x7f1\xe0h%\x18\xeb\xf2\x05Q\xda\xffI\xf0\x1f\x82\x1b\xdb\xe8\x1d\xd9>&\x1e\x81\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'notepad': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00vIDAT8'
+        b'\x8dc`\xa01\xf8O\x01\xa6\x9e\x01,$\xa8\xf9\x8f\xa6\x86b\x03\x18\x18\x18\x18\x98p\x08\xfeGb\xb1\x91\xe6\x02\x80\x00f\xc0\x7f\x06\xf2]\xb8\xf0\x06\xb0\x90c\x00\x0b\x12\xcd\x84E\xc3\xb2cg\x19\xbe'
+        b'\xfd\xf8\x89U\x83\xbe\x96*\xc3\x92\x053\xe1.`!\xe4\x05\\\x9a\xb1\xb1A.`\xc2\xa7\x08\x1d\xe0\xb3\x88\x85\x98\x80\xc4\xe6\x02\x10 *\x1aG\xc3\xc0\x18\x80/\x1c\xc8\xd2\x03\x00\xd3\xfb\x15\xf8\xc4\x1f$'
+        b'X\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'refresh': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\xedIDAT8'
+        b'\x8d\xed\xd21J\x03A\x14\xc6\xf1\xdf\xae\x1bH\xa3\x8d\x08^\xc0\x03X\xd9[X\xd8\x08\xb6\x82X\xe8\x11\x04[\xcf Xz\x00\xbd\x80wHc%\x82`e#6\x16\x166"\xe2\x9a\xccX$\xb3\xd9'
+        b'\x8dY\x15\xfc\x9a\xe1\xfd\xdf\xfb\xf0f\x18"\xb2\x16\xe4n\xf1\x80;<a\xf9?\xf0\x1e\xa6\x8f\xf1&\xfb\xb69\xf4\x06\x1f\xb1\x87\xf3*x\x81)N0-\xe2\x878\xfc\r~[\x81\xdbX\xc7*\x16q'
+        b'\x86\xd3\x9f\xe6\x16:\x11\x9d\xea3\xf70\xc5\x97\x98\xe3\xc67x\x9a\xb8\xda\xc56F\xb8\xc2\x10\x1d\xac`\x8c9.1E?\xfe#\xf4J\x92%z(@_8\xc7\x1c7\xd8\xc4+6p\x84\x97\xd0\xef'
+        b'G\xbc\x885\xda!\xf6q\x89\xbb8\xb0\xe3x\x8f\x8d\r\xdc\xe1\x01\xc78\xc3(\x88\x9a\xf8\xa8\xec\x04]\xbcc;"\xc61v\xe7\xb5\nj\x03\x9a\xd0\xac\x02\xd7m\xf3\x03"aD\xc9h\x87e)\x00'
+        b'\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'run': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\xaeIDAT8'
+        b'\x8d\xcd\x92\xb1\r\xc20\x10E\xdfQ\n\x1a:g\x006\xa0b\x04&\xa0b\x02\xc4\x06d\x046\xa0c\x032t\x08\n*\xb0\x8bD"#E\x02\xf1%K\xbe\xff\xfd\xb9\xb3O\xba\xd1\xbeb\x07\x94@'
+        b'v\xaf4\xa7%\xf0>1\x8bs\x9f\x19)>\xbe$6\x03-0\x00\xbb\x9f7\x95\x19\xe0\x0c\xbc\\>\x00\x1b\x1f\xa4\xb5\x1b\x02\x0f\x97\xd4\xc0\x1d\xd8\xab\xa6\x03\xceFo\x80\x9d#\xb4\xc0\x05x\x9b\xf9\n'
+        b'x\xa9\x0c\x1bT\x1f\x93\x80C\x80\xfe\x08<\x80\xa59\xc3\xdar\x84\xd1VE\xe8ub\xe3\xfc\x99$A_\xeb9]\xa6O\x08\xd3\x86P\xab\x9dw\x12t\xd4\x94^\x12\x1f\x8d\xe4\xcdz4\x1c\xec\xf4\x00'
+        b'\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'run_as': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\xebIDAT8'
+        b'\x8d\xed\x911K\xc3P\x14\x85\xbf\xfb\x92\x16D(\x15\x17\x8bC7\xc1IptS\x11\xff\x81\xb8\xfa\x1f\xfc\x0f\x0e\x0e\x0eN\x0eN\x15\x17q\xd5\xc5A\x9c\x95\x0e\x85\x8a\xe0\xe2$\x14i\x83\xda\xf78$'
+        b'}\xd5W:\x89\x07.\xef\xdd{\xcf\xb9\xbcs!\xe5\x84\xe4.\xd9\x1b\x1e\x00O@\xe4y@\x9e\x991\xc0\xc9\xd8\xaf\xdfA\x81\x04X\x03\xbe\x81\x13\xe0E\xa4\xd9\xaf\xb9\xd0K\xfaV\x80s\xe0\x1b8\x05'
+        b'.\x80{\xe0\x12\xd8\x05\xee\x80J\x02x\x15\xd1\x1c\x98\x05\xca\xc0)0@\xf3\xaf\x01\xdb!\x18\r\xca@\xb4\xe7D\xf4\x00\xa8\xe3\xa6!\xd4v\xee\x01\x93"\x10\'\xb9gT\xc1M\x9f\x01\x1a \x13\x89\x1a'
+        b'.s\xd6\xad*\xa2\x89\xd7\xf6&\xd0uR\x17\xd8\x12)$\xd5\xb4\x07\xec{\x8d+\xce\xae\x00\xdf\x81Y\xec\x03+S\xa6\xc0:\xb0\x0b\xfc\x00K9\x07\x9d9\xf1\x1fZ\xb2\x17\x8e\x83>\xc9\xd7\x00\x00\x00'
+        b'\x00IEND\xaeB`\x82'
+    ),
+    'scripts_refresh': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\xa3IDAT8'
+        b'\x8d\xed\xd11\n\xc2P\x10\x85\xe1/*\x166\x16A\xd0SX\xd8X\x08\x82\xe0\x01<\x81\xa5\x9dG\xf0\x14\x96^\xc0F\xbc\x89\x17\xb0\xb2\xd1J\xb0\xb2P\x08)\x84\xc7\x96\x85D\xf1m\x9a\x14\x16\x033'
+        b'\xbb\xfb\xcf\xec\xec\xc2\xbf.p\xc2\x1e]T\x8a\x1da\x83gJ]\xe4=C\xe0{\xc9{\xbax5\x10\x0c0\xca\xa0C\xac3\xe8\xc0\x1f\x05{\x1c\xb1\xc1:\x83\xee\x96N\xd0\xc62\xb7\xa0\x8a1f~'
+        b']z-5#g`^\xc0\xe8\x05\xca%\x04+\xf43z\xc5"Ay\x98N\x9c5f~\xa5i\xaf\xa5\x02\x1b\xac\x92\xc0\x13eY;\xc7\x81m\xa7\n\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+}
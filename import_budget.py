@@ -0,0 +1,106 @@
+"""Check the import-time budget of the GUI (powershell_manager.py).
+
+Runs `python -X importtime -c "import powershell_manager"` several times,
+parses the report and fails if a module that should be deferred to first use
+is imported at startup, or if its cumulative import time exceeds the budget.
+
+Usage: python import_budget.py [--runs N] [--budget-ms MS] [--top N]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+# The module main.py imports to start the GUI
+GUI_MODULE = 'powershell_manager'
+
+# Cumulative import time of the GUI module, in milliseconds (best of all runs)
+DEFAULT_BUDGET_MS = 150
+
+# Modules that must only be imported on first use, never at startup
+DEFERRED_MODULES = (
+    'winotify',
+    'PIL',
+    'pystray',
+    'webbrowser',
+    'ctypes',
+    'base64',
+    'psutil',
+    'multiprocessing',
+    'concurrent.futures',
+    'tkinter.filedialog',
+)
+
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+
+def measure_imports(module=GUI_MODULE):
+    """Import a module in a fresh interpreter and return [(name, self_us, cumulative_us)]"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    imports = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            imports.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return imports
+
+
+def check_budget(runs=5, budget_ms=DEFAULT_BUDGET_MS, top=10):
+    """Return a list of budget violations (empty when within budget)"""
+    # The first import may have to compile the module; don't count it
+    measure_imports()
+
+    best_ms = None
+    best_imports = []
+    for _ in range(runs):
+        imports = measure_imports()
+        gui_us = next((cumulative for name, _, cumulative in imports if name == GUI_MODULE), None)
+        if gui_us is None:
+            continue
+        if best_ms is None or gui_us / 1000 < best_ms:
+            best_ms = gui_us / 1000
+            best_imports = imports
+
+    print(f"{GUI_MODULE}: {best_ms:.1f} ms cumulative import time (budget {budget_ms} ms, best of {runs})")
+    print(f"Slowest {top} imports by self time:")
+    for name, self_us, cumulative_us in sorted(best_imports, key=lambda i: i[1], reverse=True)[:top]:
+        print(f"  {self_us / 1000:7.1f} ms  {cumulative_us / 1000:7.1f} ms  {name}")
+
+    violations = []
+    imported = {name for name, _, _ in best_imports}
+    for module in DEFERRED_MODULES:
+        if module in imported:
+            violations.append(f"{module} is imported at startup but should be deferred to first use")
+    if best_ms is None:
+        violations.append(f"Could not measure the import time of {GUI_MODULE}")
+    elif best_ms > budget_ms:
+        violations.append(f"{GUI_MODULE} takes {best_ms:.1f} ms to import, over the {budget_ms} ms budget")
+    return violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the import-time budget of the GUI")
+    parser.add_argument('--runs', type=int, default=5, help="number of measured imports")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help="cumulative budget for the GUI module")
+    parser.add_argument('--top', type=int, default=10, help="number of slowest imports to list")
+    args = parser.parse_args()
+
+    violations = check_budget(args.runs, args.budget_ms, args.top)
+    for violation in violations:
+        print(f"FAIL: {violation}")
+    if not violations:
+        print("OK: within import budget")
+    return 1 if violations else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
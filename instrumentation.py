@@ -0,0 +1,166 @@
+"""Timing of hot paths: folder scans, PowerShell calls, Treeview updates, file reads.
+
+    from instrumentation import timed, span
+
+    @timed('scan.folders')
+    def get_all_powershell_scripts(self): ...
+
+    with span('file.preview'):
+        content = f.read()
+
+Recording is off unless PSM_DIAGNOSTICS=1 is set or it is switched on in the
+Diagnostics tab (Ctrl+Shift+D). While off, `timed` costs one flag check per
+call and `span` returns a shared no-op context manager.
+"""
+import bisect
+import os
+import threading
+import time
+
+# Upper bounds of the histogram buckets in milliseconds; the last bucket is open
+BUCKET_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_enabled = os.environ.get('PSM_DIAGNOSTICS') == '1'
+_stats = {}
+_lock = threading.Lock()
+
+
+class OperationStats:
+    """Count, total, extremes and a histogram of one operation's durations"""
+
+    __slots__ = ('count', 'total_ms', 'min_ms', 'max_ms', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = None
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def add(self, ms):
+        self.count += 1
+        self.total_ms += ms
+        if self.min_ms is None or ms < self.min_ms:
+            self.min_ms = ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+
+    def percentile(self, fraction):
+        """Approximate a percentile by the upper bound of the bucket it falls in"""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return BUCKET_BOUNDS_MS[index] if index < len(BUCKET_BOUNDS_MS) else self.max_ms
+        return self.max_ms
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'total_ms': round(self.total_ms, 3),
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else None,
+            'min_ms': round(self.min_ms, 3) if self.min_ms is not None else None,
+            'max_ms': round(self.max_ms, 3),
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'histogram': {bound: count for bound, count in
+                          zip([str(bound) for bound in BUCKET_BOUNDS_MS] + ['inf'], self.buckets) if count}
+        }
+
+
+def is_enabled():
+    return _enabled
+
+
+def set_enabled(enabled):
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def record(name, ms):
+    """Add one duration (in milliseconds) to an operation's statistics"""
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = OperationStats()
+        stats.add(ms)
+
+
+class _Span:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        record(self.name, (time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name):
+    """Context manager timing the enclosed block as operation `name`"""
+    return _Span(name) if _enabled else _NULL_SPAN
+
+
+def timed(name):
+    """Decorator timing every call of a function as operation `name`"""
+    def decorator(function):
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, (time.perf_counter() - start) * 1000)
+        wrapper.__name__ = function.__name__
+        wrapper.__qualname__ = function.__qualname__
+        wrapper.__doc__ = function.__doc__
+        wrapper.__wrapped__ = function
+        return wrapper
+    return decorator
+
+
+def snapshot():
+    """Return {operation: statistics} for everything recorded so far"""
+    with _lock:
+        return {name: stats.as_dict() for name, stats in sorted(_stats.items())}
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+
+def export_json(path, extra=None):
+    """Write the current statistics, plus any `extra` sections, to a JSON file"""
+    import json
+    data = {
+        'exported': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'bucket_bounds_ms': list(BUCKET_BOUNDS_MS),
+        'operations': snapshot()
+    }
+    data.update(extra or {})
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
@@ -0,0 +1,299 @@
+"""Local JSON-RPC 2.0 endpoint of the running app, for other tools on the same machine.
+
+The app listens on a named pipe (Windows) or a Unix socket. Address and
+authentication key are written to an endpoint file only the current user can
+read: rpc_endpoint.json in the settings folder, created with mode 0600, or on
+Windows (where that mode sets no ACL) a file under %LOCALAPPDATA%.
+multiprocessing.connection does the authentication handshake. Each message is
+one JSON-RPC object sent with send_bytes/recv_bytes.
+
+    from local_rpc import RpcClient
+    with RpcClient() as client:
+        client.call('search', query='backup')
+
+Methods are registered by the app (see PowerShellManager.start_rpc_server).
+`subscribe` keeps the connection open for notifications such as
+{"method": "scripts_changed", "params": {...}}.
+"""
+import hashlib
+import inspect
+import json
+import os
+import secrets
+import sys
+import tempfile
+import threading
+
+ENDPOINT_FILE = 'rpc_endpoint.json'
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RpcError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def settings_hash(settings_folder='.'):
+    folder = os.path.normcase(os.path.abspath(settings_folder))
+    return hashlib.sha256(folder.encode('utf-8')).hexdigest()[:16]
+
+
+def default_endpoint_file(settings_folder='.'):
+    """Return the endpoint file of the settings folder's instance.
+
+    The settings folder may be readable by other users, and on Windows a file
+    mode doesn't restrict access, so there the key goes to the user's local app data.
+    """
+    if sys.platform == 'win32':
+        app_data = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+        return os.path.join(app_data, 'PowerShellScriptManager', f'rpc_endpoint-{settings_hash(settings_folder)}.json')
+    return os.path.join(settings_folder, ENDPOINT_FILE)
+
+
+def default_address(settings_folder='.'):
+    """Return (address, family) of the endpoint for the current user and settings folder.
+
+    Like the instance lock, the endpoint is per settings folder, so instances
+    started from different folders never take over each other's socket.
+    """
+    folder_hash = settings_hash(settings_folder)
+    if sys.platform == 'win32':
+        user = os.environ.get('USERNAME', 'user')
+        return rf'\\.\pipe\PowerShellScriptManager-{user}-{folder_hash}', 'AF_PIPE'
+    return os.path.join(tempfile.gettempdir(), f'psm-{os.getuid()}-{folder_hash}.sock'), 'AF_UNIX'
+
+
+def check_params(handler, params, *args):
+    """Raise INVALID_PARAMS unless handler can be called with args and params"""
+    try:
+        inspect.signature(handler).bind(*args, **params)
+    except TypeError as e:
+        raise RpcError(INVALID_PARAMS, str(e))
+
+
+def read_endpoint(endpoint_file=None):
+    """Return (address, family, authkey) of the running app, or None"""
+    endpoint_file = endpoint_file or default_endpoint_file()
+    try:
+        with open(endpoint_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data['address'], data['family'], bytes.fromhex(data['authkey'])
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+class RpcServer:
+    """Accepts connections and runs requests on a small worker pool, off the Tk thread"""
+
+    def __init__(self, settings_folder='.', max_workers=4):
+        self.settings_folder = settings_folder
+        self.endpoint_file = default_endpoint_file(settings_folder)
+        self.max_workers = max_workers
+        self.methods = {}
+        self.subscribers = {}
+        self.lock = threading.Lock()
+        self.listener = None
+        self.authkey = None
+        self.executor = None
+        self.closed = False
+
+    def register(self, name, handler):
+        """Expose handler(**params) as an RPC method; its return value must be JSON serializable"""
+        self.methods[name] = handler
+
+    def start(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from multiprocessing.connection import Listener
+
+        address, family = default_address(self.settings_folder)
+        if family == 'AF_UNIX' and os.path.exists(address):
+            # Left behind by an instance that didn't shut down cleanly; the address
+            # is per settings folder, whose instance lock in main.py rules out a live one
+            os.unlink(address)
+
+        self.authkey = secrets.token_bytes(32)
+        # No authkey here: Listener.accept() would run the handshake on the accept thread,
+        # where one client that never answers holds up everyone else (see serve_connection)
+        self.listener = Listener(address, family=family)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='rpc')
+        self.write_endpoint(address, family, self.authkey)
+        threading.Thread(target=self.accept_connections, daemon=True).start()
+
+    def write_endpoint(self, address, family, authkey):
+        # Created with owner-only permissions since it holds the key (on Windows the
+        # folder under %LOCALAPPDATA% is what keeps other users out)
+        folder = os.path.dirname(self.endpoint_file)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        with os.fdopen(os.open(self.endpoint_file, flags, 0o600), 'w', encoding='utf-8') as f:
+            json.dump({'address': address, 'family': family, 'authkey': authkey.hex(), 'pid': os.getpid()}, f)
+
+    def accept_connections(self):
+        while not self.closed:
+            try:
+                connection = self.listener.accept()
+            except OSError:
+                break
+            threading.Thread(target=self.serve_connection, args=(connection,), daemon=True).start()
+
+    def serve_connection(self, connection):
+        """Authenticate a client on its own thread, then read its requests"""
+        from multiprocessing import AuthenticationError
+        from multiprocessing.connection import answer_challenge, deliver_challenge
+
+        # The same handshake Listener(authkey=...) does in accept()
+        try:
+            deliver_challenge(connection, self.authkey)
+            answer_challenge(connection, self.authkey)
+        except (AuthenticationError, EOFError, OSError):
+            connection.close()
+            return
+        self.read_requests(connection)
+
+    def read_requests(self, connection):
+        """Read requests from one client and hand them to the worker pool"""
+        send_lock = threading.Lock()
+        try:
+            while not self.closed:
+                try:
+                    data = connection.recv_bytes()
+                except (EOFError, OSError):
+                    break
+                self.executor.submit(self.handle_request, connection, send_lock, data)
+        finally:
+            with self.lock:
+                self.subscribers.pop(connection, None)
+            connection.close()
+
+    def handle_request(self, connection, send_lock, data):
+        request_id = None
+        try:
+            try:
+                request = json.loads(data)
+            except ValueError:
+                raise RpcError(PARSE_ERROR, "Parse error")
+            if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+                raise RpcError(INVALID_REQUEST, "Invalid request")
+            request_id = request.get('id')
+            params = request.get('params') or {}
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, "Params must be an object")
+
+            if request['method'] == 'subscribe':
+                check_params(self.subscribe, params, connection, send_lock)
+                result = self.subscribe(connection, send_lock, **params)
+            else:
+                handler = self.methods.get(request['method'])
+                if handler is None:
+                    raise RpcError(METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+                # Checked up front so a TypeError raised inside the handler is reported as internal
+                check_params(handler, params)
+                result = handler(**params)
+            response = {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+        except RpcError as e:
+            response = {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': e.code, 'message': e.message}}
+        except Exception as e:
+            print(f"Error handling RPC request: {e}")
+            response = {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': INTERNAL_ERROR, 'message': str(e)}}
+
+        # Notifications (no id) get no response
+        if request_id is not None:
+            self.send(connection, send_lock, response)
+
+    def subscribe(self, connection, send_lock, events=None):
+        """Send notifications for the given events (all when omitted) on this connection"""
+        with self.lock:
+            self.subscribers[connection] = (send_lock, set(events) if events else None)
+        return True
+
+    def publish(self, event, params):
+        """Notify subscribed clients; safe to call from any thread"""
+        if not self.subscribers:
+            return
+        message = {'jsonrpc': '2.0', 'method': event, 'params': params}
+        with self.lock:
+            subscribers = list(self.subscribers.items())
+        for connection, (send_lock, events) in subscribers:
+            if events is None or event in events:
+                self.executor.submit(self.send, connection, send_lock, message)
+
+    def send(self, connection, send_lock, message):
+        try:
+            with send_lock:
+                connection.send_bytes(json.dumps(message).encode('utf-8'))
+        except (OSError, ValueError):
+            with self.lock:
+                self.subscribers.pop(connection, None)
+
+    def close(self):
+        self.closed = True
+        if self.listener:
+            try:
+                self.listener.close()
+            except OSError:
+                pass
+        if self.executor:
+            self.executor.shutdown(wait=False)
+        # Only remove the endpoint file if a newer instance hasn't replaced it
+        try:
+            with open(self.endpoint_file, 'r', encoding='utf-8') as f:
+                owner = json.load(f).get('pid')
+            if owner == os.getpid():
+                os.remove(self.endpoint_file)
+        except (OSError, ValueError):
+            pass
+
+
+class RpcClient:
+    """Minimal client for the app's RPC endpoint"""
+
+    def __init__(self, endpoint_file=None, timeout=5):
+        endpoint = read_endpoint(endpoint_file)
+        if endpoint is None:
+            raise ConnectionError("PowerShell Script Manager is not running")
+        from multiprocessing.connection import Client
+        address, family, authkey = endpoint
+        self.connection = Client(address, family=family, authkey=authkey)
+        self.timeout = timeout
+        self.ids = 0
+
+    def call(self, method, **params):
+        """Call a method and return its result; notifications received meanwhile are skipped"""
+        self.ids += 1
+        request_id = self.ids
+        self.connection.send_bytes(json.dumps(
+            {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params}).encode('utf-8'))
+        while True:
+            if self.timeout is not None and not self.connection.poll(self.timeout):
+                raise TimeoutError(f"No response to {method}")
+            response = json.loads(self.connection.recv_bytes())
+            if response.get('id') != request_id:
+                continue
+            if 'error' in response:
+                raise RpcError(response['error']['code'], response['error']['message'])
+            return response.get('result')
+
+    def notifications(self):
+        """Yield (event, params) for notifications after subscribe(); blocks"""
+        while True:
+            message = json.loads(self.connection.recv_bytes())
+            if 'method' in message and 'id' not in message:
+                yield message['method'], message.get('params')
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
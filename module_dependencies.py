@@ -0,0 +1,277 @@
+import json
+import os
+import re
+import threading
+
+from module_versions import parse_version
+
+REQUIRED_MODULES_RE = re.compile(r'\bRequiredModules\s*=\s*', re.IGNORECASE)
+BLOCK_COMMENT_RE = re.compile(r'<#.*?#>', re.DOTALL)
+STRING_RE = re.compile(r"'((?:[^']|'')*)'|\"((?:[^\"`]|`.)*)\"")
+HASHTABLE_ENTRY_RE = re.compile(r"(\w+)\s*=\s*('(?:[^']|'')*'|\"(?:[^\"`]|`.)*\"|[^;\n}]+)")
+
+
+def strip_comments(text):
+    """Remove PowerShell comments, leaving '#' inside strings alone"""
+    text = BLOCK_COMMENT_RE.sub('', text)
+    result = []
+    position = 0
+    for match in re.finditer(r"'(?:[^']|'')*'|\"(?:[^\"`]|`.)*\"|#[^\n]*", text):
+        result.append(text[position:match.start()])
+        if not match.group(0).startswith('#'):
+            result.append(match.group(0))
+        position = match.end()
+    result.append(text[position:])
+    return ''.join(result)
+
+
+def unquote(value):
+    value = value.strip()
+    match = STRING_RE.fullmatch(value)
+    if not match:
+        return value
+    if match.group(1) is not None:
+        return match.group(1).replace("''", "'")
+    return match.group(2)
+
+
+def find_value_end(text, start):
+    """Return the end of the value starting at text[start], balancing @( ), @{ } and strings"""
+    depth = 0
+    position = start
+    while position < len(text):
+        char = text[position]
+        if char in '\'"':
+            match = STRING_RE.match(text, position)
+            if match:
+                position = match.end()
+                continue
+        elif char in '({':
+            depth += 1
+        elif char in ')}':
+            depth -= 1
+            if depth == 0:
+                return position + 1
+            if depth < 0:
+                return position
+        elif char in '\n;' and depth == 0:
+            return position
+        position += 1
+    return position
+
+
+def parse_module_specification(text):
+    """Parse 'Name' or @{ModuleName=...; ModuleVersion=...} into a requirement dict"""
+    text = text.strip()
+    if text.startswith('@{'):
+        fields = {key.lower(): unquote(value) for key, value in HASHTABLE_ENTRY_RE.findall(text[2:-1])}
+        name = fields.get('modulename')
+        if not name:
+            return None
+        return {
+            'name': name,
+            'min_version': fields.get('moduleversion'),
+            'required_version': fields.get('requiredversion'),
+            'max_version': fields.get('maximumversion')
+        }
+    name = unquote(text)
+    if not name:
+        return None
+    return {'name': name, 'min_version': None, 'required_version': None, 'max_version': None}
+
+
+def split_top_level(text):
+    """Split the inside of @( ... ) on commas and newlines that aren't nested"""
+    items = []
+    depth = 0
+    current = []
+    position = 0
+    while position < len(text):
+        char = text[position]
+        if char in '\'"':
+            match = STRING_RE.match(text, position)
+            if match:
+                current.append(match.group(0))
+                position = match.end()
+                continue
+        if char in '({':
+            depth += 1
+        elif char in ')}':
+            depth -= 1
+        if char in ',\n' and depth == 0:
+            items.append(''.join(current))
+            current = []
+        else:
+            current.append(char)
+        position += 1
+    items.append(''.join(current))
+    return [item.strip() for item in items if item.strip()]
+
+
+def parse_required_modules(text):
+    """Return the RequiredModules of a module manifest (.psd1) as requirement dicts"""
+    text = strip_comments(text)
+    match = REQUIRED_MODULES_RE.search(text)
+    if not match:
+        return []
+    start = match.end()
+    value = text[start:find_value_end(text, start)].strip()
+
+    if value.startswith('@(') and value.endswith(')'):
+        entries = split_top_level(value[2:-1])
+    else:
+        entries = split_top_level(value)
+
+    requirements = []
+    for entry in entries:
+        requirement = parse_module_specification(entry)
+        if requirement:
+            requirements.append(requirement)
+    return requirements
+
+
+def satisfies(version, requirement):
+    """Check whether an installed version meets a requirement's version constraints"""
+    key = parse_version(version)
+    if requirement.get('required_version'):
+        return key == parse_version(requirement['required_version'])
+    if requirement.get('min_version') and key < parse_version(requirement['min_version']):
+        return False
+    if requirement.get('max_version'):
+        max_version = requirement['max_version']
+        # MaximumVersion may use a trailing wildcard, e.g. 2.*
+        if max_version.endswith('*'):
+            prefix = max_version.rstrip('*').rstrip('.')
+            return version == prefix or version.startswith(prefix + '.') or key < parse_version(prefix)
+        return key <= parse_version(max_version)
+    return True
+
+
+def find_manifest(name, path):
+    """Return the .psd1 manifest for a module given the path Get-Module reported"""
+    if path.lower().endswith('.psd1'):
+        return path
+    manifest = os.path.join(os.path.dirname(path), f"{name}.psd1")
+    return manifest if os.path.exists(manifest) else None
+
+
+class DependencyGraph:
+    """RequiredModules of the installed modules with reverse edges, cached by manifest mtime"""
+
+    def __init__(self, cache_file='module_dependencies.json'):
+        self.cache_file = cache_file
+        self.manifests = {}
+        self.lock = threading.Lock()
+        self.modules = {}
+        self.dependents = {}
+        self.ready = False
+        self.load()
+
+    def load(self):
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self.manifests = json.load(f).get('manifests', {})
+        except Exception as e:
+            print(f"Error loading module dependency cache: {e}")
+            self.manifests = {}
+
+    def save(self):
+        try:
+            with self.lock:
+                data = {'manifests': dict(self.manifests)}
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        except Exception as e:
+            print(f"Error saving module dependency cache: {e}")
+
+    def read_requirements(self, manifest, known):
+        """Return the manifest's entry from known, re-parsing the manifest only if it changed"""
+        try:
+            mtime = os.path.getmtime(manifest)
+        except OSError:
+            return None
+        entry = known.get(manifest)
+        if entry and entry['mtime'] == mtime:
+            return entry
+        try:
+            with open(manifest, 'r', encoding='utf-8-sig', errors='replace') as f:
+                requires = parse_required_modules(f.read())
+        except OSError as e:
+            print(f"Error reading manifest {manifest}: {e}")
+            requires = []
+        return {'mtime': mtime, 'requires': requires}
+
+    def build(self, modules, token=None):
+        """Build the graph from [(name, version, path)] of the installed modules. Returns whether any manifest was re-read.
+
+        Builds started with a TaskToken are dropped once it is cancelled, so an
+        older build can never replace the graph of a newer one.
+        """
+        with self.lock:
+            before = self.manifests
+        graph = {}
+        dependents = {}
+        manifests = {}
+        for name, version, path in modules:
+            if token and token.cancelled:
+                return False
+            manifest = find_manifest(name, path)
+            entry = self.read_requirements(manifest, before) if manifest else None
+            if entry:
+                manifests[manifest] = entry
+            requires = entry['requires'] if entry else []
+            graph.setdefault(name.lower(), {})[version] = {'name': name, 'path': path, 'requires': requires}
+            for requirement in requires:
+                dependents.setdefault(requirement['name'].lower(), set()).add((name.lower(), version))
+
+        with self.lock:
+            if token and token.cancelled:
+                return False
+            # Manifests of modules that are no longer installed are left out
+            self.manifests = manifests
+            self.modules = graph
+            self.dependents = dependents
+            self.ready = True
+            changed = manifests != before
+        if changed:
+            self.save()
+        return changed
+
+    def display_name(self, key):
+        versions = self.modules.get(key)
+        return next(iter(versions.values()))['name'] if versions else key
+
+    def requires(self, name, version):
+        """Return the requirements of one installed module version"""
+        entry = self.modules.get(name.lower(), {}).get(version)
+        return entry['requires'] if entry else []
+
+    def required_by(self, name):
+        """Return [(name, version)] of installed modules that list this module in RequiredModules"""
+        return sorted((self.display_name(key), version)
+                      for key, version in self.dependents.get(name.lower(), ()))
+
+    def breaks_if_uninstalled(self, name, version):
+        """Return [(name, version)] of installed modules left with an unmet requirement, transitively"""
+        with self.lock:
+            modules = self.modules
+            dependents = self.dependents
+        removed = {(name.lower(), version)}
+        pending = [(name.lower(), version)]
+        broken = []
+        while pending:
+            key, _ = pending.pop()
+            remaining = [v for v in modules.get(key, {}) if (key, v) not in removed]
+            for dependent in sorted(dependents.get(key, ())):
+                if dependent in removed:
+                    continue
+                dependent_key, dependent_version = dependent
+                requirements = [r for r in modules[dependent_key][dependent_version]['requires']
+                                if r['name'].lower() == key]
+                if all(any(satisfies(v, r) for v in remaining) for r in requirements):
+                    continue
+                removed.add(dependent)
+                pending.append(dependent)
+                broken.append((self.display_name(dependent_key), dependent_version))
+        return broken
@@ -0,0 +1,214 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+from collections import deque
+
+from background_tasks import TaskCancelled, TaskToken
+from execution import powershell_command
+from instrumentation import timed
+from ps_runner import run_powershell
+
+# The worker thread exits after this many idle seconds and is restarted on demand
+WORKER_IDLE_TIMEOUT = 5
+
+
+def make_key(name, version, path):
+    return f"{name}|{version}|{path}"
+
+
+@timed('powershell.module_details')
+def fetch_module_details(command, name, path, low_priority=False, token=None):
+    """Query PowerShell for a module's manifest details and exported commands.
+
+    Returns (module_info, commands_info), or None if the module could not be read.
+    Cancelling `token` (a background_tasks.TaskToken) kills PowerShell and returns None.
+    """
+    kwargs = {}
+    if sys.platform == 'win32':
+        kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+        if low_priority:
+            kwargs['creationflags'] |= subprocess.BELOW_NORMAL_PRIORITY_CLASS
+    quoted_name = name.replace("'", "''")
+
+    try:
+        result = run_powershell(
+            ['-NoProfile', '-Command', f"Get-Module -Name '{quoted_name}' -ListAvailable | Select-Object Name, Version, Description, Path, Author, CompanyName, Copyright, PowerShellVersion, CompatiblePSEditions, PrivateData | ConvertTo-Json"],
+            command=command,
+            timeout=10,
+            token=token,
+            **kwargs
+        )
+        module_info = json.loads(result.stdout)
+    except TaskCancelled:
+        return None
+    except Exception as e:
+        print(f"Error fetching details for module {name}: {e}")
+        return None
+
+    # Several versions may be installed; prefer the one at the row's path
+    if isinstance(module_info, list):
+        if not module_info:
+            return None
+        matches = [info for info in module_info if info.get('Path') == path]
+        module_info = (matches or module_info)[0]
+
+    # Get exported commands (functions, cmdlets, aliases)
+    try:
+        commands_result = run_powershell(
+            ['-NoProfile', '-Command', f"Get-Command -Module '{quoted_name}' | Select-Object Name, CommandType, Version | ConvertTo-Json"],
+            command=command,
+            timeout=10,
+            token=token,
+            **kwargs
+        )
+        commands_info = json.loads(commands_result.stdout)
+        if not isinstance(commands_info, list):
+            commands_info = [commands_info]
+    except TaskCancelled:
+        return None
+    except Exception:
+        commands_info = []
+
+    return module_info, commands_info
+
+
+class ModuleDetailsCache:
+    """Persistent cache of module details keyed by name, version and path, filled by a background worker.
+
+    One worker fetches details a module at a time: modules whose details window
+    is open first, then prefetches. Prefetches are replaced wholesale when the
+    selection moves, and the one being fetched is killed if it is no longer wanted.
+    """
+
+    def __init__(self, cache_file='module_details.json', command=None):
+        self.cache_file = cache_file
+        self.command = command or powershell_command()
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.wakeup = threading.Condition(self.lock)
+        self.requests = deque()
+        self.prefetches = deque()
+        self.callbacks = {}
+        # (key, TaskToken) of the prefetch being fetched
+        self.current_prefetch = None
+        self.worker = None
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('modules', {})
+        except Exception as e:
+            print(f"Error loading module details cache: {e}")
+            self.entries = {}
+
+    def save(self):
+        try:
+            with self.lock:
+                data = {'modules': dict(self.entries)}
+                self.dirty = False
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        except Exception as e:
+            print(f"Error saving module details cache: {e}")
+
+    def get(self, name, version, path):
+        """Return the cached (module_info, commands_info), or None"""
+        entry = self.entries.get(make_key(name, version, path))
+        return (entry['module'], entry['commands']) if entry else None
+
+    def prune(self, modules):
+        """Drop entries for modules that are no longer installed; modules is [(name, version, path)]"""
+        keep = {make_key(*module) for module in modules}
+        with self.lock:
+            stale = [key for key in self.entries if key not in keep]
+            for key in stale:
+                del self.entries[key]
+            if stale:
+                self.dirty = True
+
+    def prefetch(self, modules):
+        """Fetch details of [(name, version, path)] in the background, replacing earlier prefetches"""
+        keys = {make_key(*module) for module in modules}
+        with self.lock:
+            self.prefetches = deque(module for module in modules if make_key(*module) not in self.entries)
+            # Stop fetching a row the selection has moved away from, unless a window waits for it
+            cancel = None
+            if self.current_prefetch:
+                key, token = self.current_prefetch
+                if key not in keys and key not in self.callbacks:
+                    cancel = token
+            self.start_worker()
+        if cancel:
+            cancel.cancel()
+
+    def request(self, name, version, path, callback=None):
+        """Fetch a module's details in the background unless cached, ahead of any prefetches.
+
+        callback(details) is called with (module_info, commands_info), or None on
+        failure; from the calling thread on a cache hit, else from the worker.
+        """
+        details = self.get(name, version, path)
+        if details is not None:
+            if callback:
+                callback(details)
+            return
+
+        key = make_key(name, version, path)
+        with self.lock:
+            if callback:
+                self.callbacks.setdefault(key, []).append(callback)
+            self.requests.append((name, version, path))
+            self.start_worker()
+
+    def start_worker(self):
+        # Called with the lock held
+        if self.worker is None:
+            self.worker = threading.Thread(target=self.process_requests, daemon=True)
+            self.worker.start()
+        self.wakeup.notify()
+
+    def next_request(self):
+        """Wait for the next (name, version, path, token) to fetch; None once idle for a while"""
+        with self.lock:
+            while not self.requests and not self.prefetches:
+                if not self.wakeup.wait(WORKER_IDLE_TIMEOUT) and not self.requests and not self.prefetches:
+                    self.worker = None
+                    return None
+            if self.requests:
+                return self.requests.popleft() + (None,)
+            name, version, path = self.prefetches.popleft()
+            token = TaskToken(0)
+            self.current_prefetch = (make_key(name, version, path), token)
+            return name, version, path, token
+
+    def process_requests(self):
+        while True:
+            request = self.next_request()
+            if request is None:
+                if self.dirty:
+                    self.save()
+                return
+
+            name, version, path, token = request
+            key = make_key(name, version, path)
+            details = self.get(name, version, path)
+            if details is None:
+                details = fetch_module_details(self.command, name, path,
+                                               low_priority=token is not None, token=token)
+
+            with self.lock:
+                self.current_prefetch = None
+                if token and token.cancelled:
+                    # Superseded; a window that asked for it since has its own request queued
+                    continue
+                if details is not None:
+                    self.entries[key] = {'module': details[0], 'commands': details[1]}
+                    self.dirty = True
+                callbacks = self.callbacks.pop(key, [])
+            for callback in callbacks:
+                callback(details)
@@ -0,0 +1,211 @@
+import itertools
+import json
+import queue
+import subprocess
+import sys
+import threading
+import time
+
+from execution import QUEUED, RUNNING, COMPLETED, FAILED, CANCELLED, powershell_command
+from instrumentation import timed
+from background_tasks import kill_process, new_session_kwargs
+from ps_runner import run_powershell, start_record
+
+UPDATE = 'update'
+UNINSTALL = 'uninstall'
+
+MODULE_COMMANDS = {
+    UPDATE: "Update-Module -Name '{name}' -Force -ErrorAction Stop",
+    UNINSTALL: "Uninstall-Module -Name '{name}' -RequiredVersion '{version}' -Force -ErrorAction Stop",
+}
+
+
+@timed('powershell.list_modules')
+def list_modules(command=None, name=None, timeout=30, token=None):
+    """Return the installed modules (optionally only those named `name`) as dicts from ConvertTo-Json.
+
+    Cancelling `token` (a background_tasks.TaskToken) kills PowerShell and raises TaskCancelled.
+    """
+    name_filter = " -Name '{}'".format(name.replace("'", "''")) if name else ''
+    result = run_powershell(
+        ['-Command', f"Get-Module{name_filter} -ListAvailable | Select-Object Name, Version, Description, Path, RepositorySourceLocation | ConvertTo-Json -Depth 1"],
+        command=command,
+        timeout=timeout,
+        token=token
+    )
+    try:
+        modules = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        return []
+    # Ensure modules is a list even if only one module is returned
+    return modules if isinstance(modules, list) else [modules]
+
+
+class ModuleJob:
+    """One update or uninstall of a module"""
+
+    def __init__(self, job_id, operation, name, version):
+        self.id = job_id
+        self.operation = operation
+        self.name = name
+        self.version = version
+        self.status = QUEUED
+        self.exit_code = None
+        self.error = None
+        self.start_time = None
+        self.end_time = None
+        self.modules = None
+        self.cancel_event = threading.Event()
+
+    @property
+    def duration(self):
+        if self.start_time is None:
+            return None
+        return (self.end_time or time.time()) - self.start_time
+
+    @property
+    def finished(self):
+        return self.status in (COMPLETED, FAILED, CANCELLED)
+
+
+class ModuleJobQueue:
+    """Runs module updates and uninstalls on a bounded number of worker threads.
+
+    on_update(job) is called from worker threads whenever a job changes. When a
+    job finishes, job.modules holds the installed versions of that module as
+    listed afterwards, so the caller can patch just those rows.
+    """
+
+    def __init__(self, max_workers=2, command=None, on_update=None):
+        self.max_workers = max(1, int(max_workers))
+        self.command = command or powershell_command()
+        self.on_update = on_update
+        self.jobs = []
+        self.pending = queue.Queue()
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+        self.workers = 0
+
+    def submit(self, operation, modules):
+        """Queue an operation for [(name, version)] and return the new jobs"""
+        with self.lock:
+            jobs = [ModuleJob(next(self.ids), operation, name, version) for name, version in modules]
+            self.jobs.extend(jobs)
+        for job in jobs:
+            self.notify(job)
+
+        with self.lock:
+            for job in jobs:
+                self.pending.put(job)
+            while self.workers < min(self.max_workers, self.pending.qsize()):
+                self.workers += 1
+                threading.Thread(target=self.process_jobs, daemon=True).start()
+        return jobs
+
+    def cancel(self, job):
+        """Cancel a queued job, or stop a running one"""
+        job.cancel_event.set()
+        if job.status == QUEUED:
+            self.set_status(job, CANCELLED)
+
+    def cancel_all(self):
+        for job in list(self.jobs):
+            if not job.finished:
+                self.cancel(job)
+
+    def clear_finished(self):
+        with self.lock:
+            self.jobs = [job for job in self.jobs if not job.finished]
+
+    def process_jobs(self):
+        while True:
+            try:
+                job = self.pending.get_nowait()
+            except queue.Empty:
+                with self.lock:
+                    if self.pending.empty():
+                        self.workers -= 1
+                        return
+                continue
+            if job.cancel_event.is_set():
+                continue
+            self.run_job(job)
+
+    def run_job(self, job):
+        job.start_time = time.time()
+        self.set_status(job, RUNNING)
+        command = MODULE_COMMANDS[job.operation].format(
+            name=job.name.replace("'", "''"), version=str(job.version).replace("'", "''"))
+        try:
+            job.exit_code = self.run_command(job, f"try {{ {command} }} catch {{ Write-Error $_; exit 1 }}")
+        except Exception as e:
+            job.error = str(e)
+
+        if job.cancel_event.is_set():
+            status = CANCELLED
+        elif job.error is None and job.exit_code == 0:
+            status = COMPLETED
+        else:
+            status = FAILED
+
+        # List the module again so only its rows need to be refreshed
+        try:
+            job.modules = list_modules(self.command, job.name)
+        except Exception as e:
+            print(f"Error listing module {job.name}: {e}")
+        job.end_time = time.time()
+        self.set_status(job, status)
+
+    def run_command(self, job, command):
+        """Run a PowerShell command elevated on Windows, directly elsewhere. Returns the exit code."""
+        try:
+            import ctypes
+            elevated = hasattr(ctypes, 'windll')
+        except ImportError:
+            elevated = False
+
+        if elevated:
+            from execution import shell_execute_elevated, wait_for_process_handle
+            record = start_record([self.command[0], '-NoProfile', '-Command', command], elevated=True)
+            handle = shell_execute_elevated(self.command[0], f'-NoProfile -Command "{command}"', None)
+            record.spawned()
+            exit_code = wait_for_process_handle(handle, job.cancel_event)
+            record.finish(exit_code)
+            return exit_code
+
+        kwargs = {}
+        if sys.platform == 'win32':
+            kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+        record = start_record(self.command + ['-NoProfile', '-Command', command])
+        process = subprocess.Popen(
+            self.command + ['-NoProfile', '-Command', command],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            **new_session_kwargs(),
+            **kwargs
+        )
+        record.spawned()
+        while True:
+            try:
+                _, stderr = process.communicate(timeout=0.25)
+                break
+            except subprocess.TimeoutExpired:
+                if job.cancel_event.is_set():
+                    kill_process(process)
+        if process.returncode and stderr.strip():
+            job.error = stderr.strip().splitlines()[-1]
+        record.finish(process.returncode)
+        return process.returncode
+
+    def set_status(self, job, status):
+        job.status = status
+        self.notify(job)
+
+    def notify(self, job):
+        if self.on_update:
+            try:
+                self.on_update(job)
+            except Exception as e:
+                print(f"Error in module job callback: {e}")
@@ -0,0 +1,209 @@
+import json
+import os
+import threading
+import time
+
+from module_versions import parse_version, is_prerelease
+
+PSGALLERY_FEED = 'https://www.powershellgallery.com/api/v2'
+
+# Feed responses are reused without asking the server for this long
+RESPONSE_TTL = 60 * 60
+
+# Expired responses are kept this long to revalidate with their ETag, then dropped
+RESPONSE_RETENTION = 7 * 24 * 60 * 60
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+DATA_NS = '{http://schemas.microsoft.com/ado/2007/08/dataservices}'
+METADATA_NS = '{http://schemas.microsoft.com/ado/2007/08/dataservices/metadata}'
+
+
+def latest_of(versions, include_prerelease=False):
+    """Return the highest version in a list, or None"""
+    if not include_prerelease:
+        versions = [version for version in versions if not is_prerelease(version)]
+    return max(versions, key=parse_version) if versions else None
+
+
+class ResponseCache:
+    """Persistent HTTP response cache that honours a TTL and revalidates with ETags"""
+
+    def __init__(self, cache_file='update_cache.json', ttl=RESPONSE_TTL, retention=RESPONSE_RETENTION):
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.retention = retention
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('responses', {})
+        except Exception as e:
+            print(f"Error loading update cache: {e}")
+            self.entries = {}
+
+    def prune(self):
+        """Drop responses that can't be reused: expired without an ETag, or not fetched for too long"""
+        now = time.time()
+        with self.lock:
+            for url, entry in list(self.entries.items()):
+                age = now - entry['fetched']
+                if age >= self.retention or (age >= self.ttl and not entry.get('etag')):
+                    del self.entries[url]
+
+    def save(self):
+        self.prune()
+        try:
+            with self.lock:
+                data = {'responses': dict(self.entries)}
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        except Exception as e:
+            print(f"Error saving update cache: {e}")
+
+    def fetch(self, url, timeout=15):
+        """Return the body of a GET request, from the cache while it is fresh"""
+        import urllib.error
+        import urllib.request
+
+        with self.lock:
+            entry = self.entries.get(url)
+        if entry and time.time() - entry['fetched'] < self.ttl:
+            return entry['body']
+
+        request = urllib.request.Request(url, headers={'Accept': 'application/atom+xml'})
+        if entry and entry.get('etag'):
+            request.add_header('If-None-Match', entry['etag'])
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                body = response.read().decode('utf-8', errors='replace')
+                etag = response.headers.get('ETag')
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or not entry:
+                raise
+            # Not modified: keep the cached body for another TTL
+            body = entry['body']
+            etag = entry.get('etag')
+
+        with self.lock:
+            self.entries[url] = {'etag': etag, 'fetched': time.time(), 'body': body}
+        return body
+
+
+class NuGetFeed:
+    """A NuGet v2 (OData) feed such as the PowerShell Gallery"""
+
+    def __init__(self, url=PSGALLERY_FEED, cache=None):
+        self.url = url.rstrip('/')
+        self.cache = cache or ResponseCache()
+
+    def latest_version(self, name):
+        import urllib.parse
+        import xml.etree.ElementTree as ElementTree
+
+        versions = []
+        url = f"{self.url}/FindPackagesById()?id='{urllib.parse.quote(name)}'"
+        # Results are paged; follow the "next" links
+        while url:
+            root = ElementTree.fromstring(self.cache.fetch(url))
+            for entry in root.iter(f'{ATOM_NS}entry'):
+                properties = entry.find(f'{METADATA_NS}properties')
+                version = properties.find(f'{DATA_NS}Version') if properties is not None else None
+                if version is not None and version.text:
+                    versions.append(version.text)
+            next_link = root.find(f"{ATOM_NS}link[@rel='next']")
+            url = next_link.get('href') if next_link is not None else None
+        return latest_of(versions)
+
+    def close(self):
+        self.cache.save()
+
+
+class LocalFolderFeed:
+    """A folder of .nupkg files, e.g. a local NuGet feed or file share used as a repository"""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.packages = None
+        self.lock = threading.Lock()
+
+    def index(self):
+        """Map lower-cased package ids to their versions, read from the .nuspec in each package"""
+        import zipfile
+        import xml.etree.ElementTree as ElementTree
+
+        packages = {}
+        for root, _, files in os.walk(self.folder):
+            for file in files:
+                if not file.lower().endswith('.nupkg'):
+                    continue
+                try:
+                    with zipfile.ZipFile(os.path.join(root, file)) as package:
+                        nuspec = next(n for n in package.namelist() if n.endswith('.nuspec') and '/' not in n)
+                        metadata = ElementTree.fromstring(package.read(nuspec))
+                except Exception as e:
+                    print(f"Error reading package {file}: {e}")
+                    continue
+                # The nuspec namespace differs between NuGet versions, so match on local names
+                values = {element.tag.rsplit('}', 1)[-1]: element.text for element in metadata.iter()}
+                if values.get('id') and values.get('version'):
+                    packages.setdefault(values['id'].lower(), []).append(values['version'])
+        return packages
+
+    def latest_version(self, name):
+        with self.lock:
+            if self.packages is None:
+                self.packages = self.index()
+        return latest_of(self.packages.get(name.lower(), []))
+
+    def close(self):
+        pass
+
+
+def make_feed(source):
+    """Return a feed for a repository source: a local folder of packages or a NuGet v2 URL"""
+    if source and os.path.isdir(source):
+        return LocalFolderFeed(source)
+    return NuGetFeed(source or PSGALLERY_FEED)
+
+
+def check_updates(modules, feed, max_workers=8, on_result=None, cancelled=None):
+    """Look up the latest version of each module on the feed concurrently.
+
+    modules is a list of (name, installed_version). on_result(name, latest,
+    outdated) is called from worker threads as each lookup finishes; lookups
+    that fail report latest as None. Returns {name: latest}.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    # Several versions of a module may be installed side by side; compare the highest
+    installed = {}
+    for name, version in modules:
+        if name not in installed or parse_version(version) > parse_version(installed[name]):
+            installed[name] = version
+
+    def lookup(name):
+        if cancelled and cancelled.is_set():
+            return None
+        try:
+            return feed.latest_version(name)
+        except Exception as e:
+            print(f"Error checking updates for {name}: {e}")
+            return None
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(lookup, name): name for name in installed}
+        for future in as_completed(futures):
+            name = futures[future]
+            latest = future.result()
+            results[name] = latest
+            outdated = latest is not None and parse_version(latest) > parse_version(installed[name])
+            if on_result:
+                on_result(name, latest, outdated)
+
+    feed.close()
+    return results
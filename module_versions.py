@@ -0,0 +1,45 @@
+def format_version(value):
+    """Turn a module version from ConvertTo-Json (string or System.Version object) into text"""
+    if isinstance(value, dict):
+        parts = [value.get(part, -1) for part in ('Major', 'Minor', 'Build', 'Revision')]
+        return '.'.join(str(part) for part in parts if isinstance(part, int) and part >= 0)
+    if value is None:
+        return 'N/A'
+    return str(value)
+
+
+def parse_version(text):
+    """Return a sort key for a version string.
+
+    Handles 4-part .NET versions (1.2.3.4) and SemVer prereleases
+    (1.2.3-beta.2 < 1.2.3-rc.1 < 1.2.3); build metadata after '+' is ignored.
+    Text that isn't a version sorts before every version.
+    """
+    text = str(text).strip().lstrip('vV')
+    text = text.split('+', 1)[0]
+    release, _, prerelease = text.partition('-')
+
+    numbers = []
+    for part in release.split('.'):
+        if not part.isdigit():
+            return ((), 0, ())
+        numbers.append(int(part))
+    while len(numbers) < 4:
+        numbers.append(0)
+
+    if not prerelease:
+        return (tuple(numbers), 1, ())
+
+    # SemVer: numeric identifiers sort numerically and before alphanumeric ones
+    identifiers = []
+    for identifier in prerelease.split('.'):
+        if identifier.isdigit():
+            identifiers.append((0, int(identifier), ''))
+        else:
+            identifiers.append((1, 0, identifier.lower()))
+    return (tuple(numbers), 0, tuple(identifiers))
+
+
+def is_prerelease(text):
+    numbers, release, _ = parse_version(text)
+    return bool(numbers) and not release
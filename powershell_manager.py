@@ -0,0 +1,3037 @@
+import time
+# Replaced by main.py with the time the process started
+STARTUP_START = time.perf_counter()
+
+# Only what the first window needs is imported here. winotify, PIL, pystray,
+# webbrowser, ctypes and json are imported on first use; see
+# import_budget.py for the enforced budget.
+import tkinter as tk
+from tkinter import ttk, messagebox
+from app_data import AppData
+from script_index import ScriptIndex
+from ui_snapshot import UISnapshot
+from script_record import ScriptRecord
+from execution import ExecutionManager, BatchRun, RUNNING, FAILED
+from run_history import RunHistory
+from module_details import ModuleDetailsCache
+from module_versions import format_version, parse_version
+from module_jobs import ModuleJobQueue, list_modules, UPDATE, UNINSTALL
+from module_dependencies import DependencyGraph
+from instrumentation import timed, span
+from ps_runner import run_powershell, start_record
+from probes import ProbeFailed, ProbeRunner, PROBE_TIMEOUT
+from ui_dispatcher import UIDispatcher
+from background_tasks import TaskGenerations, TaskCancelled
+import os
+import subprocess
+import sys
+import threading
+
+def shell_execute_runas(executable, params, directory=None):
+    """Run a program elevated via ShellExecute. Returns False without the Windows API."""
+    import ctypes
+    if not hasattr(ctypes, 'windll'):
+        return False
+    # Only the launch is timed; the elevated console outlives the call
+    record = start_record([executable, params], elevated=True)
+    ctypes.windll.shell32.ShellExecuteW(None, "runas", executable, params, directory, 1)
+    record.spawned()
+    record.finish(None)
+    return True
+
+class PowerShellManager:
+    def __init__(self, root, request=None):
+        self.root = root
+        
+        # A script to open or run from the command line, applied once the scripts are known
+        self.startup_request = request
+        self.root.title("PowerShell Script Manager")
+        
+        # Worker threads hand their UI updates to the Tk thread through this queue
+        self.dispatcher = UIDispatcher(root)
+        self.dispatcher.start()
+        self.app_data = AppData()
+        self.script_index = ScriptIndex()
+        self.ui_snapshot = UISnapshot()
+        
+        # Map script paths to their rows in scripts_tree for metadata updates
+        self.script_items = {}
+        # And (tree, row) back to script paths, since names repeat across folders
+        self.item_paths = {}
+        
+        # Repeated loads supersede each other; only the latest result is applied
+        self.module_loads = TaskGenerations()
+        self.script_scans = TaskGenerations()
+        self.metadata_refreshes = TaskGenerations()
+        self.dependency_builds = TaskGenerations()
+        
+        # The scripts currently shown, read by RPC worker threads
+        self.script_records = []
+        self.rpc_server = None
+        self.stall_watchdog = None
+        
+        # Track every script launched from the app and record it in the run history
+        self.run_history = RunHistory()
+        self.execution_manager = ExecutionManager(
+            max_concurrent=self.app_data.max_concurrent_runs,
+            on_output=self.on_run_output,
+            on_status=self.on_run_status,
+            history=self.run_history
+        )
+        if self.app_data.fast_run:
+            self.execution_manager.enable_fast_run(self.app_data.fast_run_hosts, self.app_data.preload_modules,
+                                                   on_failure=self.on_warm_host_failed)
+        self.run_items = {}
+        self.shown_run = None
+        self.shown_output_count = 0
+        
+        # Configure root window
+        self.root.geometry("800x600")
+        
+        # Button icons, loaded on first use by get_icon
+        self.icons = {}
+        
+        # Handle window close button
+        self.root.protocol('WM_DELETE_WINDOW', self.hide_window)
+        
+        # Store PowerShell update statuses
+        self.powershell_status = {}
+        
+        # Results of the last PowerShell probe, filled in on a worker thread
+        self.powershell_details = None
+        self.powershell_probes = TaskGenerations()
+        
+        # Version, edition and policy probes, with deadlines and cached fallbacks
+        self.probes = ProbeRunner()
+        
+        # Create notebook for tabs
+        self.notebook = ttk.Notebook(root)
+        self.notebook.pack(expand=True, fill='both', padx=5, pady=5)
+        
+        # Create tabs
+        self.home_tab = ttk.Frame(self.notebook)
+        self.runs_tab = ttk.Frame(self.notebook)
+        self.powershell_tab = ttk.Frame(self.notebook)
+        self.modules_tab = ttk.Frame(self.notebook)
+        self.folders_tab = ttk.Frame(self.notebook)
+        
+        self.notebook.add(self.home_tab, text='Scripts')
+        self.notebook.add(self.runs_tab, text='Runs')
+        self.notebook.add(self.powershell_tab, text='PowerShell')
+        self.notebook.add(self.modules_tab, text='Modules')
+        self.notebook.add(self.folders_tab, text='Settings')
+        
+        # Only the Scripts tab is built now, the others on first activation
+        self.pending_tabs = {
+            str(self.runs_tab): self.setup_runs_tab,
+            str(self.powershell_tab): self.setup_powershell_tab,
+            str(self.modules_tab): self.setup_modules_tab,
+            str(self.folders_tab): self.setup_folders_tab
+        }
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+        self.setup_home_tab()
+        
+        # Hidden Diagnostics tab with hot-path timings, toggled with Ctrl+Shift+D
+        self.diagnostics_tab = None
+        self.diagnostics_items = {}
+        self.diagnostics_refresh_id = None
+        self.root.bind('<Control-Shift-D>', self.toggle_diagnostics_tab)
+        
+        # Paint the scripts from the last session right away; the folders are
+        # rescanned in the background once the window is up
+        if not self.load_ui_snapshot():
+            self.load_cached_script_list()
+        self.root.after(100, self.start_background_rescan)
+        
+        # Defer everything else until the window is interactive
+        self.root.after(200, self.setup_system_tray)
+        self.root.after(300, self.start_rpc_server)
+        self.root.after(400, self.start_stall_watchdog)
+        self.root.after(1000, self.start_update_check)
+        self.root.after_idle(self.report_startup_time)
+    
+    def start_stall_watchdog(self):
+        """Log freezes of the main loop with the stack that caused them (see stall_watchdog.py)"""
+        from stall_watchdog import StallWatchdog
+        self.stall_watchdog = StallWatchdog(self.root)
+        try:
+            self.stall_watchdog.start()
+        except Exception as e:
+            print(f"Error starting stall watchdog: {e}")
+            self.stall_watchdog = None
+    
+    def start_rpc_server(self):
+        """Expose the script list and runs to other local tools (see local_rpc.py)"""
+        from local_rpc import RpcServer
+        server = RpcServer()
+        server.register('list', self.rpc_list)
+        server.register('search', self.rpc_search)
+        server.register('get_preview', self.rpc_get_preview)
+        server.register('run', self.rpc_run)
+        server.register('get_run', self.rpc_get_run)
+        server.register('activate', self.rpc_activate)
+        try:
+            server.start()
+        except Exception as e:
+            print(f"Error starting RPC server: {e}")
+            return
+        self.rpc_server = server
+    
+    def describe_script(self, script):
+        """Return the JSON form of a script for RPC clients"""
+        metadata = self.script_index.get(script.full_path) or {}
+        return {
+            'name': script.name,
+            'path': script.full_path,
+            'folder': script.folder,
+            'favorite': script.is_favorite,
+            'synopsis': metadata.get('synopsis', ''),
+            'parameters': [param['name'] for param in metadata.get('params', [])]
+        }
+    
+    def describe_run(self, run):
+        return {
+            'run_id': run.id,
+            'script': run.script_path,
+            'status': run.status,
+            'exit_code': run.exit_code,
+            'duration': run.duration,
+            'error': run.error
+        }
+    
+    def find_script_record(self, script):
+        """Find a shown script by full path or file name"""
+        for record in self.script_records:
+            if script in (record.full_path, record.name):
+                return record
+        return None
+    
+    def rpc_list(self, favorites=False):
+        return [self.describe_script(script) for script in self.script_records
+                if not favorites or script.is_favorite]
+    
+    def rpc_search(self, query):
+        query = query.lower()
+        results = []
+        for script in self.script_records:
+            description = self.describe_script(script)
+            if (query in script.name.lower() or query in script.full_path.lower()
+                    or query in description['synopsis'].lower()):
+                results.append(description)
+        return results
+    
+    def rpc_get_preview(self, script, max_chars=65536):
+        from local_rpc import RpcError, INVALID_PARAMS
+        record = self.find_script_record(script)
+        if record is None:
+            raise RpcError(INVALID_PARAMS, f"Unknown script: {script}")
+        with open(record.full_path, 'r', encoding='utf-8', errors='replace') as f:
+            content = f.read(max_chars + 1)
+        return {'path': record.full_path, 'content': content[:max_chars], 'truncated': len(content) > max_chars}
+    
+    def rpc_run(self, script):
+        from local_rpc import RpcError, INVALID_PARAMS
+        record = self.find_script_record(script)
+        if record is None:
+            raise RpcError(INVALID_PARAMS, f"Unknown script: {script}")
+        return self.describe_run(self.execution_manager.submit(record.full_path))
+    
+    def rpc_get_run(self, run_id, output=False):
+        from local_rpc import RpcError, INVALID_PARAMS
+        run = next((run for run in self.execution_manager.runs if run.id == run_id), None)
+        if run is None:
+            raise RpcError(INVALID_PARAMS, f"Unknown run: {run_id}")
+        result = self.describe_run(run)
+        if output:
+            result['output'] = [{'stream': stream, 'line': line} for stream, line in list(run.output)]
+        return result
+    
+    def rpc_activate(self, script=None, run=False):
+        """Handle a later launch of the app: show the window and open or run a script"""
+        from local_rpc import RpcError, INVALID_PARAMS
+        if script and self.find_script_record(script) is None and not os.path.isfile(script):
+            raise RpcError(INVALID_PARAMS, f"Unknown script: {script}")
+        self.dispatcher.post(lambda: self.activate(script, run))
+        return True
+    
+    def activate(self, script=None, run=False):
+        """Bring the window to the front and select (and optionally run) a script"""
+        self.show_window()
+        self.root.lift()
+        self.root.focus_force()
+        if not script:
+            return
+        
+        record = self.find_script_record(script) or self.find_script_record(os.path.abspath(script))
+        if record is None:
+            messagebox.showinfo("Open Script", f"Script not found in the script folders: {script}")
+            return
+        self.notebook.select(self.home_tab)
+        self.favorites_tree.selection_remove(*self.favorites_tree.selection())
+        self.restore_script_selection(record.full_path)
+        if run:
+            self.run_script(record.full_path)
+    
+    def show_notification(self, title, msg):
+        """Show a Windows toast notification"""
+        try:
+            from winotify import Notification, audio
+        except ImportError:
+            return
+        toast = Notification(
+            app_id="PowerShell Script Manager",
+            title=title,
+            msg=msg,
+            duration="short"
+        )
+        toast.set_audio(audio.Default, loop=False)
+        toast.show()
+    
+    def on_tab_changed(self, event=None):
+        """Build a tab the first time it is activated"""
+        self.ensure_tab(self.notebook.select())
+    
+    def ensure_tab(self, tab):
+        """Build a lazily constructed tab if that hasn't happened yet"""
+        setup = self.pending_tabs.pop(str(tab), None)
+        if setup:
+            setup()
+    
+    def report_startup_time(self):
+        """Record how long it took from launch until the window was interactive"""
+        self.startup_ms = (time.perf_counter() - STARTUP_START) * 1000
+        print(f"Startup: window interactive after {self.startup_ms:.0f} ms")
+        if hasattr(self, 'startup_time_var'):
+            self.startup_time_var.set(f"Startup time: {self.startup_ms:.0f} ms")
+        
+    def toggle_diagnostics_tab(self, event=None):
+        """Show or hide the Diagnostics tab"""
+        if self.diagnostics_tab is None:
+            self.diagnostics_tab = ttk.Frame(self.notebook)
+            self.setup_diagnostics_tab()
+            self.notebook.add(self.diagnostics_tab, text='Diagnostics')
+        elif self.notebook.tab(self.diagnostics_tab, 'state') == 'hidden':
+            self.notebook.add(self.diagnostics_tab)
+        else:
+            self.notebook.hide(self.diagnostics_tab)
+            return
+        self.notebook.select(self.diagnostics_tab)
+        self.refresh_diagnostics()
+    
+    def setup_diagnostics_tab(self):
+        import instrumentation
+        import ps_runner
+        
+        controls = ttk.Frame(self.diagnostics_tab)
+        controls.pack(fill='x', padx=5, pady=5)
+        
+        self.diagnostics_enabled_var = tk.BooleanVar(value=instrumentation.is_enabled())
+        ttk.Checkbutton(controls, text="Record timings", variable=self.diagnostics_enabled_var,
+                        command=lambda: instrumentation.set_enabled(self.diagnostics_enabled_var.get())).pack(side='left')
+        
+        def reset():
+            instrumentation.reset()
+            ps_runner.telemetry.reset()
+            self.refresh_diagnostics()
+        
+        def export():
+            from tkinter import filedialog
+            path = filedialog.asksaveasfilename(title="Export Diagnostics", defaultextension='.json',
+                                                initialfile='diagnostics.json',
+                                                filetypes=[('JSON files', '*.json')])
+            if not path:
+                return
+            try:
+                instrumentation.export_json(path, {'powershell_processes': ps_runner.telemetry.report()})
+            except Exception as e:
+                messagebox.showerror("Error", f"Could not export diagnostics: {e}")
+        
+        ttk.Button(controls, text="Export JSON...", command=export).pack(side='right')
+        ttk.Button(controls, text="Reset", command=reset).pack(side='right', padx=5)
+        
+        columns = ('count', 'total', 'mean', 'p50', 'p95', 'max')
+        self.diagnostics_tree = ttk.Treeview(self.diagnostics_tab, columns=columns)
+        self.diagnostics_tree.heading('#0', text='Operation')
+        self.diagnostics_tree.column('#0', width=200)
+        for column, heading in zip(columns, ('Count', 'Total (ms)', 'Mean (ms)', 'p50 (ms)', 'p95 (ms)', 'Max (ms)')):
+            self.diagnostics_tree.heading(column, text=heading)
+            self.diagnostics_tree.column(column, width=80, anchor='e')
+        self.diagnostics_tree.pack(fill='both', expand=True, padx=5, pady=(0, 5))
+        
+        # Every PowerShell process of this session, costliest command first
+        self.processes_summary_var = tk.StringVar()
+        ttk.Label(self.diagnostics_tab, textvariable=self.processes_summary_var).pack(anchor='w', padx=5)
+        columns = ('count', 'failures', 'spawn', 'run', 'max_run', 'stdout')
+        self.processes_tree = ttk.Treeview(self.diagnostics_tab, columns=columns)
+        self.processes_tree.heading('#0', text='PowerShell Command')
+        self.processes_tree.column('#0', width=300)
+        for column, heading in zip(columns, ('Count', 'Failed', 'Mean Spawn (ms)', 'Mean Run (ms)', 'Max Run (ms)', 'Stdout (bytes)')):
+            self.processes_tree.heading(column, text=heading)
+            self.processes_tree.column(column, width=80, anchor='e')
+        self.processes_tree.pack(fill='both', expand=True, padx=5, pady=(0, 5))
+    
+    def refresh_diagnostics(self):
+        """Update the Diagnostics tab with the current timings, once a second while it is shown"""
+        if self.diagnostics_refresh_id:
+            self.root.after_cancel(self.diagnostics_refresh_id)
+            self.diagnostics_refresh_id = None
+        if self.notebook.tab(self.diagnostics_tab, 'state') == 'hidden':
+            return
+        import instrumentation
+        
+        def ms(value):
+            return '' if value is None else f"{value:.1f}"
+        
+        operations = instrumentation.snapshot()
+        for name, stats in operations.items():
+            values = (stats['count'], ms(stats['total_ms']), ms(stats['mean_ms']),
+                      ms(stats['p50_ms']), ms(stats['p95_ms']), ms(stats['max_ms']))
+            item = self.diagnostics_items.get(name)
+            if item and self.diagnostics_tree.exists(item):
+                self.diagnostics_tree.item(item, values=values)
+            else:
+                self.diagnostics_items[name] = self.diagnostics_tree.insert('', 'end', text=name, values=values)
+        
+        # Drop rows cleared by Reset
+        for name in [name for name in self.diagnostics_items if name not in operations]:
+            self.diagnostics_tree.delete(self.diagnostics_items.pop(name))
+        
+        import ps_runner
+        report = ps_runner.telemetry.report()
+        self.processes_summary_var.set(
+            f"PowerShell processes this session: {report['processes']} "
+            f"(spawn {report['spawn_ms']:.0f} ms, run {report['run_ms']:.0f} ms)")
+        self.processes_tree.delete(*self.processes_tree.get_children())
+        for totals in report['commands']:
+            self.processes_tree.insert('', 'end', text=totals['command'], values=(
+                totals['count'], totals['failures'], ms(totals['mean_spawn_ms']),
+                ms(totals['mean_run_ms']), ms(totals['max_run_ms']), totals['stdout_bytes']))
+        
+        self.diagnostics_refresh_id = self.root.after(1000, self.refresh_diagnostics)
+    
+    @timed('powershell.execution_policy')
+    def check_execution_policy(self, cached_only=False):
+        """Check if PowerShell execution policy allows scripts to run.
+        
+        With cached_only the last probed policy is used without starting PowerShell,
+        and None is returned when there is none yet.
+        """
+        try:
+            # Run PowerShell command to get execution policy
+            policy = self.probes.run('Get-ExecutionPolicy', cached_only=cached_only).lower()
+            
+            # Policies that allow script execution
+            allowed_policies = ['unrestricted', 'remotesigned', 'bypass', 'allsigned']
+            
+            return policy in allowed_policies
+        except ProbeFailed:
+            if cached_only:
+                return None
+            return False
+        except Exception:
+            # If we can't determine the policy, assume it's restricted
+            return False
+
+    def setup_home_tab(self):
+        # Create main split between list and preview
+        split_frame = ttk.PanedWindow(self.home_tab, orient=tk.HORIZONTAL)
+        split_frame.pack(expand=True, fill='both', padx=5, pady=5)
+        
+        # Create frame for scripts list
+        list_frame = ttk.Frame(split_frame)
+        split_frame.add(list_frame, weight=1)
+        
+        # Create frame for script preview
+        preview_frame = ttk.Frame(split_frame)
+        split_frame.add(preview_frame, weight=1)
+        
+        # Check execution policy in the background and show a warning if needed
+        def show_policy_warning():
+            warning_frame = ttk.Frame(self.home_tab)
+            warning_frame.pack(side='top', fill='x', padx=5, pady=(0, 5))
+            
+            # Create a container for the warning label (left-aligned)
+            left_container = ttk.Frame(warning_frame)
+            left_container.pack(side='left', fill='x', expand=True)
+            
+            warning_label = tk.Label(
+                left_container, 
+                text="Running scripts is disabled on this system.",
+                fg="red",
+                justify=tk.LEFT
+            )
+            warning_label.pack(side='left', anchor='w')
+            
+            def open_docs():
+                import webbrowser
+                webbrowser.open("https://go.microsoft.com/fwlink/?LinkID=135170")
+            
+            # Create button container for right alignment
+            button_container = ttk.Frame(warning_frame)
+            button_container.pack(side='right')
+            
+            learn_more_btn = ttk.Button(
+                button_container, 
+                text="Learn More", 
+                command=open_docs
+            )
+            learn_more_btn.pack(side='right', padx=(0, 5))
+        
+        def policy_check_thread():
+            if not self.check_execution_policy():
+                self.dispatcher.post(show_policy_warning)
+        
+        threading.Thread(target=policy_check_thread, daemon=True).start()
+        
+        # Create button frame at the top, aligned right
+        self.button_frame = ttk.Frame(preview_frame)
+        self.button_frame.pack(side='top', fill='x', padx=5, pady=(5,0))
+        
+        # Create a container for the buttons aligned to the right
+        self.action_buttons_frame = ttk.Frame(self.button_frame)
+        
+        # Create action buttons but don't pack them initially
+        self.refresh_btn = ttk.Button(self.action_buttons_frame, text="Refresh", 
+                                     image=self.get_icon('refresh'), compound=tk.LEFT, 
+                                     command=self.refresh_preview)
+        self.notepad_btn = ttk.Button(self.action_buttons_frame, text="Open in Notepad", 
+                                     image=self.get_icon('notepad'), compound=tk.LEFT,
+                                     command=self.open_in_notepad)
+        self.run_btn = ttk.Button(self.action_buttons_frame, text="Run", 
+                                 image=self.get_icon('run'), compound=tk.LEFT,
+                                 command=self.run_script)
+        self.runas_btn = ttk.Button(self.action_buttons_frame, text="Run As...", 
+                                   image=self.get_icon('run_as'), compound=tk.LEFT,
+                                   command=self.run_script_as)
+        
+        # Create a LabelFrame for the preview section
+        self.preview_label_frame = ttk.LabelFrame(preview_frame, text="Script Preview")
+        self.preview_label_frame.pack(side='top', fill='both', expand=True, padx=5, pady=(5,0))
+        
+        # Initially hide action buttons since no script is selected
+        self.show_action_buttons(False)
+        
+        # Create container frame for text and scrollbars
+        text_container = ttk.Frame(self.preview_label_frame)
+        text_container.pack(fill='both', expand=True, padx=5, pady=5)
+        
+        # Create text widget for script preview
+        self.preview_text = tk.Text(text_container, wrap=tk.NONE, font=('Consolas', 10))
+        self.preview_text.pack(side='left', fill='both', expand=True)
+        
+        # Add scrollbars
+        y_scrollbar = ttk.Scrollbar(text_container, orient='vertical', command=self.preview_text.yview)
+        y_scrollbar.pack(side='right', fill='y')
+        
+        x_scrollbar = ttk.Scrollbar(self.preview_label_frame, orient='horizontal', command=self.preview_text.xview)
+        x_scrollbar.pack(side='bottom', fill='x')
+        
+        self.preview_text.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
+        self.preview_text.configure(state='disabled')
+        
+        # Create top button frame
+        button_frame = ttk.Frame(list_frame)
+        button_frame.pack(side='top', fill='x', pady=5)
+        
+        # Add refresh button to the right with icon
+        refresh_btn = ttk.Button(button_frame, text="Refresh Scripts", image=self.get_icon('scripts_refresh'), 
+                                compound=tk.LEFT, command=self.refresh_script_list)
+        refresh_btn.pack(side='right')
+        
+        # Run every selected script as a batch
+        ttk.Button(button_frame, text="Run Selected", command=self.run_selected_scripts).pack(side='right', padx=(0, 5))
+        
+        # Create a LabelFrame for favorites section
+        favorites_frame = ttk.LabelFrame(list_frame, text="Favorites")
+        favorites_frame.pack(side='top', fill='x', padx=5, pady=(5,0))
+        
+        columns = ('Favorite', 'Script Name')
+        self.favorites_tree = ttk.Treeview(favorites_frame, columns=columns, show='headings', height=5)
+        self.favorites_tree.pack(fill='x', padx=5, pady=5, expand=True)
+        
+        # Set favorites columns
+        self.favorites_tree.heading('Favorite', text='♡')
+        self.favorites_tree.heading('Script Name', text='Script Name')
+        self.favorites_tree.column('Favorite', width=30, anchor='center', stretch=False)
+        self.favorites_tree.column('Script Name', width=400, stretch=True)
+        self.favorites_tree.bind('<Button-1>', self.on_tree_click)
+        self.favorites_tree.bind('<<TreeviewSelect>>', self.on_tree_select)
+        self.favorites_tree.bind('<Button-3>', self.on_script_right_click)
+        
+        # Add spacing between frames
+        ttk.Frame(list_frame, height=10).pack(fill='x')
+        
+        # Create a LabelFrame for all scripts section
+        all_scripts_frame = ttk.LabelFrame(list_frame, text="All Scripts")
+        all_scripts_frame.pack(side='top', fill='both', expand=True, padx=5, pady=(5,0))
+        
+        # All scripts also show the metadata extracted in the background
+        script_columns = columns + ('Synopsis', 'Parameters', 'Requires', 'Last Run', 'p50', 'p95')
+        self.scripts_tree = ttk.Treeview(all_scripts_frame, columns=script_columns, show='headings')
+        self.scripts_tree.pack(fill='both', expand=True, padx=5, pady=5)
+        
+        # Set scripts columns
+        self.scripts_tree.heading('Favorite', text='♡')
+        self.scripts_tree.heading('Script Name', text='Script Name',
+                                  command=lambda: self.treeview_sort_column(self.scripts_tree, 'Script Name', False))
+        self.scripts_tree.heading('Synopsis', text='Synopsis',
+                                  command=lambda: self.treeview_sort_column(self.scripts_tree, 'Synopsis', False))
+        self.scripts_tree.heading('Parameters', text='Parameters',
+                                  command=lambda: self.treeview_sort_column(self.scripts_tree, 'Parameters', False))
+        self.scripts_tree.heading('Requires', text='Requires',
+                                  command=lambda: self.treeview_sort_column(self.scripts_tree, 'Requires', False))
+        self.scripts_tree.heading('Last Run', text='Last Run',
+                                  command=lambda: self.sort_scripts_by_run_stats('Last Run', False))
+        self.scripts_tree.heading('p50', text='p50',
+                                  command=lambda: self.sort_scripts_by_run_stats('p50', False))
+        self.scripts_tree.heading('p95', text='p95',
+                                  command=lambda: self.sort_scripts_by_run_stats('p95', False))
+        self.scripts_tree.column('Favorite', width=30, anchor='center', stretch=False)
+        self.scripts_tree.column('Script Name', width=200, stretch=True)
+        self.scripts_tree.column('Synopsis', width=200, stretch=True)
+        self.scripts_tree.column('Parameters', width=120, stretch=False)
+        self.scripts_tree.column('Requires', width=100, stretch=False)
+        self.scripts_tree.column('Last Run', width=110, stretch=False)
+        self.scripts_tree.column('p50', width=60, anchor='e', stretch=False)
+        self.scripts_tree.column('p95', width=60, anchor='e', stretch=False)
+        self.scripts_tree.bind('<Button-1>', self.on_tree_click)
+        self.scripts_tree.bind('<<TreeviewSelect>>', self.on_tree_select)
+        self.scripts_tree.bind('<Button-3>', self.on_script_right_click)
+        
+        # Show script metadata as a tooltip when hovering over a row
+        self.script_tooltip = None
+        self.script_tooltip_item = None
+        self.script_tooltip_job = None
+        self.scripts_tree.bind('<Motion>', self.on_scripts_tree_motion)
+        self.scripts_tree.bind('<Leave>', lambda e: self.hide_script_tooltip())
+        
+        # Create context menu for scripts
+        self.script_context_menu = tk.Menu(self.root, tearoff=0)
+        self.script_context_menu.add_command(label="Toggle Favorite", command=self.toggle_script_favorite)
+        self.script_context_menu.add_separator()
+        self.script_context_menu.add_command(label="Run Script", command=self.run_script)
+        self.script_context_menu.add_command(label="Run As...", command=self.run_script_as)
+        self.script_context_menu.add_command(label="Run Selected", command=self.run_selected_scripts)
+        self.script_context_menu.add_separator()
+        self.script_context_menu.add_command(label="Open in Notepad", command=self.open_in_notepad)
+        
+    def setup_runs_tab(self):
+        """Set up the Runs tab listing launched scripts and their captured output"""
+        split_frame = ttk.PanedWindow(self.runs_tab, orient=tk.VERTICAL)
+        split_frame.pack(expand=True, fill='both', padx=5, pady=5)
+        
+        # Create a LabelFrame for the list of runs
+        runs_frame = ttk.LabelFrame(split_frame, text="Script Runs")
+        split_frame.add(runs_frame, weight=1)
+        
+        button_frame = ttk.Frame(runs_frame)
+        button_frame.pack(side='top', fill='x', padx=5, pady=(5, 0))
+        ttk.Button(button_frame, text="Clear Finished", command=self.clear_finished_runs).pack(side='right')
+        ttk.Button(button_frame, text="Cancel Run", command=self.cancel_selected_run).pack(side='right', padx=(0, 5))
+        
+        columns = ('script', 'status', 'exit_code', 'duration', 'started')
+        self.runs_tree = ttk.Treeview(runs_frame, columns=columns, show='headings', selectmode='browse', height=6)
+        self.runs_tree.pack(side='left', fill='both', expand=True, padx=5, pady=5)
+        
+        self.runs_tree.heading('script', text='Script')
+        self.runs_tree.heading('status', text='Status')
+        self.runs_tree.heading('exit_code', text='Exit Code')
+        self.runs_tree.heading('duration', text='Duration')
+        self.runs_tree.heading('started', text='Started')
+        
+        self.runs_tree.column('script', width=250, stretch=True)
+        self.runs_tree.column('status', width=90, stretch=False)
+        self.runs_tree.column('exit_code', width=70, anchor='center', stretch=False)
+        self.runs_tree.column('duration', width=80, anchor='e', stretch=False)
+        self.runs_tree.column('started', width=80, stretch=False)
+        
+        runs_scroll = ttk.Scrollbar(runs_frame, orient='vertical', command=self.runs_tree.yview)
+        runs_scroll.pack(side='right', fill='y')
+        self.runs_tree.configure(yscrollcommand=runs_scroll.set)
+        self.runs_tree.bind('<<TreeviewSelect>>', self.on_run_select)
+        
+        # Create a LabelFrame for the output of the selected run
+        self.run_output_frame = ttk.LabelFrame(split_frame, text="Output")
+        split_frame.add(self.run_output_frame, weight=2)
+        
+        self.run_output_text = tk.Text(self.run_output_frame, wrap=tk.NONE, font=('Consolas', 10))
+        self.run_output_text.pack(side='left', fill='both', expand=True, padx=(5, 0), pady=5)
+        self.run_output_text.tag_configure('stderr', foreground='red')
+        
+        output_scroll = ttk.Scrollbar(self.run_output_frame, orient='vertical', command=self.run_output_text.yview)
+        output_scroll.pack(side='right', fill='y', pady=5)
+        self.run_output_text.configure(yscrollcommand=output_scroll.set, state='disabled')
+    
+    def on_run_status(self, run):
+        """Called from worker threads whenever a run changes state"""
+        self.dispatcher.post(lambda: self.update_run_row(run), key=('run', run.id))
+        if self.rpc_server:
+            self.rpc_server.publish('run_status', self.describe_run(run))
+    
+    def on_run_output(self, run, stream, line):
+        """Called from reader threads for each output line; flushes to the UI in batches"""
+        if run is self.shown_run:
+            self.dispatcher.post(self.flush_run_output, key='run_output')
+    
+    def update_run_row(self, run):
+        """Insert or update the row for a run in runs_tree"""
+        self.ensure_tab(self.runs_tab)
+        exit_code = '' if run.exit_code is None else run.exit_code
+        duration = '' if run.duration is None else f"{run.duration:.1f}s"
+        started = time.strftime('%H:%M:%S', time.localtime(run.start_time)) if run.start_time else ''
+        status = run.status.capitalize()
+        if run.status == FAILED and run.error:
+            status = f"Failed: {run.error}"
+        name = run.name
+        if run.elevated:
+            name += " (admin)"
+        elif run.fast:
+            name += " (fast)"
+        values = (name, status, exit_code, duration, started)
+        
+        item = self.run_items.get(run.id)
+        if item and self.runs_tree.exists(item):
+            self.runs_tree.item(item, values=values)
+        else:
+            item = self.runs_tree.insert('', 0, values=values)
+            self.run_items[run.id] = item
+            # Show the output of the newest run
+            self.runs_tree.selection_set(item)
+        
+        # Keep the duration of running scripts ticking
+        if run.status == RUNNING and not run.done.is_set():
+            self.root.after(1000, lambda: self.update_run_row(run) if run.status == RUNNING else None)
+        
+        if run is self.shown_run:
+            self.flush_run_output()
+        
+        # The run has been recorded in the history by now
+        if run.finished:
+            self.apply_run_stats(run.script_path)
+    
+    def on_run_select(self, event=None):
+        """Show the captured output of the selected run"""
+        selection = self.runs_tree.selection()
+        if not selection:
+            return
+        run = self.get_run_for_item(selection[0])
+        if run is None or run is self.shown_run:
+            return
+        
+        self.shown_run = run
+        self.shown_output_count = 0
+        self.run_output_frame.configure(text=f"Output: {run.name}")
+        self.run_output_text.configure(state='normal')
+        self.run_output_text.delete(1.0, tk.END)
+        self.run_output_text.configure(state='disabled')
+        self.flush_run_output()
+    
+    def flush_run_output(self):
+        """Append output lines of the shown run that are not displayed yet"""
+        run = self.shown_run
+        if run is None:
+            return
+        
+        lines = run.output[self.shown_output_count:]
+        if not lines:
+            return
+        self.shown_output_count += len(lines)
+        
+        self.run_output_text.configure(state='normal')
+        for stream, line in lines:
+            self.run_output_text.insert(tk.END, line + '\n', (stream,))
+        self.run_output_text.configure(state='disabled')
+        self.run_output_text.see(tk.END)
+    
+    def get_run_for_item(self, item):
+        for run in self.execution_manager.runs:
+            if self.run_items.get(run.id) == item:
+                return run
+        return None
+    
+    def cancel_selected_run(self):
+        selection = self.runs_tree.selection()
+        if not selection:
+            return
+        run = self.get_run_for_item(selection[0])
+        if run and not run.finished:
+            self.execution_manager.cancel(run)
+    
+    def clear_finished_runs(self):
+        """Remove finished runs from the list"""
+        for run in self.execution_manager.clear_finished():
+            item = self.run_items.pop(run.id, None)
+            if item and self.runs_tree.exists(item):
+                self.runs_tree.delete(item)
+            if run is self.shown_run:
+                self.shown_run = None
+                self.run_output_frame.configure(text="Output")
+                self.run_output_text.configure(state='normal')
+                self.run_output_text.delete(1.0, tk.END)
+                self.run_output_text.configure(state='disabled')
+        
+    @timed('powershell.details')
+    def get_powershell_details(self, cached_only=False):
+        """Probe the installed PowerShell variants, policy and paths.
+
+        Runs PowerShell, so it belongs on a worker thread; with cached_only it
+        returns last session's answers (placeholders where there are none) at once.
+        """
+        details = {}
+        # Shown until the first probe on this machine has answered
+        unknown = "Checking..." if cached_only else "Unknown"
+        
+        # Initialize installed PowerShell variants list
+        details['installed_variants'] = []
+        
+        # Get Windows PowerShell version
+        try:
+            win_ps_version = self.probes.run('(Get-Host).Version.ToString()', cached_only=cached_only)
+            details['win_ps_version'] = win_ps_version
+            
+            # Add to installed variants
+            details['installed_variants'].append({
+                'name': 'Windows PowerShell',
+                'version': win_ps_version,
+                'path': 'powershell.exe',
+                'icon': 'powershell.exe'
+            })
+            
+            # Check if Windows PowerShell update is available (PowerShell 5.1 is the latest for Windows PowerShell)
+            # This checks if current version is less than 5.1
+            current_version = [int(x) for x in details['win_ps_version'].split('.')]
+            if len(current_version) >= 2 and (current_version[0] < 5 or (current_version[0] == 5 and current_version[1] < 1)):
+                details['win_ps_update'] = True
+            else:
+                details['win_ps_update'] = False
+        except:
+            details['win_ps_version'] = "Checking..." if cached_only else "Not detected"
+            details['win_ps_update'] = False
+            
+        # Check if PowerShell ISE is installed
+        try:
+            ise_version = self.probes.run("if (Get-Command powershell_ise.exe -ErrorAction SilentlyContinue) { (Get-Host).Version.ToString() } else { 'Not installed' }", cached_only=cached_only)
+            details['ise_version'] = ise_version
+            
+            # Add to installed variants if ISE is installed
+            if ise_version != 'Not installed':
+                details['installed_variants'].append({
+                    'name': 'PowerShell ISE',
+                    'version': ise_version,
+                    'path': 'powershell_ise.exe',
+                    'icon': 'powershell_ise.exe'
+                })
+        except:
+            details['ise_version'] = "Checking..." if cached_only else "Not detected"
+            
+        # Check if PowerShell Core (pwsh) is installed
+        try:
+            core_ps_version = self.probes.run('(Get-Host).Version.ToString()', executable='pwsh', cached_only=cached_only)
+            details['core_ps_version'] = core_ps_version
+            
+            # Add to installed variants
+            details['installed_variants'].append({
+                'name': 'PowerShell Core',
+                'version': core_ps_version,
+                'path': 'pwsh.exe',
+                'icon': 'pwsh.exe'
+            })
+            
+            # Check if PowerShell Core update is available
+            # This requires an internet connection to check the GitHub API
+            try:
+                # Check latest version from GitHub API
+                latest_version = self.probes.run("try { $releaseInfo = Invoke-RestMethod -Uri 'https://api.github.com/repos/PowerShell/PowerShell/releases/latest' -TimeoutSec 3; $releaseInfo.tag_name.TrimStart('v') } catch { 'Unknown' }", timeout=5, cached_only=cached_only)
+                
+                if latest_version != 'Unknown':
+                    current_parts = [int(x) for x in details['core_ps_version'].split('.')]
+                    latest_parts = [int(x) for x in latest_version.split('.')]
+                    
+                    # Compare versions
+                    update_available = False
+                    for i in range(min(len(current_parts), len(latest_parts))):
+                        if latest_parts[i] > current_parts[i]:
+                            update_available = True
+                            break
+                        elif current_parts[i] > latest_parts[i]:
+                            break
+                    
+                    details['core_ps_update'] = update_available
+                    details['core_ps_latest'] = latest_version
+                else:
+                    details['core_ps_update'] = False
+                    details['core_ps_latest'] = "Unknown"
+            except:
+                details['core_ps_update'] = False
+                details['core_ps_latest'] = "Unknown"
+        except:
+            details['core_ps_version'] = "Checking..." if cached_only else "Not installed"
+            details['core_ps_update'] = False
+            details['core_ps_latest'] = "N/A"
+            
+        # Check for other PowerShell preview versions
+        try:
+            preview_version = self.probes.run("if (Get-Command pwsh-preview -ErrorAction SilentlyContinue) { pwsh-preview -Command '(Get-Host).Version.ToString()' } else { 'Not installed' }", cached_only=cached_only)
+            
+            if preview_version != 'Not installed':
+                # Add to installed variants
+                details['installed_variants'].append({
+                    'name': 'PowerShell Preview',
+                    'version': preview_version,
+                    'path': 'pwsh-preview.exe',
+                    'icon': 'pwsh-preview.exe'
+                })
+        except:
+            pass
+            
+        # Get execution policy
+        try:
+            details['execution_policy'] = self.probes.run('Get-ExecutionPolicy', cached_only=cached_only)
+        except:
+            details['execution_policy'] = unknown
+            
+        # Get module path
+        try:
+            details['module_path'] = self.probes.run('$env:PSModulePath', cached_only=cached_only)
+        except:
+            details['module_path'] = unknown
+            
+        # Get profile path
+        try:
+            details['profile_path'] = self.probes.run('$PROFILE', cached_only=cached_only)
+        except:
+            details['profile_path'] = unknown
+            
+        # Get PSEdition
+        try:
+            details['ps_edition'] = self.probes.run('$PSVersionTable.PSEdition', cached_only=cached_only)
+        except:
+            details['ps_edition'] = unknown
+            
+        # Get PS Platform
+        try:
+            details['ps_platform'] = self.probes.run('$PSVersionTable.Platform', cached_only=cached_only)
+        except:
+            details['ps_platform'] = unknown
+            
+        return details
+
+    
+    def start_powershell_probe(self, notify=False):
+        """Probe PowerShell on a worker thread and rebuild the PowerShell tab with the result"""
+        token = self.powershell_probes.start()
+        
+        def probe_thread():
+            details = self.get_powershell_details()
+            
+            def apply_details():
+                if not self.powershell_probes.is_current(token):
+                    return
+                self.powershell_details = details
+                self.update_powershell_ui()
+                if notify:
+                    self.show_notification("PowerShell Info Refreshed", "PowerShell information has been refreshed")
+            
+            self.dispatcher.post(apply_details, key='powershell_details')
+        
+        threading.Thread(target=probe_thread, daemon=True).start()
+    
+    def setup_powershell_tab(self):
+        # Create main frame for PowerShell information
+        main_frame = ttk.Frame(self.powershell_tab)
+        main_frame.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        # Create a LabelFrame for PowerShell versions
+        versions_frame = ttk.LabelFrame(main_frame, text="PowerShell Versions")
+        versions_frame.pack(fill='x', expand=False, pady=(0, 10))
+        
+        # Probing PowerShell takes seconds, or up to its deadline when a host hangs, so it
+        # runs on a worker thread; until it answers the tab shows last session's values
+        ps_details = self.powershell_details
+        if ps_details is None:
+            ps_details = self.get_powershell_details(cached_only=True)
+            self.start_powershell_probe()
+            ttk.Label(versions_frame, text="Checking installed PowerShell versions...").pack(anchor='w', padx=10, pady=(5, 0))
+        
+        # Create version info display
+        version_info = ttk.Frame(versions_frame)
+        version_info.pack(fill='x', padx=10, pady=10)
+        
+        # Create a subframe with scrollable area for installed PowerShell variants
+        variants_container = ttk.Frame(version_info)
+        variants_container.grid(row=0, column=0, columnspan=4, sticky='nsew', pady=5)
+        
+        # Display all installed PowerShell variants
+        row_num = 1
+        for variant in ps_details['installed_variants']:
+            # Variant name and version
+            ttk.Label(variants_container, text=f"{variant['name']}:").grid(
+                row=row_num, column=0, sticky='w', padx=(20, 10), pady=2)
+            ttk.Label(variants_container, text=variant['version']).grid(
+                row=row_num, column=1, sticky='w', pady=2)
+            
+            # Add launch button for this PowerShell variant
+            def create_launch_command(path):
+                return lambda: subprocess.Popen([path])
+            
+            launch_btn = ttk.Button(variants_container, text="Launch", 
+                                  command=create_launch_command(variant['path']))
+            launch_btn.grid(row=row_num, column=2, sticky='e', padx=5, pady=2)
+            
+            # Get status from the background check if available
+            status_info = self.powershell_status.get(variant['name'], {'status': 'checking', 'version': ''})
+            
+            # Display status based on background check
+            if status_info['status'] == 'checking':
+                status_label = tk.Label(variants_container, text="Checking...", foreground="blue")
+                status_label.grid(row=row_num, column=3, sticky='w', padx=5, pady=2)
+                
+            elif status_info['status'] == 'update_available':
+                version_text = f" ({status_info['version']})" if status_info['version'] else ""
+                status_label = tk.Label(variants_container, text=f"Update Available{version_text}", foreground="green")
+                status_label.grid(row=row_num, column=3, sticky='w', padx=5, pady=2)
+                
+                # Add update button based on which PowerShell variant
+                if variant['name'] == 'Windows PowerShell' or variant['name'] == 'PowerShell ISE':
+                    def update_windows_powershell():
+                        shell_execute_runas("powershell.exe",
+                                            "-Command Start-Process -Wait powershell -ArgumentList '-Command Install-Module -Name PowerShellGet -Force -AllowClobber'")
+                    update_btn = ttk.Button(variants_container, text="Update", command=update_windows_powershell)
+                    update_btn.grid(row=row_num, column=4, sticky='e', padx=5, pady=2)
+                    
+                elif variant['name'] == 'PowerShell Core':
+                    def update_powershell_core():
+                        shell_execute_runas("powershell.exe",
+                                            "-Command Start-Process -Wait msedge -ArgumentList 'https://github.com/PowerShell/PowerShell/releases/latest'")
+                    update_btn = ttk.Button(variants_container, text="Update", command=update_powershell_core)
+                    update_btn.grid(row=row_num, column=4, sticky='e', padx=5, pady=2)
+                    
+            elif status_info['status'] == 'up_to_date':
+                status_label = tk.Label(variants_container, text="Up to Date", foreground="green")
+                status_label.grid(row=row_num, column=3, sticky='w', padx=5, pady=2)
+                
+            elif status_info['status'] == 'preview':
+                status_label = tk.Label(variants_container, text="Preview Version", foreground="purple")
+                status_label.grid(row=row_num, column=3, sticky='w', padx=5, pady=2)
+                
+            elif status_info['status'] == 'unknown':
+                status_label = tk.Label(variants_container, text="Status Unknown", foreground="orange")
+                status_label.grid(row=row_num, column=3, sticky='w', padx=5, pady=2)
+                
+            # Add legacy check for compatibility with previous code
+            # This will be used until the background check completes
+            elif variant['name'] == 'Windows PowerShell' and ps_details['win_ps_update']:
+                update_label = tk.Label(variants_container, text="Update Available", foreground="green")
+                update_label.grid(row=row_num, column=3, sticky='w', padx=5, pady=2)
+                
+                def update_windows_powershell():
+                    shell_execute_runas("powershell.exe",
+                                        "-Command Start-Process -Wait powershell -ArgumentList '-Command Install-Module -Name PowerShellGet -Force -AllowClobber'")
+                update_btn = ttk.Button(variants_container, text="Update", command=update_windows_powershell)
+                update_btn.grid(row=row_num, column=4, sticky='e', padx=5, pady=2)
+                
+            elif variant['name'] == 'PowerShell Core' and ps_details['core_ps_update']:
+                update_label = tk.Label(variants_container, text=f"Update Available ({ps_details['core_ps_latest']})", foreground="green")
+                update_label.grid(row=row_num, column=3, sticky='w', padx=5, pady=2)
+                
+                def update_powershell_core():
+                    shell_execute_runas("powershell.exe",
+                                        "-Command Start-Process -Wait msedge -ArgumentList 'https://github.com/PowerShell/PowerShell/releases/latest'")
+                update_btn = ttk.Button(variants_container, text="Update", command=update_powershell_core)
+                update_btn.grid(row=row_num, column=4, sticky='e', padx=5, pady=2)
+            
+            row_num += 1
+        
+            # Add some spacing at the bottom for better visual appearance
+            ttk.Frame(version_info, height=5).grid(row=row_num + 1, column=0, columnspan=5, sticky='ew')        # Create a LabelFrame for execution policy
+        policy_frame = ttk.LabelFrame(main_frame, text="Execution Policy")
+        policy_frame.pack(fill='x', expand=False, pady=(0, 10))
+        
+        # Create policy info display
+        policy_info = ttk.Frame(policy_frame)
+        policy_info.pack(fill='x', padx=10, pady=10)
+        
+        # Current Policy
+        ttk.Label(policy_info, text="Current Policy:").grid(row=0, column=0, sticky='w', padx=(0, 10), pady=2)
+        
+        # Use different colors based on policy type
+        policy_value = ps_details['execution_policy']
+        policy_color = "green" if policy_value.lower() in ['remotesigned', 'unrestricted', 'bypass'] else "red"
+        
+        policy_label = tk.Label(policy_info, text=policy_value, foreground=policy_color)
+        policy_label.grid(row=0, column=1, sticky='w', pady=2)
+        
+        # Policy description
+        policy_desc = {
+            "Restricted": "Does not load configuration files or run scripts. Default state.",
+            "AllSigned": "Scripts can run, but requires all scripts and config files to be signed by a trusted publisher.",
+            "RemoteSigned": "Scripts downloaded from the internet must be signed by a trusted publisher.",
+            "Unrestricted": "Unsigned scripts can run (a warning appears before running scripts from the internet).",
+            "Bypass": "Nothing is blocked and there are no warnings or prompts.",
+            "Undefined": "No execution policy set in the current scope.",
+            "Default": "Sets the default execution policy (Restricted for Windows clients)."
+        }
+        
+        desc = policy_desc.get(policy_value, "Unknown policy")
+        ttk.Label(policy_info, text="Description:").grid(row=1, column=0, sticky='nw', padx=(0, 10), pady=2)
+        desc_label = ttk.Label(policy_info, text=desc, wraplength=400)
+        desc_label.grid(row=1, column=1, sticky='w', pady=2)
+        
+        # Add button to open powershell as admin to change policy
+        def open_ps_admin():
+            shell_execute_runas("powershell.exe",
+                                "-Command Start-Process powershell -Verb RunAs")
+        
+        # Add a button frame to contain both buttons side by side
+        button_frame = ttk.Frame(policy_info)
+        button_frame.grid(row=2, column=0, columnspan=2, pady=10)
+        
+        # Add button to open PowerShell as Admin
+        ttk.Button(button_frame, text="Open PowerShell as Admin", command=open_ps_admin).pack(side='left', padx=(0, 5))
+        
+        # Add button to set execution policy for current user
+        def set_current_user_policy():
+            policy = "RemoteSigned"  # Most common safe policy
+            result = messagebox.askyesno(
+                "Change Execution Policy", 
+                f"Do you want to change the execution policy for the current user to '{policy}'?\n\n" +
+                "This will allow scripts to run without requiring administrator privileges."
+            )
+            
+            if result:
+                try:
+                    # Run the command to change execution policy for current user
+                    run_powershell(['-Command', f"Set-ExecutionPolicy -Scope CurrentUser -ExecutionPolicy {policy} -Force"],
+                                   timeout=PROBE_TIMEOUT)
+                    messagebox.showinfo(
+                        "Success", 
+                        f"Execution policy for current user has been set to '{policy}'.\n\n" +
+                        "Please refresh the PowerShell info to see the changes."
+                    )
+                except Exception as e:
+                    messagebox.showerror("Error", f"Failed to change execution policy:\n{str(e)}")
+        
+        ttk.Button(button_frame, text="Set for Current User", command=set_current_user_policy).pack(side='left')
+        
+        # Create a LabelFrame for PowerShell paths
+        paths_frame = ttk.LabelFrame(main_frame, text="PowerShell Paths")
+        paths_frame.pack(fill='both', expand=True, pady=(0, 10))
+        
+        # Create paths info display with scrollable text widget
+        paths_info = ttk.Frame(paths_frame)
+        paths_info.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        # Profile Path
+        ttk.Label(paths_info, text="Profile Path:").grid(row=0, column=0, sticky='w', padx=(0, 10), pady=2)
+        profile_text = ttk.Entry(paths_info, width=50)
+        profile_text.insert(0, ps_details['profile_path'])
+        profile_text.configure(state='readonly')
+        profile_text.grid(row=0, column=1, sticky='w', pady=2)
+        
+        # Module Path
+        ttk.Label(paths_info, text="Module Path:").grid(row=1, column=0, sticky='nw', padx=(0, 10), pady=2)
+        
+        # Create scrollable text widget for module paths
+        module_text = tk.Text(paths_info, height=5, width=50, wrap='none')
+        module_text.insert('1.0', ps_details['module_path'].replace(';', ';\n'))
+        module_text.configure(state='disabled')
+        module_text.grid(row=1, column=1, sticky='w', pady=2)
+        
+        # Add scrollbar
+        module_scroll = ttk.Scrollbar(paths_info, orient='vertical', command=module_text.yview)
+        module_scroll.grid(row=1, column=2, sticky='ns')
+        module_text.configure(yscrollcommand=module_scroll.set)
+        
+        # Button to refresh PowerShell info
+        def refresh_powershell_info():
+            refresh_btn.configure(state='disabled', text="Refreshing...")
+            self.start_powershell_probe(notify=True)
+        
+        refresh_btn = ttk.Button(main_frame, text="Refresh PowerShell Info", command=refresh_powershell_info)
+        refresh_btn.pack(pady=(0, 10))
+        
+    def setup_modules_tab(self):
+        """Set up the PowerShell Modules tab to display installed modules and their details"""
+        # Create main frame for modules information
+        main_frame = ttk.Frame(self.modules_tab)
+        main_frame.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        # Create top section with filter and buttons
+        top_frame = ttk.Frame(main_frame)
+        top_frame.pack(fill='x', pady=(0, 10))
+        
+        # Filter controls
+        ttk.Label(top_frame, text="Filter:").pack(side='left', padx=(0, 5))
+        self.module_filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(top_frame, textvariable=self.module_filter_var, width=30)
+        filter_entry.pack(side='left', padx=(0, 5))
+        
+        # Create function to filter modules when the entry changes
+        def on_filter_change(*args):
+            self.filter_modules()
+        
+        self.module_filter_var.trace_add('write', on_filter_change)
+        
+        # Create a refresh button
+        def refresh_modules():
+            self.load_modules()
+            # Show notification about refresh
+            self.show_notification("Modules Refreshed", "PowerShell modules have been refreshed")
+        
+        refresh_btn = ttk.Button(top_frame, text="Refresh Modules", command=refresh_modules)
+        refresh_btn.pack(side='right')
+        
+        self.check_updates_btn = ttk.Button(top_frame, text="Check for Updates", command=self.check_module_updates)
+        self.check_updates_btn.pack(side='right', padx=(0, 5))
+        
+        # Create a LabelFrame for the modules list
+        modules_frame = ttk.LabelFrame(main_frame, text="Installed PowerShell Modules")
+        modules_frame.pack(fill='both', expand=True, pady=(0, 10))
+        
+        # Create treeview for modules list
+        columns = ('name', 'version', 'description', 'path', 'repository', 'latest')
+        self.modules_tree = ttk.Treeview(modules_frame, columns=columns, show='headings', selectmode='extended',
+                                         displaycolumns=('name', 'version', 'latest', 'description', 'path', 'repository'))
+        self.modules_tree.pack(side='left', fill='both', expand=True, padx=5, pady=5)
+        
+        # Configure columns
+        # Click a header to sort by it, Shift+click to add it as a further sort column
+        self.module_headings = {'name': 'Name', 'version': 'Version', 'description': 'Description',
+                                'path': 'Path', 'repository': 'Repository', 'latest': 'Latest'}
+        for col, text in self.module_headings.items():
+            self.modules_tree.heading(col, text=text, command=lambda c=col: self.sort_modules(c))
+        self.modules_tree.bind('<Shift-Button-1>', self.on_modules_heading_shift_click)
+        self.module_sort = []
+        
+        # Set column widths
+        self.modules_tree.column('name', width=150, stretch=False)
+        self.modules_tree.column('version', width=80, stretch=False)
+        self.modules_tree.column('description', width=300, stretch=True)
+        self.modules_tree.column('path', width=200, stretch=True)
+        self.modules_tree.column('repository', width=120, stretch=False)
+        self.modules_tree.column('latest', width=80, stretch=False)
+        
+        # Highlight modules with a newer version on the repository feed
+        self.modules_tree.tag_configure('outdated', background='#fff3cd')
+        self.module_rows = []
+        self.module_items = {}
+        self.module_latest = {}
+        self.module_sort_keys = {}
+        
+        # Add vertical scrollbar
+        y_scrollbar = ttk.Scrollbar(modules_frame, orient='vertical', command=self.modules_tree.yview)
+        y_scrollbar.pack(side='right', fill='y')
+        self.modules_tree.configure(yscrollcommand=y_scrollbar.set)
+        
+        # Add horizontal scrollbar
+        x_scrollbar = ttk.Scrollbar(main_frame, orient='horizontal', command=self.modules_tree.xview)
+        x_scrollbar.pack(side='bottom', fill='x')
+        self.modules_tree.configure(xscrollcommand=x_scrollbar.set)
+        
+        # Bind double-click to show module details
+        self.modules_tree.bind('<Double-1>', self.show_module_details)
+        
+        # Details of the selected and neighbouring modules are fetched ahead of time
+        self.module_details = ModuleDetailsCache()
+        self.module_prefetch_job = None
+        
+        # RequiredModules of every installed module, read from the manifests
+        self.module_graph = DependencyGraph()
+        self.modules_tree.bind('<<TreeviewSelect>>', self.schedule_module_prefetch)
+        
+        # Queue of module updates and uninstalls with their progress
+        jobs_frame = ttk.LabelFrame(main_frame, text="Module Jobs")
+        jobs_frame.pack(side='bottom', fill='x', pady=(0, 5))
+        
+        job_columns = ('module', 'operation', 'status', 'duration')
+        self.module_jobs_tree = ttk.Treeview(jobs_frame, columns=job_columns, show='headings', height=4)
+        self.module_jobs_tree.heading('module', text='Module')
+        self.module_jobs_tree.heading('operation', text='Operation')
+        self.module_jobs_tree.heading('status', text='Status')
+        self.module_jobs_tree.heading('duration', text='Duration')
+        self.module_jobs_tree.column('module', width=200)
+        self.module_jobs_tree.column('operation', width=100, stretch=False)
+        self.module_jobs_tree.column('status', width=250)
+        self.module_jobs_tree.column('duration', width=80, stretch=False)
+        self.module_jobs_tree.pack(side='left', fill='x', expand=True, padx=5, pady=5)
+        
+        jobs_button_frame = ttk.Frame(jobs_frame)
+        jobs_button_frame.pack(side='right', fill='y', padx=5, pady=5)
+        ttk.Button(jobs_button_frame, text="Cancel Selected", command=self.cancel_selected_module_jobs).pack(fill='x')
+        ttk.Button(jobs_button_frame, text="Cancel All", command=lambda: self.module_jobs.cancel_all()).pack(fill='x', pady=5)
+        ttk.Button(jobs_button_frame, text="Clear Finished", command=self.clear_finished_module_jobs).pack(fill='x')
+        
+        self.module_jobs = ModuleJobQueue(
+            on_update=lambda job: self.dispatcher.post(lambda: self.update_module_job_row(job), key=('module_job', job.id)))
+        self.module_job_items = {}
+        
+        # Status display to show loading information
+        self.modules_status_var = tk.StringVar(value="Loading modules...")
+        status_label = ttk.Label(main_frame, textvariable=self.modules_status_var)
+        status_label.pack(side='left', pady=(5, 0))
+        
+        # Create a context menu for modules
+        self.module_context_menu = tk.Menu(self.modules_tree, tearoff=0)
+        self.module_context_menu.add_command(label="Show Details", command=self.show_module_details_context)
+        self.module_context_menu.add_command(label="Update Module", command=self.update_module)
+        self.module_context_menu.add_command(label="Uninstall Module", command=self.uninstall_module)
+        self.module_context_menu.add_separator()
+        self.module_context_menu.add_command(label="Copy Name", command=lambda: self.copy_module_info('name'))
+        self.module_context_menu.add_command(label="Copy Version", command=lambda: self.copy_module_info('version'))
+        self.module_context_menu.add_command(label="Copy Path", command=lambda: self.copy_module_info('path'))
+        
+        # Bind right-click to show context menu
+        self.modules_tree.bind('<Button-3>', self.show_module_context_menu)
+        
+        # Load modules on tab creation
+        self.load_modules()
+    
+    def treeview_sort_column(self, tree, col, reverse):
+        """Sort treeview contents when a column header is clicked"""
+        l = [(tree.set(k, col), k) for k in tree.get_children('')]
+        l.sort(reverse=reverse)
+        
+        # Rearrange items in sorted positions in one go
+        tree.set_children('', *[k for val, k in l])
+
+        # Reverse sort next time
+        tree.heading(col, command=lambda: self.treeview_sort_column(tree, col, not reverse))
+    
+    def sort_scripts_by_run_stats(self, col, reverse):
+        """Sort the scripts list by a run history column, using the numbers rather than the text"""
+        key = {'Last Run': 'last_run', 'p50': 'p50', 'p95': 'p95'}[col]
+        run_stats = self.run_history.stats()
+        values, empty = [], []
+        for item in self.scripts_tree.get_children(''):
+            value = run_stats.get(self.item_paths.get((self.scripts_tree, item)), {}).get(key)
+            if value is None:
+                empty.append(item)
+            else:
+                values.append((value, item))
+        values.sort(reverse=reverse)
+        
+        # Scripts without runs go last whichever way the column is sorted
+        self.scripts_tree.set_children('', *[item for value, item in values], *empty)
+        self.scripts_tree.heading(col, command=lambda: self.sort_scripts_by_run_stats(col, not reverse))
+    
+    def make_module_sort_keys(self, values):
+        """Precompute typed sort keys for a modules_tree row"""
+        name, version, description, path, repository, latest = values
+        return {
+            'name': name.casefold(),
+            'version': parse_version(version),
+            'description': description.casefold(),
+            'path': path.casefold(),
+            'repository': repository.casefold(),
+            'latest': parse_version(latest)
+        }
+    
+    def sort_modules(self, col, add=False):
+        """Sort the modules by a column; with add, keep the current sort columns and add this one"""
+        columns = [c for c, _ in self.module_sort]
+        if add and col in columns:
+            index = columns.index(col)
+            self.module_sort[index] = (col, not self.module_sort[index][1])
+        elif add:
+            self.module_sort.append((col, False))
+        elif self.module_sort == [(col, False)]:
+            self.module_sort = [(col, True)]
+        else:
+            self.module_sort = [(col, False)]
+        self.apply_module_sort()
+    
+    def on_modules_heading_shift_click(self, event):
+        if self.modules_tree.identify_region(event.x, event.y) != 'heading':
+            return
+        # identify_column returns '#n' in display order
+        index = int(self.modules_tree.identify_column(event.x)[1:]) - 1
+        display_columns = self.modules_tree['displaycolumns']
+        if 0 <= index < len(display_columns):
+            self.sort_modules(display_columns[index], add=True)
+        return 'break'
+    
+    @timed('tk.sort_modules')
+    def apply_module_sort(self):
+        """Order the module rows by the current sort columns and reorder the tree in one call"""
+        rows = list(self.module_rows)
+        # Stable sorts from the last sort column to the first give a multi-column sort
+        for col, reverse in reversed(self.module_sort):
+            rows.sort(key=lambda item: self.module_sort_keys[item][col], reverse=reverse)
+        self.module_rows = rows
+        
+        visible = set(self.modules_tree.get_children())
+        self.modules_tree.set_children('', *[item for item in rows if item in visible])
+        
+        # Show the sort order in the headers
+        for col, text in self.module_headings.items():
+            for position, (sort_col, reverse) in enumerate(self.module_sort):
+                if sort_col == col:
+                    arrow = '▼' if reverse else '▲'
+                    text = f"{text} {arrow}{position + 1 if len(self.module_sort) > 1 else ''}"
+                    break
+            self.modules_tree.heading(col, text=text)
+    
+    def show_module_context_menu(self, event):
+        """Show context menu for a module item"""
+        item = self.modules_tree.identify_row(event.y)
+        if item:
+            # Select the item that was right-clicked, keeping a multi-selection it is part of
+            if item not in self.modules_tree.selection():
+                self.modules_tree.selection_set(item)
+            self.module_context_menu.post(event.x_root, event.y_root)
+    
+    def copy_module_info(self, column):
+        """Copy the selected module's information to clipboard"""
+        selection = self.modules_tree.selection()
+        if selection:
+            item = selection[0]
+            info = self.modules_tree.item(item, 'values')[{'name': 0, 'version': 1, 'path': 3}[column]]
+            self.root.clipboard_clear()
+            self.root.clipboard_append(info)
+    
+    def show_module_details_context(self, event=None):
+        """Show details for the selected module (context menu version)"""
+        selection = self.modules_tree.selection()
+        if selection:
+            self.show_module_details(item=selection[0])
+    
+    def get_module_key(self, item):
+        """Return the (name, version, path) that identifies a module row"""
+        values = self.modules_tree.item(item, 'values')
+        return values[0], values[1], values[3]
+    
+    def schedule_module_prefetch(self, event=None):
+        """Prefetch once the selection settles, so scrolling through the list doesn't start PowerShell per row"""
+        if self.module_prefetch_job:
+            self.root.after_cancel(self.module_prefetch_job)
+        self.module_prefetch_job = self.root.after(300, self.prefetch_module_details)
+    
+    def prefetch_module_details(self, event=None, radius=2):
+        """Fetch details for the selected module and its neighbours in the background"""
+        self.module_prefetch_job = None
+        selection = self.modules_tree.selection()
+        if not selection:
+            return
+        
+        items = [selection[0]]
+        previous_item = next_item = selection[0]
+        for _ in range(radius):
+            previous_item = previous_item and self.modules_tree.prev(previous_item)
+            next_item = next_item and self.modules_tree.next(next_item)
+            items.extend(item for item in (next_item, previous_item) if item)
+        
+        self.module_details.prefetch([self.get_module_key(item) for item in items])
+    
+    def show_module_details(self, event=None, item=None):
+        """Show detailed information for the selected module"""
+        if event:
+            item = self.modules_tree.identify_row(event.y)
+            
+        if not item:
+            selection = self.modules_tree.selection()
+            if not selection:
+                return
+            item = selection[0]
+            
+        # Get module name from selection; the key is kept since a reload may delete the row
+        module_key = self.get_module_key(item)
+        module_name = module_key[0]
+        
+        # Create a new toplevel window for details
+        details_window = tk.Toplevel(self.root)
+        details_window.title(f"Module Details: {module_name}")
+        details_window.geometry("700x500")
+        details_window.minsize(600, 400)
+        
+        # Make the window modal
+        details_window.transient(self.root)
+        details_window.grab_set()
+        
+        # Create main frame
+        main_frame = ttk.Frame(details_window, padding=10)
+        main_frame.pack(fill='both', expand=True)
+        
+        # Start fetching detailed information about the module
+        info_frame = ttk.LabelFrame(main_frame, text="Module Information")
+        info_frame.pack(fill='both', expand=True, pady=(0, 10))
+        
+        # Function to fill the window with module details
+        def update_module_details_ui(details):
+            if not details_window.winfo_exists():
+                return
+            if loading_label:
+                loading_label.destroy()
+            
+            module_info, commands_info = details if details else ({"Error": "Unable to retrieve module details"}, [])
+            
+            # Create a notebook for details tabs
+            details_notebook = ttk.Notebook(info_frame)
+            details_notebook.pack(fill='both', expand=True, padx=5, pady=5)
+            
+            # General tab
+            general_tab = ttk.Frame(details_notebook)
+            details_notebook.add(general_tab, text="General")
+            
+            # Properties tab
+            props_tab = ttk.Frame(details_notebook)
+            details_notebook.add(props_tab, text="Properties")
+            
+            # Commands tab
+            commands_tab = ttk.Frame(details_notebook)
+            details_notebook.add(commands_tab, text="Commands")
+            
+            # Dependencies tab
+            dependencies_tab = ttk.Frame(details_notebook)
+            details_notebook.add(dependencies_tab, text="Dependencies")
+            self.fill_module_dependencies(dependencies_tab, *module_key[:2])
+            
+            # Fill general tab with basic information
+            row = 0
+            for label, key in [
+                ("Name:", "Name"),
+                ("Version:", "Version"),
+                ("Description:", "Description"),
+                ("Author:", "Author"),
+                ("Company:", "CompanyName"),
+                ("Copyright:", "Copyright"),
+                ("Path:", "Path"),
+            ]:
+                ttk.Label(general_tab, text=label, font=('TkDefaultFont', 10, 'bold')).grid(
+                    row=row, column=0, sticky='nw', padx=(10, 5), pady=5)
+                value = module_info.get(key, "N/A")
+                if key == "Description" and value != "N/A":
+                    desc_text = tk.Text(general_tab, wrap='word', height=4, width=50)
+                    desc_text.insert('1.0', value)
+                    desc_text.configure(state='disabled')
+                    desc_text.grid(row=row, column=1, sticky='nw', padx=5, pady=5)
+                else:
+                    ttk.Label(general_tab, text=value, wraplength=400).grid(
+                        row=row, column=1, sticky='nw', padx=5, pady=5)
+                row += 1
+            
+            def open_url(url):
+                import webbrowser
+                webbrowser.open(url)
+            
+            # Fill properties tab with additional information
+            row = 0
+            for label, key in [
+                ("PowerShell Version:", "PowerShellVersion"),
+                ("Compatible PS Editions:", "CompatiblePSEditions"),
+                ("Tags:", "PrivateData.PSData.Tags"),
+                ("License URI:", "PrivateData.PSData.LicenseUri"),
+                ("Project URI:", "PrivateData.PSData.ProjectUri"),
+                ("Release Notes:", "PrivateData.PSData.ReleaseNotes"),
+            ]:
+                ttk.Label(props_tab, text=label, font=('TkDefaultFont', 10, 'bold')).grid(
+                    row=row, column=0, sticky='nw', padx=(10, 5), pady=5)
+                
+                # Handle nested properties
+                if "." in key:
+                    parts = key.split(".")
+                    value = module_info
+                    try:
+                        for part in parts:
+                            if isinstance(value, dict) and part in value:
+                                value = value[part]
+                            else:
+                                value = "N/A"
+                                break
+                    except:
+                        value = "N/A"
+                else:
+                    value = module_info.get(key, "N/A")
+                
+                # Format list values
+                if isinstance(value, list):
+                    value = ", ".join(str(item) for item in value)
+                
+                # Format special values
+                if key == "PrivateData.PSData.ProjectUri" and value != "N/A":
+                    link_frame = ttk.Frame(props_tab)
+                    link_frame.grid(row=row, column=1, sticky='nw', padx=5, pady=5)
+                    
+                    link_text = ttk.Label(link_frame, text=value, foreground="blue", cursor="hand2")
+                    link_text.pack(side='left')
+                    link_text.bind("<Button-1>", lambda e, url=value: open_url(url))
+                else:
+                    ttk.Label(props_tab, text=str(value), wraplength=400).grid(
+                        row=row, column=1, sticky='nw', padx=5, pady=5)
+                row += 1
+            
+            # Fill commands tab with command list
+            if commands_info:
+                # Create a treeview for commands
+                cmd_columns = ('name', 'type', 'version')
+                cmd_tree = ttk.Treeview(commands_tab, columns=cmd_columns, show='headings')
+                cmd_tree.pack(side='left', fill='both', expand=True, padx=5, pady=5)
+                
+                # Add scrollbar
+                cmd_scroll = ttk.Scrollbar(commands_tab, orient='vertical', command=cmd_tree.yview)
+                cmd_scroll.pack(side='right', fill='y')
+                cmd_tree.configure(yscrollcommand=cmd_scroll.set)
+                
+                # Configure columns
+                cmd_tree.heading('name', text='Command Name')
+                cmd_tree.heading('type', text='Type')
+                cmd_tree.heading('version', text='Version')
+                
+                cmd_tree.column('name', width=250)
+                cmd_tree.column('type', width=100)
+                cmd_tree.column('version', width=80)
+                
+                # Add commands to the tree
+                for cmd in commands_info:
+                    cmd_tree.insert('', 'end', values=(
+                        cmd.get('Name', 'N/A'),
+                        cmd.get('CommandType', 'N/A'),
+                        cmd.get('Version', 'N/A')
+                    ))
+            else:
+                ttk.Label(commands_tab, text="No commands found or unable to retrieve command information").pack(pady=20)
+        
+        # Show cached details right away, otherwise fetch them ahead of any prefetching
+        details = self.module_details.get(*module_key)
+        if details is not None:
+            loading_label = None
+            update_module_details_ui(details)
+        else:
+            loading_label = ttk.Label(info_frame, text="Loading module details...")
+            loading_label.pack(pady=20)
+            self.module_details.request(
+                *module_key,
+                callback=lambda details: self.dispatcher.post(lambda: update_module_details_ui(details)))
+        
+        # Close button
+        close_button = ttk.Button(main_frame, text="Close", command=details_window.destroy)
+        close_button.pack(side='right', pady=(5, 0))
+        
+        # Center the window on the screen
+        details_window.update_idletasks()
+        width = details_window.winfo_width()
+        height = details_window.winfo_height()
+        x = (details_window.winfo_screenwidth() // 2) - (width // 2)
+        y = (details_window.winfo_screenheight() // 2) - (height // 2)
+        details_window.geometry('{}x{}+{}+{}'.format(width, height, x, y))
+    
+    def get_selected_modules(self):
+        """Return (name, version) for every selected module row"""
+        return [(self.modules_tree.set(item, 'name'), self.modules_tree.set(item, 'version'))
+                for item in self.modules_tree.selection()]
+    
+    def fill_module_dependencies(self, parent, name, version):
+        """Show what a module requires, what requires it and what breaks if it is uninstalled"""
+        if not self.module_graph.ready:
+            ttk.Label(parent, text="Dependency analysis is still running").pack(pady=20)
+            return
+        
+        def format_requirement(requirement):
+            constraints = []
+            if requirement['required_version']:
+                constraints.append(f"= {requirement['required_version']}")
+            if requirement['min_version']:
+                constraints.append(f">= {requirement['min_version']}")
+            if requirement['max_version']:
+                constraints.append(f"<= {requirement['max_version']}")
+            installed = ', '.join(self.module_graph.modules.get(requirement['name'].lower(), {})) or 'not installed'
+            return f"{requirement['name']} {' '.join(constraints)}".strip() + f"  (installed: {installed})"
+        
+        sections = [
+            ("Requires:", [format_requirement(r) for r in self.module_graph.requires(name, version)]),
+            ("Required by:", [f"{n} {v}" for n, v in self.module_graph.required_by(name)]),
+            ("Breaks if this version is uninstalled:",
+             [f"{n} {v}" for n, v in self.module_graph.breaks_if_uninstalled(name, version)]),
+        ]
+        for row, (label, lines) in enumerate(sections):
+            ttk.Label(parent, text=label, font=('TkDefaultFont', 10, 'bold')).grid(
+                row=row, column=0, sticky='nw', padx=(10, 5), pady=5)
+            ttk.Label(parent, text='\n'.join(lines) or "None", wraplength=400, justify='left').grid(
+                row=row, column=1, sticky='nw', padx=5, pady=5)
+    
+    def start_dependency_analysis(self):
+        """Rebuild the module dependency graph in the background"""
+        modules = [self.get_module_key(item) for item in self.module_rows]
+        # A newer module list supersedes a build still running
+        token = self.dependency_builds.start()
+        threading.Thread(target=self.module_graph.build, args=(modules, token), daemon=True).start()
+    
+    def update_module(self):
+        """Queue updates of the selected PowerShell modules"""
+        modules = self.get_selected_modules()
+        if not modules:
+            return
+        
+        # Several versions of a module may be selected; it is only updated once
+        modules = list({name: (name, version) for name, version in modules}.values())
+        
+        # Confirm update
+        names = modules[0][0] if len(modules) == 1 else f"{len(modules)} modules"
+        if not messagebox.askyesno("Update Module", f"Are you sure you want to update {names}?"):
+            return
+        
+        self.module_jobs.submit(UPDATE, modules)
+    
+    def uninstall_module(self):
+        """Queue uninstalls of the selected PowerShell modules"""
+        modules = self.get_selected_modules()
+        if not modules:
+            return
+        
+        # Warn about installed modules that would be left without a required module
+        broken = []
+        if self.module_graph.ready:
+            for name, version in modules:
+                broken.extend(f"{n} {v}" for n, v in self.module_graph.breaks_if_uninstalled(name, version)
+                              if (n, v) not in modules)
+        warning = ""
+        if broken:
+            warning = "These modules depend on it and will break:\n" + "\n".join(sorted(set(broken))[:15]) + "\n\n"
+        
+        # Confirm uninstall
+        names = f"the module '{modules[0][0]}'" if len(modules) == 1 else f"{len(modules)} modules"
+        if not messagebox.askyesno("Uninstall Module", 
+                                  f"Are you sure you want to uninstall {names}?\n\n" + warning +
+                                  "This action cannot be undone!",
+                                  icon='warning'):
+            return
+        
+        self.module_jobs.submit(UNINSTALL, modules)
+    
+    def update_module_job_row(self, job):
+        """Show a module job's progress and patch the module's rows once it finishes"""
+        status = job.status
+        if job.error:
+            status += f": {job.error}"
+        elif job.exit_code not in (None, 0):
+            status += f" (exit code {job.exit_code})"
+        duration = f"{job.duration:.1f}s" if job.duration is not None else ""
+        values = (job.name, job.operation.capitalize(), status, duration)
+        
+        item = self.module_job_items.get(job.id)
+        if item and self.module_jobs_tree.exists(item):
+            self.module_jobs_tree.item(item, values=values)
+        elif job.id not in self.module_job_items:
+            self.module_job_items[job.id] = self.module_jobs_tree.insert('', 'end', values=values)
+        
+        if job.finished and job.modules is not None:
+            self.replace_module_rows(job.name, job.modules)
+        
+        # Keep the overall progress in the status line
+        jobs = self.module_jobs.jobs
+        active = [j for j in jobs if not j.finished]
+        if active:
+            self.modules_status_var.set(f"Module jobs: {len(jobs) - len(active)}/{len(jobs)} done")
+        elif job.finished:
+            self.modules_status_var.set(f"Module jobs finished: {len(jobs)}")
+    
+    def cancel_selected_module_jobs(self):
+        """Cancel the jobs selected in the module jobs list"""
+        selected = set(self.module_jobs_tree.selection())
+        for job in self.module_jobs.jobs:
+            if self.module_job_items.get(job.id) in selected and not job.finished:
+                self.module_jobs.cancel(job)
+    
+    def clear_finished_module_jobs(self):
+        self.module_jobs.clear_finished()
+        active = {job.id for job in self.module_jobs.jobs}
+        for job_id, item in list(self.module_job_items.items()):
+            if job_id not in active:
+                self.module_jobs_tree.delete(item)
+                del self.module_job_items[job_id]
+    
+    def module_row_values(self, module):
+        """Return the modules_tree values for a module dict from Get-Module"""
+        # Get repository source if available
+        repo = "N/A"
+        if isinstance(module.get('RepositorySourceLocation'), str):
+            repo = module.get('RepositorySourceLocation')
+        elif isinstance(module.get('RepositorySourceLocation'), dict) and 'Location' in module['RepositorySourceLocation']:
+            repo = module['RepositorySourceLocation']['Location']
+        
+        name = module.get('Name', 'N/A')
+        return (
+            name,
+            format_version(module.get('Version')),
+            module.get('Description', 'N/A'),
+            module.get('Path', 'N/A'),
+            repo,
+            self.module_latest.get(name) or ''
+        )
+    
+    def replace_module_rows(self, name, modules):
+        """Replace the rows of one module with freshly listed versions, leaving other rows alone"""
+        old_items = self.module_items.pop(name, [])
+        position = 'end'
+        if old_items and self.modules_tree.exists(old_items[0]) and self.modules_tree.parent(old_items[0]) == '':
+            position = self.modules_tree.index(old_items[0])
+        
+        new_items = []
+        for module in modules:
+            if module.get('Name', 'N/A') != name:
+                continue
+            values = self.module_row_values(module)
+            item = self.modules_tree.insert('', position, values=values)
+            self.module_sort_keys[item] = self.make_module_sort_keys(values)
+            if position != 'end':
+                position += 1
+            new_items.append(item)
+        
+        for item in old_items:
+            self.module_sort_keys.pop(item, None)
+            if self.modules_tree.exists(item):
+                self.modules_tree.delete(item)
+        
+        # Keep the row list in order for filtering
+        index = self.module_rows.index(old_items[0]) if old_items and old_items[0] in self.module_rows else len(self.module_rows)
+        self.module_rows = [item for item in self.module_rows if item not in old_items]
+        self.module_rows[index:index] = new_items
+        if new_items:
+            self.module_items[name] = new_items
+        else:
+            self.module_items.pop(name, None)
+        self.mark_module_update(name, self.module_latest.get(name))
+        self.start_dependency_analysis()
+        self.modules_status_var.set(f"Total modules: {len(self.module_rows)}")
+        if self.module_sort:
+            self.apply_module_sort()
+        if self.module_filter_var.get():
+            self.filter_modules()
+    
+    def load_modules(self):
+        """Load PowerShell modules in a background thread"""
+        # Clear the current modules list
+        self.clear_module_rows()
+        
+        # Update status
+        self.modules_status_var.set("Loading modules...")
+        
+        # Kill the PowerShell process of a load that is still running
+        token = self.module_loads.start()
+        
+        def get_modules_thread():
+            try:
+                # Get installed modules
+                modules = list_modules(token=token)
+            except TaskCancelled:
+                return
+            except Exception as e:
+                # Update status with error
+                error = str(e)
+                self.dispatcher.post(lambda: self.modules_status_var.set(f"Error loading modules: {error}")
+                                     if self.module_loads.is_current(token) else None)
+                return
+            
+            # Update UI in the main thread, unless a newer load has started meanwhile
+            self.dispatcher.post(lambda: self.update_modules_ui(modules)
+                                 if self.module_loads.is_current(token) else None)
+        
+        # Start a thread to fetch modules
+        threading.Thread(target=get_modules_thread, daemon=True).start()
+    
+    def clear_module_rows(self):
+        """Remove every module row, including rows hidden by the filter"""
+        for item in set(self.modules_tree.get_children()) | set(self.module_rows):
+            self.modules_tree.delete(item)
+        self.module_rows = []
+        self.module_items = {}
+        self.module_sort_keys = {}
+    
+    @timed('tk.update_modules')
+    def update_modules_ui(self, modules):
+        """Update the modules UI with the loaded modules"""
+        # Clear existing items
+        self.clear_module_rows()
+        
+        # Add modules to the treeview
+        for module in modules:
+            values = self.module_row_values(module)
+            item = self.modules_tree.insert('', 'end', values=values)
+            self.module_rows.append(item)
+            self.module_items.setdefault(values[0], []).append(item)
+            self.module_sort_keys[item] = self.make_module_sort_keys(values)
+        
+        # Keep the results of the last update check and the sort order
+        for name, latest in self.module_latest.items():
+            self.mark_module_update(name, latest)
+        if self.module_sort:
+            self.apply_module_sort()
+        
+        # Forget cached details of modules that are gone
+        self.module_details.prune([self.get_module_key(item) for item in self.module_rows])
+        self.start_dependency_analysis()
+        
+        # Update status
+        count = len(modules)
+        self.modules_status_var.set(f"Total modules: {count}")
+        
+        # Apply any active filter
+        self.filter_modules()
+    
+    @timed('tk.filter_modules')
+    def filter_modules(self):
+        """Filter modules based on the search text"""
+        search_term = self.module_filter_var.get().lower()
+        
+        # Show all items if search is empty
+        if not search_term:
+            for item in self.module_rows:
+                self.modules_tree.detach(item)
+                self.modules_tree.reattach(item, '', 'end')
+            return
+        
+        # Filter items, including rows hidden by an earlier filter
+        visible_count = 0
+        for item in self.module_rows:
+            values = self.modules_tree.item(item, 'values')
+            if (search_term in values[0].lower() or  # Name
+                search_term in values[1].lower() or  # Version
+                search_term in values[2].lower()):   # Description
+                self.modules_tree.detach(item)
+                self.modules_tree.reattach(item, '', 'end')
+                visible_count += 1
+            else:
+                self.modules_tree.detach(item)
+        
+        # Update status with filter info
+        self.modules_status_var.set(f"Showing {visible_count} modules (filtered)")
+    
+    def check_module_updates(self):
+        """Look up the latest version of every installed module on the repository feed"""
+        from module_updates import check_updates, make_feed
+        
+        modules = [(name, self.modules_tree.set(item, 'version'))
+                   for name, items in self.module_items.items() for item in items]
+        if not modules:
+            return
+        
+        self.check_updates_btn.configure(state='disabled')
+        total = len({name for name, _ in modules})
+        progress = {'done': 0, 'outdated': 0}
+        
+        def on_result(name, latest, outdated):
+            def apply():
+                progress['done'] += 1
+                progress['outdated'] += 1 if outdated else 0
+                self.module_latest[name] = latest
+                self.mark_module_update(name, latest)
+                self.modules_status_var.set(f"Checking for updates: {progress['done']}/{total}")
+            self.dispatcher.post(apply)
+        
+        def check_thread():
+            error = None
+            try:
+                check_updates(modules, make_feed(self.app_data.module_feed), on_result=on_result)
+            except Exception as e:
+                error = e
+            
+            # Queued after every result, so the counts are final by the time it runs
+            def finish():
+                self.check_updates_btn.configure(state='normal')
+                if error:
+                    self.modules_status_var.set(f"Error checking for updates: {error}")
+                else:
+                    self.modules_status_var.set(f"{progress['outdated']} module(s) have updates available")
+            self.dispatcher.post(finish)
+        
+        self.modules_status_var.set(f"Checking for updates: 0/{total}")
+        threading.Thread(target=check_thread, daemon=True).start()
+    
+    def mark_module_update(self, name, latest):
+        """Show the latest available version of a module and highlight it if outdated.
+        
+        Only the highest installed version is compared, like check_updates does, so older
+        versions installed side by side aren't flagged when the newest one is current.
+        """
+        items = self.module_items.get(name, [])
+        newest = max(items, key=lambda item: self.module_sort_keys[item]['version'], default=None)
+        for item in items:
+            outdated = (item == newest and latest is not None
+                        and parse_version(latest) > self.module_sort_keys[item]['version'])
+            self.modules_tree.set(item, 'latest', latest or '')
+            self.module_sort_keys[item]['latest'] = parse_version(latest or '')
+            self.modules_tree.item(item, tags=('outdated',) if outdated else ())
+        
+    def setup_folders_tab(self):
+        # Create main frame for settings
+        settings_frame = ttk.Frame(self.folders_tab)
+        settings_frame.pack(expand=True, fill='both', padx=5, pady=5)
+        
+        # Create frame for folder management
+        folder_frame = ttk.LabelFrame(settings_frame, text="PowerShell Script Folders")
+        folder_frame.pack(side='top', fill='both', expand=True, pady=(5, 5), padx=5)
+        
+        # Create button frame at the top
+        button_frame = ttk.Frame(folder_frame)
+        button_frame.pack(side='top', fill='x', pady=5)
+        
+        # Remove folder button with icon (first to appear rightmost)
+        remove_btn = ttk.Button(button_frame, text="Remove Selected", image=self.get_icon('folder_remove'), 
+                               compound=tk.LEFT, command=self.remove_folder)
+        remove_btn.pack(side='right', padx=(5,10))
+        
+        # Add folder button with icon (second to appear, to the left of remove button)
+        add_btn = ttk.Button(button_frame, text="Add Folder", image=self.get_icon('folder_add'), 
+                            compound=tk.LEFT, command=self.add_folder)
+        add_btn.pack(side='right')
+        
+        # Create listbox for folders
+        self.folder_listbox = tk.Listbox(folder_frame, selectmode=tk.SINGLE)
+        self.folder_listbox.pack(side='left', expand=True, fill='both', pady=(5,0))
+        
+        # Add right-click context menu to folder listbox
+        self.folder_context_menu = tk.Menu(self.folder_listbox, tearoff=0)
+        self.folder_context_menu.add_command(label="Remove Selected Folder", 
+                                          command=self.remove_folder)
+        self.folder_context_menu.add_command(label="Open Folder Location", 
+                                          command=self.open_folder_location)
+        self.folder_listbox.bind("<Button-3>", self.show_folder_context_menu)
+        
+        # Load saved folders
+        self.refresh_folder_list()
+        
+        # Create frame for script execution settings
+        execution_frame = ttk.LabelFrame(settings_frame, text="Script Execution")
+        execution_frame.pack(side='top', fill='x', pady=(5, 5), padx=5)
+        
+        ttk.Label(execution_frame, text="Maximum concurrent runs:").pack(side='left', padx=(10, 5), pady=10)
+        self.max_runs_var = tk.StringVar(value=str(self.app_data.max_concurrent_runs))
+        
+        def on_max_runs_change(*args):
+            try:
+                count = int(self.max_runs_var.get())
+            except ValueError:
+                return
+            if count >= 1:
+                self.app_data.set_max_concurrent_runs(count)
+                self.execution_manager.set_max_concurrent(count)
+        
+        self.max_runs_var.trace_add('write', on_max_runs_change)
+        ttk.Spinbox(execution_frame, from_=1, to=64, width=5, textvariable=self.max_runs_var).pack(side='left', pady=10)
+        
+        # Fast run keeps pre-warmed PowerShell hosts (started with -NoProfile) ready
+        fast_run_frame = ttk.LabelFrame(settings_frame, text="Fast Run")
+        fast_run_frame.pack(side='top', fill='x', pady=(5, 5), padx=5)
+        
+        self.fast_run_var = tk.BooleanVar(value=self.app_data.fast_run)
+        ttk.Checkbutton(fast_run_frame, text="Run scripts in pre-warmed PowerShell hosts (profile is not loaded)",
+                        variable=self.fast_run_var).grid(row=0, column=0, columnspan=2, sticky='w', padx=10, pady=(10, 5))
+        
+        ttk.Label(fast_run_frame, text="Warm hosts:").grid(row=1, column=0, sticky='w', padx=(10, 5), pady=2)
+        self.fast_run_hosts_var = tk.StringVar(value=str(self.app_data.fast_run_hosts))
+        ttk.Spinbox(fast_run_frame, from_=1, to=8, width=5,
+                    textvariable=self.fast_run_hosts_var).grid(row=1, column=1, sticky='w', pady=2)
+        
+        ttk.Label(fast_run_frame, text="Preload modules:").grid(row=2, column=0, sticky='w', padx=(10, 5), pady=2)
+        self.preload_modules_var = tk.StringVar(value=', '.join(self.app_data.preload_modules))
+        ttk.Entry(fast_run_frame, textvariable=self.preload_modules_var, width=40).grid(row=2, column=1, sticky='w', pady=2)
+        
+        ttk.Button(fast_run_frame, text="Apply", command=self.apply_fast_run_settings).grid(
+            row=3, column=1, sticky='e', padx=10, pady=(5, 10))
+        
+        # Repository used to check installed modules for updates
+        feed_frame = ttk.LabelFrame(settings_frame, text="Module Updates")
+        feed_frame.pack(side='top', fill='x', pady=(5, 5), padx=5)
+        
+        ttk.Label(feed_frame, text="Repository feed (URL or folder of .nupkg files, empty for PowerShell Gallery):").pack(
+            side='top', anchor='w', padx=10, pady=(10, 2))
+        self.module_feed_var = tk.StringVar(value=self.app_data.module_feed)
+        ttk.Entry(feed_frame, textvariable=self.module_feed_var, width=60).pack(side='left', padx=(10, 5), pady=(0, 10))
+        ttk.Button(feed_frame, text="Apply",
+                   command=lambda: self.app_data.set_module_feed(self.module_feed_var.get())).pack(side='left', pady=(0, 10))
+        
+        # Show how long the last launch took until the window was interactive
+        startup_text = f"Startup time: {self.startup_ms:.0f} ms" if hasattr(self, 'startup_ms') else ""
+        self.startup_time_var = tk.StringVar(value=startup_text)
+        ttk.Label(settings_frame, textvariable=self.startup_time_var).pack(side='left', padx=10, pady=(0, 5))
+        
+    def apply_fast_run_settings(self):
+        """Save the fast run settings and restart the warm hosts"""
+        try:
+            hosts = max(1, int(self.fast_run_hosts_var.get()))
+        except ValueError:
+            hosts = 1
+        modules = [name.strip() for name in self.preload_modules_var.get().split(',') if name.strip()]
+        self.app_data.set_fast_run(self.fast_run_var.get(), hosts, modules)
+        
+        if self.app_data.fast_run:
+            self.execution_manager.enable_fast_run(hosts, modules, on_failure=self.on_warm_host_failed)
+        else:
+            self.execution_manager.disable_fast_run()
+    
+    def on_warm_host_failed(self, error):
+        """Tell the user fast run isn't working instead of silently running scripts normally"""
+        self.dispatcher.post(lambda: self.show_notification(
+            "Fast Run Unavailable",
+            f"A warm PowerShell host could not be started ({error}); scripts run in normal processes."))
+        
+    def add_folder(self):
+        from tkinter import filedialog
+        folder_path = filedialog.askdirectory(title="Select Folder")
+        if folder_path:
+            self.app_data.add_folder(folder_path)
+            self.refresh_folder_list()
+            self.refresh_script_list()
+            
+    def remove_folder(self):
+        selection = self.folder_listbox.curselection()
+        if selection:
+            # Get the actual folder path from our stored list
+            index = selection[0]
+            if index < len(self.folder_paths):
+                folder_path = self.folder_paths[index]
+                
+                # Count scripts in this folder before removing
+                script_count = 0
+                if os.path.exists(folder_path):
+                    for root, _, files in os.walk(folder_path):
+                        script_count += sum(1 for file in files if file.endswith('.ps1'))
+                
+                # Remove the folder
+                self.app_data.remove_folder(folder_path)
+                self.refresh_folder_list()
+                # Refresh script list without showing notification
+                self.refresh_script_list(suppress_notification=True)
+                
+                # Show notification
+                self.show_notification("Folder Removed", f"Removed: {folder_path}\n{script_count} script(s) will no longer be included")
+            
+    @timed('tk.refresh_folders')
+    def refresh_folder_list(self):
+        self.folder_listbox.delete(0, tk.END)
+        
+        # Store folder paths for reference (needed for context menu actions)
+        self.folder_paths = []
+        
+        for folder in self.app_data.folders:
+            # Count scripts in this folder
+            script_count = 0
+            if os.path.exists(folder):
+                for root, _, files in os.walk(folder):
+                    script_count += sum(1 for file in files if file.endswith('.ps1'))
+            
+            # Display folder with script count
+            display_text = f"{folder} ({script_count} scripts)"
+            self.folder_listbox.insert(tk.END, display_text)
+            
+            # Store original path for later use
+            self.folder_paths.append(folder)
+            
+    def on_tree_click(self, event):
+        tree = event.widget
+        item = tree.identify('item', event.x, event.y)
+        if not item:
+            return
+            
+        column = tree.identify_column(event.x)
+        values = tree.item(item)['values']
+        
+        if not values or len(values) < 2:
+            return
+            
+        # Clear selection in the other tree view
+        other_tree = self.scripts_tree if tree == self.favorites_tree else self.favorites_tree
+        other_tree.selection_remove(*other_tree.selection())
+            
+        script_name = str(values[1])
+        script_path = self.item_paths.get((tree, item))
+        if not script_path:
+            return
+        
+        if column == '#1':  # Favorite column
+            self.app_data.toggle_favorite(script_path)
+            self.repaint_script_trees()
+        else:  # Script name column - show preview
+            try:
+                with open(script_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                    self.preview_text.configure(state='normal')
+                    self.preview_text.delete(1.0, tk.END)
+                    self.preview_text.insert(tk.END, content)
+                    self.preview_text.configure(state='disabled')
+                    # Update preview label with script name
+                    self.preview_label_frame.configure(text=f"Preview: {script_name}")
+                    # Show action buttons
+                    self.show_action_buttons(True)
+            except Exception as e:
+                messagebox.showerror("Error", f"Could not read script: {e}")
+                self.preview_label_frame.configure(text="Script Preview")
+                # Hide action buttons on error
+                self.show_action_buttons(False)
+
+    def load_ui_snapshot(self):
+        """Fill the script lists from the last session's snapshot. Returns False if there is none."""
+        scripts = self.ui_snapshot.get_scripts(self.app_data.favorites)
+        if not scripts:
+            return False
+        
+        self.populate_script_trees(scripts)
+        self.restore_script_selection(self.ui_snapshot.selection)
+        return True
+    
+    def restore_script_selection(self, script_path):
+        """Select a script in the scripts tree again, e.g. after the lists were rebuilt"""
+        item = self.script_items.get(script_path)
+        if item:
+            self.scripts_tree.selection_set(item)
+            self.scripts_tree.see(item)
+    
+    def repaint_script_trees(self):
+        """Rebuild the lists from the scripts already shown, e.g. after a favorite was toggled"""
+        selection = self.get_selected_script_path()
+        self.populate_script_trees(self.script_records)
+        self.restore_script_selection(selection)
+    
+    def load_cached_script_list(self):
+        """Fill the script lists from the script index without scanning. Returns False if the index is empty."""
+        scripts = []
+        for path in self.script_index.paths():
+            for folder in self.app_data.folders:
+                if os.path.normcase(path).startswith(os.path.normcase(os.path.join(folder, ''))):
+                    scripts.append(ScriptRecord(path, folder, self.app_data.favorites))
+                    break
+        if not scripts:
+            return False
+        
+        scripts.sort(key=lambda x: x.name.lower())
+        self.populate_script_trees(scripts)
+        return True
+    
+    @timed('tk.populate_scripts')
+    def populate_script_trees(self, scripts):
+        """Replace the contents of the favorites and scripts trees"""
+        for tree in [self.favorites_tree, self.scripts_tree]:
+            for item in tree.get_children():
+                tree.delete(item)
+        
+        self.script_items = {}
+        self.item_paths = {}
+        run_stats = self.run_history.stats()
+        for script in scripts:
+            is_favorite = script.is_favorite
+            heart = '♥' if is_favorite else '♡'
+            values = (heart, script.name)
+            
+            # Add to appropriate tree(s)
+            if is_favorite:
+                item = self.favorites_tree.insert('', 'end', values=values)
+                self.item_paths[(self.favorites_tree, item)] = script.full_path
+            
+            # Always add to main script tree, with any cached metadata
+            metadata_values = self.format_script_metadata(self.script_index.get(script.full_path))
+            history_values = self.format_run_stats(run_stats.get(script.full_path))
+            item = self.scripts_tree.insert('', 'end', values=values + metadata_values + history_values)
+            self.script_items[script.full_path] = item
+            self.item_paths[(self.scripts_tree, item)] = script.full_path
+        
+        # Tell RPC subscribers which scripts appeared or disappeared
+        if self.rpc_server:
+            old_paths = {script.full_path for script in self.script_records}
+            new_paths = {script.full_path for script in scripts}
+            if old_paths != new_paths:
+                self.rpc_server.publish('scripts_changed', {
+                    'added': sorted(new_paths - old_paths),
+                    'removed': sorted(old_paths - new_paths)
+                })
+        self.script_records = list(scripts)
+    
+    def save_ui_snapshot(self):
+        """Remember the scripts shown so the next startup can paint them before scanning.
+        
+        Saved after a completed folder scan and on exit, not on every repaint.
+        """
+        self.ui_snapshot.store_scripts(self.script_records)
+        self.ui_snapshot.selection = self.get_selected_script_path() or self.ui_snapshot.selection
+        self.ui_snapshot.save()
+    
+    def start_background_rescan(self):
+        """Scan the script folders on a worker thread and reconcile the lists with the result"""
+        # Scripts painted from the snapshot or index, to tell what changed since last session
+        shown_paths = set(self.script_items) if self.script_items else None
+        token = self.script_scans.start()
+        
+        def scan_thread():
+            try:
+                scripts = self.app_data.get_all_powershell_scripts()
+            except Exception as e:
+                print(f"Error scanning script folders: {e}")
+                return
+            # A manual refresh may have replaced the lists while scanning
+            self.dispatcher.post(lambda: self.apply_background_rescan(scripts, shown_paths)
+                                 if self.script_scans.is_current(token) else None)
+        
+        threading.Thread(target=scan_thread, daemon=True).start()
+    
+    def apply_background_rescan(self, scripts, shown_paths):
+        """Bring the lists painted at startup in line with a fresh scan"""
+        scripts.sort(key=lambda x: x.name.lower())
+        scanned = [(script.full_path, script.is_favorite) for script in scripts]
+        shown = [(script.full_path, script.is_favorite) for script in self.script_records]
+        
+        # Only rebuild the trees if something actually changed, keeping the selection
+        if scanned != shown or shown_paths is None:
+            selection = self.get_selected_script_path() or self.ui_snapshot.selection
+            self.populate_script_trees(scripts)
+            self.restore_script_selection(selection)
+        self.save_ui_snapshot()
+        
+        current_count = len(scripts)
+        last_count = self.app_data.last_script_count
+        self.app_data.update_script_count(current_count)
+        self.start_metadata_extraction([script.full_path for script in scripts])
+        
+        if self.startup_request:
+            self.activate(**self.startup_request)
+            self.startup_request = None
+        
+        if shown_paths is not None:
+            scanned_paths = {script.full_path for script in scripts}
+            new_count = len(scanned_paths - shown_paths)
+            missing_count = len(shown_paths - scanned_paths)
+        elif last_count > 0:
+            new_count = max(0, current_count - last_count)
+            missing_count = max(0, last_count - current_count)
+        else:
+            return
+        
+        messages = []
+        if new_count:
+            messages.append(f"Found {new_count} new script(s) since last session")
+        if missing_count:
+            messages.append(f"Missing {missing_count} script(s) since last session")
+        msg = "\n".join(messages) or "No changes in scripts since last session"
+        self.show_notification("PowerShell Script Count", msg)
+    
+    def refresh_script_list(self, suppress_notification=False):
+        # This scan supersedes any background rescan still running
+        self.script_scans.start()
+        
+        # Store current script count
+        current_scripts = set()
+        for tree in [self.scripts_tree]:
+            for item in tree.get_children():
+                values = tree.item(item)['values']
+                if values:
+                    current_scripts.add(values[1])  # Store script names
+        
+        # Get and display all scripts
+        scripts = self.app_data.get_all_powershell_scripts()
+        
+        # Sort scripts by name
+        scripts.sort(key=lambda x: x.name.lower())
+        
+        # Keep track of scripts
+        new_scripts = set()
+        current_count = len(scripts)
+        
+        for script in scripts:
+            # Check if this is a new script
+            if script.name not in current_scripts:
+                new_scripts.add(script.name)
+        
+        self.populate_script_trees(scripts)
+        self.save_ui_snapshot()
+        
+        # Update the script count
+        self.app_data.update_script_count(current_count)
+        
+        # Normally applied after the background rescan this refresh replaced
+        if self.startup_request:
+            self.activate(**self.startup_request)
+            self.startup_request = None
+        
+        # Extract metadata for new or modified scripts in the background
+        self.start_metadata_extraction([script.full_path for script in scripts])
+        
+        # Show a notification unless suppressed; changes since the last session
+        # are reported by apply_background_rescan
+        if not suppress_notification:
+            self.show_notification("PowerShell Scan Completed", f"Found {len(new_scripts)} new script(s)" if new_scripts else "No new scripts found")
+        
+    def start_metadata_extraction(self, paths):
+        """Refresh the script index for stale scripts without blocking the UI"""
+        # Stop an extraction for an earlier scan; its finished scripts stay cached
+        token = self.metadata_refreshes.start()
+        
+        def extraction_thread():
+            try:
+                self.script_index.prune(paths)
+                updated = self.script_index.refresh(paths, cancelled=token.cancel_event)
+                if updated and not token.cancelled:
+                    self.dispatcher.post(lambda: self.apply_script_metadata(updated)
+                                         if self.metadata_refreshes.is_current(token) else None)
+            except Exception as e:
+                print(f"Error extracting script metadata: {e}")
+        
+        threading.Thread(target=extraction_thread, daemon=True).start()
+    
+    @timed('tk.apply_metadata')
+    def apply_script_metadata(self, paths):
+        """Update the metadata columns of scripts_tree for the given scripts"""
+        for path in paths:
+            item = self.script_items.get(path)
+            if not item or not self.scripts_tree.exists(item):
+                continue
+            metadata_values = self.format_script_metadata(self.script_index.get(path))
+            for column, value in zip(('Synopsis', 'Parameters', 'Requires'), metadata_values):
+                self.scripts_tree.set(item, column, value)
+    
+    def format_script_metadata(self, metadata):
+        """Return the (synopsis, parameters, requires) column values for a script"""
+        if not metadata:
+            return ('', '', '')
+        params = ', '.join(param['name'] for param in metadata['params'])
+        requires = ', '.join(metadata['requires'])
+        return (metadata['synopsis'], params, requires)
+    
+    def format_run_stats(self, stats):
+        """Return the (last run, p50, p95) column values for a script"""
+        if not stats:
+            return ('', '', '')
+        last_run = time.strftime('%Y-%m-%d %H:%M', time.localtime(stats['last_run']))
+        p50 = '' if stats['p50'] is None else f"{stats['p50']:.1f}s"
+        p95 = '' if stats['p95'] is None else f"{stats['p95']:.1f}s"
+        return (last_run, p50, p95)
+    
+    def apply_run_stats(self, path):
+        """Update the run history columns of a script after it ran"""
+        item = self.script_items.get(path)
+        if not item or not self.scripts_tree.exists(item):
+            return
+        history_values = self.format_run_stats(self.run_history.stats(path).get(path))
+        for column, value in zip(('Last Run', 'p50', 'p95'), history_values):
+            self.scripts_tree.set(item, column, value)
+    
+    def on_scripts_tree_motion(self, event):
+        """Schedule a metadata tooltip for the row under the cursor"""
+        item = self.scripts_tree.identify_row(event.y)
+        if item == self.script_tooltip_item:
+            return
+        
+        self.hide_script_tooltip()
+        self.script_tooltip_item = item
+        if item:
+            self.script_tooltip_job = self.root.after(
+                600, lambda: self.show_script_tooltip(item, event.x_root, event.y_root))
+    
+    def show_script_tooltip(self, item, x, y):
+        """Show comment-based help, parameters and requirements for a script"""
+        self.script_tooltip_job = None
+        path = self.item_paths.get((self.scripts_tree, item))
+        metadata = self.script_index.get(path) if path else None
+        if not metadata:
+            return
+        
+        lines = []
+        if metadata['synopsis']:
+            lines.append(metadata['synopsis'])
+        if metadata['description'] and metadata['description'] != metadata['synopsis']:
+            lines.append(metadata['description'])
+        if metadata['params']:
+            params = []
+            for param in metadata['params']:
+                text = f"[{param['type']}]${param['name']}" if param['type'] else f"${param['name']}"
+                params.append(text + (" (mandatory)" if param['mandatory'] else ""))
+            lines.append("Parameters: " + ', '.join(params))
+        if metadata['requires']:
+            lines.append("Requires: " + '; '.join(metadata['requires']))
+        if metadata['modules']:
+            lines.append("Modules: " + ', '.join(metadata['modules']))
+        if not lines:
+            return
+        
+        self.script_tooltip = tk.Toplevel(self.root)
+        self.script_tooltip.wm_overrideredirect(True)
+        self.script_tooltip.wm_geometry(f"+{x + 15}+{y + 10}")
+        tk.Label(self.script_tooltip, text='\n'.join(lines), justify=tk.LEFT, background="#ffffe0",
+                 relief='solid', borderwidth=1, wraplength=450).pack(ipadx=4, ipady=2)
+    
+    def hide_script_tooltip(self):
+        if self.script_tooltip_job:
+            self.root.after_cancel(self.script_tooltip_job)
+            self.script_tooltip_job = None
+        if self.script_tooltip:
+            self.script_tooltip.destroy()
+            self.script_tooltip = None
+        self.script_tooltip_item = None
+    
+    def setup_system_tray(self):
+        try:
+            from PIL import Image, ImageDraw
+            import pystray
+            from pystray import MenuItem as item
+
+            # Create menu items; pystray calls them from its own thread
+            def create_menu(icon, item):
+                if item == 'show':
+                    self.dispatcher.post(self.show_window)
+                elif item == 'exit':
+                    self.dispatcher.post(self.exit_app)
+
+            # Create system tray icon menu
+            menu = (
+                item('Show', lambda: create_menu(None, 'show')),
+                item('Exit', lambda: create_menu(None, 'exit'))
+            )
+
+            # Create a simple icon (white background with black border)
+            image = Image.new('RGBA', (64, 64), 'white')
+            ImageDraw.Draw(image).rectangle((0, 0, 63, 63), outline=(0, 0, 0, 255))
+
+            # Create system tray icon
+            self.tray = pystray.Icon("PowerShell Script Manager", image, "PowerShell Script Manager", menu)
+            self.tray.run_detached()
+        except ImportError:
+            messagebox.showwarning("Warning", "System tray feature requires 'pillow' and 'pystray' packages. Install them using: pip install pillow pystray")
+    
+    def show_window(self):
+        self.root.deiconify()
+        self.root.state('normal')
+    
+    def hide_window(self):
+        self.root.withdraw()
+    
+    def exit_app(self):
+        if hasattr(self, 'tray') and self.tray:
+            self.tray.stop()
+        self.execution_manager.disable_fast_run()
+        if self.rpc_server:
+            self.rpc_server.close()
+        if self.stall_watchdog:
+            self.stall_watchdog.stop()
+        self.module_loads.cancel()
+        self.metadata_refreshes.cancel()
+        self.dependency_builds.cancel()
+        self.save_ui_snapshot()
+        self.dispatcher.stop()
+        self.root.after(0, self.root.destroy)
+    
+    def start_update_check(self):
+        """Start a background thread to check for PowerShell updates"""
+        import threading
+        
+        def check_updates_thread():
+            # Check Windows PowerShell update status
+            try:
+                win_ps_version = self.probes.run('(Get-Host).Version.ToString()')
+                
+                # Check if Windows PowerShell update is available (PowerShell 5.1 is the latest for Windows PowerShell)
+                current_version = [int(x) for x in win_ps_version.split('.')]
+                if len(current_version) >= 2 and (current_version[0] < 5 or (current_version[0] == 5 and current_version[1] < 1)):
+                    self.powershell_status['Windows PowerShell'] = {'status': 'update_available', 'version': '5.1'}
+                else:
+                    self.powershell_status['Windows PowerShell'] = {'status': 'up_to_date', 'version': win_ps_version}
+            except:
+                self.powershell_status['Windows PowerShell'] = {'status': 'unknown', 'version': 'Unknown'}
+            
+            # Check PowerShell Core update status
+            try:
+                core_ps_version = self.probes.run('(Get-Host).Version.ToString()', executable='pwsh')
+                
+                # Check if PowerShell Core update is available via GitHub API
+                try:
+                    latest_version = self.probes.run("try { $releaseInfo = Invoke-RestMethod -Uri 'https://api.github.com/repos/PowerShell/PowerShell/releases/latest' -TimeoutSec 3; $releaseInfo.tag_name.TrimStart('v') } catch { 'Unknown' }", timeout=5)
+                    
+                    if latest_version != 'Unknown':
+                        current_parts = [int(x) for x in core_ps_version.split('.')]
+                        latest_parts = [int(x) for x in latest_version.split('.')]
+                        
+                        # Compare versions
+                        update_available = False
+                        for i in range(min(len(current_parts), len(latest_parts))):
+                            if latest_parts[i] > current_parts[i]:
+                                update_available = True
+                                break
+                            elif current_parts[i] > latest_parts[i]:
+                                break
+                        
+                        if update_available:
+                            self.powershell_status['PowerShell Core'] = {'status': 'update_available', 'version': latest_version}
+                        else:
+                            self.powershell_status['PowerShell Core'] = {'status': 'up_to_date', 'version': core_ps_version}
+                    else:
+                        self.powershell_status['PowerShell Core'] = {'status': 'unknown', 'version': core_ps_version}
+                except:
+                    self.powershell_status['PowerShell Core'] = {'status': 'unknown', 'version': core_ps_version}
+            except:
+                self.powershell_status['PowerShell Core'] = {'status': 'not_installed', 'version': 'N/A'}
+            
+            # Check PowerShell ISE
+            try:
+                ise_version = self.probes.run("if (Get-Command powershell_ise.exe -ErrorAction SilentlyContinue) { (Get-Host).Version.ToString() } else { 'Not installed' }")
+                
+                if ise_version != 'Not installed':
+                    # ISE version follows Windows PowerShell version
+                    if self.powershell_status.get('Windows PowerShell', {}).get('status') == 'update_available':
+                        self.powershell_status['PowerShell ISE'] = {'status': 'update_available', 'version': '5.1'}
+                    else:
+                        self.powershell_status['PowerShell ISE'] = {'status': 'up_to_date', 'version': ise_version}
+                else:
+                    self.powershell_status['PowerShell ISE'] = {'status': 'not_installed', 'version': 'N/A'}
+            except:
+                self.powershell_status['PowerShell ISE'] = {'status': 'unknown', 'version': 'Unknown'}
+            
+            # Check PowerShell Preview
+            try:
+                preview_version = self.probes.run("if (Get-Command pwsh-preview -ErrorAction SilentlyContinue) { pwsh-preview -Command '(Get-Host).Version.ToString()' } else { 'Not installed' }")
+                
+                if preview_version != 'Not installed':
+                    # Preview versions are typically already the latest
+                    self.powershell_status['PowerShell Preview'] = {'status': 'preview', 'version': preview_version}
+                else:
+                    self.powershell_status['PowerShell Preview'] = {'status': 'not_installed', 'version': 'N/A'}
+            except:
+                self.powershell_status['PowerShell Preview'] = {'status': 'unknown', 'version': 'Unknown'}
+            
+            # Update the UI now that the check is complete
+            self.dispatcher.post(self.update_powershell_ui)
+        
+        # Start the update check in a background thread
+        update_thread = threading.Thread(target=check_updates_thread)
+        update_thread.daemon = True
+        update_thread.start()
+    
+    def update_powershell_ui(self):
+        """Update the PowerShell tab UI with the latest status information"""
+        # Only update if the PowerShell tab has been built, otherwise it picks up
+        # the statuses when it is first shown
+        if str(self.powershell_tab) not in self.pending_tabs and self.powershell_tab.winfo_exists():
+            self.refresh_powershell_tab()
+    
+    def refresh_powershell_tab(self):
+        """Refresh the PowerShell tab with current information"""
+        # Clear the tab
+        for widget in self.powershell_tab.winfo_children():
+            widget.destroy()
+        
+        # Re-setup the tab
+        self.setup_powershell_tab()
+        
+    def get_icon(self, name):
+        """Return the PhotoImage for an icon, loading it from icon_assets on first use"""
+        if name not in self.icons:
+            from icon_assets import ICONS
+            try:
+                self.icons[name] = tk.PhotoImage(data=ICONS[name]) if name in ICONS else None
+            except Exception as e:
+                print(f"Failed to load icon {name}: {e}")
+                self.icons[name] = None
+        return self.icons[name]
+    
+    def run_script_as(self):
+        # Get the currently selected item from either tree
+        selected_script_path = self.get_selected_script_path()
+        
+        if not selected_script_path:
+            messagebox.showinfo("Run As...", "No script selected.")
+            return
+        
+        # Check execution policy before attempting to run
+        # Note: We still allow "Run As..." even with restricted policy as it might be used to change the policy
+        # The policy is probed in the background at startup; don't start PowerShell on the UI thread here
+        if self.check_execution_policy(cached_only=True) is False:
+            response = messagebox.askyesno("Execution Policy Warning", 
+                "PowerShell execution policy is set to restrict script execution. \n\n"
+                "Running as administrator might still work if you change the execution policy.\n\n"
+                "Do you want to continue?")
+            if not response:
+                return
+        
+        try:
+            if sys.platform != 'win32':
+                messagebox.showerror("Error", "Run As Administrator is only supported on Windows.")
+                return
+                
+            # Run PowerShell as administrator through the execution manager so the
+            # exit code and duration are tracked like any other run
+            self.execution_manager.submit_elevated(selected_script_path)
+            self.notebook.select(self.runs_tab)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not run script with admin privileges: {e}")
+
+    def run_script(self, script_path=None):
+        # Run the given script, or the currently selected item from either tree
+        selected_script_path = script_path or self.get_selected_script_path()
+        
+        if not selected_script_path:
+            messagebox.showinfo("Run", "No script selected.")
+            return
+            
+        # Check execution policy before attempting to run, using the answer probed in the background;
+        # if there is none yet the run goes ahead and PowerShell reports a restricted policy itself
+        if self.check_execution_policy(cached_only=True) is False:
+            messagebox.showerror("Execution Policy Error", 
+                "PowerShell execution policy is set to restrict script execution. \n\n"
+                "To change this, open PowerShell as Administrator and run:\n"
+                "Set-ExecutionPolicy -ExecutionPolicy RemoteSigned\n\n"
+                "For more information, see about_Execution_Policies at:\n"
+                "https://go.microsoft.com/fwlink/?LinkID=135170")
+            return
+        
+        try:
+            # Run the script through the execution manager and show its output
+            self.execution_manager.submit(selected_script_path)
+            self.notebook.select(self.runs_tab)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not run script: {e}")
+            
+    def get_selected_script_paths(self):
+        """Return the paths of all scripts selected in either tree, in display order"""
+        for tree in [self.favorites_tree, self.scripts_tree]:
+            selection = tree.selection()
+            if selection:
+                break
+        else:
+            return []
+        
+        paths = []
+        for item in tree.get_children():
+            path = self.item_paths.get((tree, item))
+            if item in selection and path:
+                paths.append(path)
+        return paths
+    
+    def run_selected_scripts(self):
+        """Run all selected scripts as a batch"""
+        paths = self.get_selected_script_paths()
+        if not paths:
+            messagebox.showinfo("Run Selected", "No scripts selected.")
+            return
+        
+        # Check execution policy before attempting to run, using the answer probed in the background;
+        # if there is none yet the run goes ahead and PowerShell reports a restricted policy itself
+        if self.check_execution_policy(cached_only=True) is False:
+            messagebox.showerror("Execution Policy Error", 
+                "PowerShell execution policy is set to restrict script execution. \n\n"
+                "To change this, open PowerShell as Administrator and run:\n"
+                "Set-ExecutionPolicy -ExecutionPolicy RemoteSigned")
+            return
+        
+        self.show_batch_window(paths)
+    
+    def show_batch_window(self, paths):
+        """Let the user order and configure a batch, then show its results grid"""
+        batch_window = tk.Toplevel(self.root)
+        batch_window.title(f"Run Selected Scripts ({len(paths)})")
+        batch_window.geometry("750x500")
+        batch_window.transient(self.root)
+        
+        main_frame = ttk.Frame(batch_window, padding=10)
+        main_frame.pack(fill='both', expand=True)
+        
+        # Options
+        options_frame = ttk.Frame(main_frame)
+        options_frame.pack(fill='x', pady=(0, 10))
+        
+        ttk.Label(options_frame, text="Parallel runs:").pack(side='left', padx=(0, 5))
+        parallelism_var = tk.StringVar(value=str(self.app_data.max_concurrent_runs))
+        parallelism_spin = ttk.Spinbox(options_frame, from_=1, to=64, width=5, textvariable=parallelism_var)
+        parallelism_spin.pack(side='left', padx=(0, 15))
+        
+        sequential_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="Run in order, each after the previous succeeds",
+                        variable=sequential_var).pack(side='left')
+        
+        # Results grid, in run order
+        columns = ('script', 'status', 'exit_code', 'duration', 'output')
+        results_tree = ttk.Treeview(main_frame, columns=columns, show='headings', selectmode='browse')
+        results_tree.pack(fill='both', expand=True)
+        results_tree.heading('script', text='Script')
+        results_tree.heading('status', text='Status')
+        results_tree.heading('exit_code', text='Exit Code')
+        results_tree.heading('duration', text='Duration')
+        results_tree.heading('output', text='Last Output')
+        results_tree.column('script', width=180, stretch=False)
+        results_tree.column('status', width=80, stretch=False)
+        results_tree.column('exit_code', width=70, anchor='center', stretch=False)
+        results_tree.column('duration', width=70, anchor='e', stretch=False)
+        results_tree.column('output', width=300, stretch=True)
+        
+        items = [results_tree.insert('', 'end', values=(os.path.basename(path), 'Pending', '', '', ''))
+                 for path in paths]
+        
+        # Output tail of the selected result
+        tail_text = tk.Text(main_frame, height=6, wrap=tk.NONE, font=('Consolas', 9), state='disabled')
+        tail_text.pack(fill='x', pady=(5, 0))
+        
+        def move_selected(offset):
+            selection = results_tree.selection()
+            if not selection or batch_state.get('batch'):
+                return
+            item = selection[0]
+            index = results_tree.index(item) + offset
+            if 0 <= index < len(items):
+                results_tree.move(item, '', index)
+        
+        batch_state = {}
+        
+        def show_tail(event=None):
+            batch = batch_state.get('batch')
+            selection = results_tree.selection()
+            if not batch or not selection:
+                return
+            batch_item = batch_state['items'].get(selection[0])
+            tail_text.configure(state='normal')
+            tail_text.delete(1.0, tk.END)
+            tail_text.insert(tk.END, batch_item.output_tail() if batch_item else '')
+            tail_text.configure(state='disabled')
+        
+        results_tree.bind('<<TreeviewSelect>>', show_tail)
+        
+        def update_row(batch_item):
+            row = batch_state['rows'][id(batch_item)]
+            if not results_tree.winfo_exists():
+                return
+            exit_code = '' if batch_item.exit_code is None else batch_item.exit_code
+            duration = '' if batch_item.duration is None else f"{batch_item.duration:.1f}s"
+            tail = batch_item.output_tail(1)
+            results_tree.item(row, values=(batch_item.name, batch_item.status.capitalize(), exit_code, duration, tail))
+            if results_tree.selection() == (row,):
+                show_tail()
+            
+            summary = batch_state['batch'].summary()
+            status_var.set(', '.join(f"{count} {status}" for status, count in sorted(summary.items())))
+        
+        def start_batch():
+            try:
+                parallelism = max(1, int(parallelism_var.get()))
+            except ValueError:
+                parallelism = 1
+            
+            # Run in the order shown in the grid
+            ordered_rows = list(results_tree.get_children())
+            ordered_paths = [paths[items.index(row)] for row in ordered_rows]
+            batch = BatchRun(self.execution_manager, ordered_paths, parallelism=parallelism,
+                             sequential=sequential_var.get(),
+                             on_update=lambda batch_item: self.dispatcher.post(lambda: update_row(batch_item), key=batch_item))
+            batch_state['batch'] = batch
+            batch_state['rows'] = {id(batch_item): row for batch_item, row in zip(batch.items, ordered_rows)}
+            batch_state['items'] = {row: batch_item for batch_item, row in zip(batch.items, ordered_rows)}
+            
+            start_btn.configure(state='disabled')
+            up_btn.configure(state='disabled')
+            down_btn.configure(state='disabled')
+            cancel_btn.configure(state='normal')
+            batch.start()
+        
+        def cancel_batch():
+            batch = batch_state.get('batch')
+            if batch:
+                batch.cancel()
+        
+        # Buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill='x', pady=(10, 0))
+        status_var = tk.StringVar(value=f"{len(paths)} script(s) selected")
+        ttk.Label(button_frame, textvariable=status_var).pack(side='left')
+        ttk.Button(button_frame, text="Close", command=batch_window.destroy).pack(side='right')
+        cancel_btn = ttk.Button(button_frame, text="Cancel", command=cancel_batch, state='disabled')
+        cancel_btn.pack(side='right', padx=(0, 5))
+        start_btn = ttk.Button(button_frame, text="Start", command=start_batch)
+        start_btn.pack(side='right', padx=(0, 5))
+        down_btn = ttk.Button(button_frame, text="Move Down", command=lambda: move_selected(1))
+        down_btn.pack(side='right', padx=(0, 5))
+        up_btn = ttk.Button(button_frame, text="Move Up", command=lambda: move_selected(-1))
+        up_btn.pack(side='right', padx=(0, 5))
+    
+    def get_selected_script_path(self):
+        # Get the currently selected item from either tree
+        selected_item = None
+        selected_tree = None
+        
+        for tree in [self.favorites_tree, self.scripts_tree]:
+            selection = tree.selection()
+            if selection:
+                selected_item = selection[0]
+                selected_tree = tree
+                break
+        
+        if not selected_item or not selected_tree:
+            return None
+            
+        return self.item_paths.get((selected_tree, selected_item))
+
+    def open_in_notepad(self):
+        # Get the currently selected item from either tree
+        selected_script_path = self.get_selected_script_path()
+        
+        if not selected_script_path:
+            messagebox.showinfo("Open in Notepad", "No script selected.")
+            return
+        
+        try:
+            # Open the script in Notepad
+            subprocess.Popen(['notepad.exe', selected_script_path])
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not open script in Notepad: {e}")
+
+    def refresh_preview(self):
+        # Get the currently selected item from either tree
+        selected_script_path = self.get_selected_script_path()
+        
+        if not selected_script_path:
+            messagebox.showinfo("Refresh Preview", "No script selected.")
+            return
+            
+        # Find script name to update preview label
+        script_name = os.path.basename(selected_script_path)
+        
+        try:
+            # Reload the script content
+            with open(selected_script_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+                self.preview_text.configure(state='normal')
+                self.preview_text.delete(1.0, tk.END)
+                self.preview_text.insert(tk.END, content)
+                self.preview_text.configure(state='disabled')
+                self.preview_label_frame.configure(text=f"Preview: {script_name}")
+                # Ensure action buttons are visible when refreshing
+                self.show_action_buttons(True)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not refresh script preview: {e}")
+            # Hide action buttons on error
+            self.show_action_buttons(False)
+    
+    def show_folder_context_menu(self, event):
+        # First select the item under the cursor
+        try:
+            index = self.folder_listbox.nearest(event.y)
+            if index >= 0:
+                self.folder_listbox.selection_clear(0, tk.END)
+                self.folder_listbox.selection_set(index)
+                self.folder_listbox.activate(index)
+                
+                # Display the context menu
+                try:
+                    self.folder_context_menu.tk_popup(event.x_root, event.y_root)
+                finally:
+                    self.folder_context_menu.grab_release()
+        except Exception as e:
+            print(f"Error showing context menu: {e}")
+    
+    def open_folder_location(self):
+        selection = self.folder_listbox.curselection()
+        if selection:
+            # Get the actual folder path from our stored list
+            index = selection[0]
+            if index < len(self.folder_paths):
+                folder_path = self.folder_paths[index]
+                try:
+                    if os.path.exists(folder_path):
+                        # Open folder in Windows Explorer
+                        os.startfile(folder_path)
+                    else:
+                        messagebox.showerror("Error", f"Folder does not exist: {folder_path}")
+                except Exception as e:
+                    messagebox.showerror("Error", f"Could not open folder: {e}")
+    
+    def on_script_right_click(self, event):
+        # Identify the tree that was clicked
+        tree = event.widget
+        
+        # Get the item under the cursor
+        item = tree.identify_row(event.y)
+        if not item:
+            return
+        
+        # Select the item, keeping a multi-selection it is part of
+        if item not in tree.selection():
+            tree.selection_set(item)
+        
+        # Clear selection in the other tree
+        other_tree = self.scripts_tree if tree == self.favorites_tree else self.favorites_tree
+        other_tree.selection_remove(*other_tree.selection())
+        
+        # Show context menu
+        try:
+            self.script_context_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self.script_context_menu.grab_release()
+    
+    def show_action_buttons(self, show=True):
+        """Show or hide the action buttons based on whether a script is selected"""
+        # Remove all buttons first
+        for widget in self.action_buttons_frame.winfo_children():
+            widget.pack_forget()
+        
+        # If show is True, show the buttons
+        if show:
+            self.action_buttons_frame.pack(side='right')
+            self.refresh_btn.pack(side='left', padx=(0,5))
+            self.notepad_btn.pack(side='left', padx=(0,5))
+            self.run_btn.pack(side='left', padx=(0,5))
+            self.runas_btn.pack(side='left', padx=(0,5))
+        else:
+            self.action_buttons_frame.pack_forget()
+            
+    def toggle_script_favorite(self):
+        # Get the currently selected item from either tree
+        selected_item = None
+        selected_tree = None
+        
+        for tree in [self.favorites_tree, self.scripts_tree]:
+            selection = tree.selection()
+            if selection:
+                selected_item = selection[0]
+                selected_tree = tree
+                break
+        
+        if not selected_item or not selected_tree:
+            return
+        
+        script_path = self.item_paths.get((selected_tree, selected_item))
+        if script_path:
+            # Toggle the favorite status
+            self.app_data.toggle_favorite(script_path)
+            self.repaint_script_trees()
+        
+    def on_tree_select(self, event):
+        tree = event.widget
+        selection = tree.selection()
+        
+        if not selection:
+            return
+            
+        # Clear selection in the other tree
+        other_tree = self.scripts_tree if tree == self.favorites_tree else self.favorites_tree
+        other_tree.selection_remove(*other_tree.selection())
+        
+        # Get the selected item
+        item = selection[0]
+        values = tree.item(item)['values']
+        
+        if not values or len(values) < 2:
+            return
+            
+        script_name = values[1]
+        script_path = self.item_paths.get((tree, item))
+        if not script_path:
+            return
+        self.ui_snapshot.selection = script_path
+        
+        # Show preview of selected script
+        try:
+            with span('file.preview'):
+                with open(script_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            with span('tk.preview'):
+                self.preview_text.configure(state='normal')
+                self.preview_text.delete(1.0, tk.END)
+                self.preview_text.insert(tk.END, content)
+                self.preview_text.configure(state='disabled')
+            # Update the LabelFrame text directly
+            self.preview_label_frame.configure(text=f"Preview: {script_name}")
+            # Show action buttons
+            self.show_action_buttons(True)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not read script: {e}")
+            self.preview_label_frame.configure(text="Script Preview")
+            # Hide action buttons on error
+            self.show_action_buttons(False)
+
+def main(request=None):
+    root = tk.Tk()
+    app = PowerShellManager(root, request)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""PowerShell probes (version, edition, profile path, execution policy, ...) with
+deadlines, a per-host circuit breaker and a cache of the last good answers.
+
+A probe that hangs is killed with its process tree once its deadline passes.
+After FAILURE_THRESHOLD consecutive failures (timeouts, or a host that can't be
+started) the host's circuit opens: its probes are answered from probe_cache.json
+without starting PowerShell until COOLDOWN seconds have passed, after which a
+single probe is let through to test it again.
+"""
+import json
+import os
+import subprocess
+import threading
+import time
+
+from ps_runner import run_powershell
+
+PROBE_CACHE = 'probe_cache.json'
+
+# Seconds a probe may take, including PowerShell's own startup
+PROBE_TIMEOUT = 10
+
+# Consecutive failures that open a host's circuit, and how long it stays open
+FAILURE_THRESHOLD = 3
+COOLDOWN = 60
+
+
+class ProbeFailed(Exception):
+    """The probe failed and there is no cached answer to fall back to"""
+
+
+class CircuitBreaker:
+    """Tracks consecutive failures of one host; open means don't start it"""
+
+    def __init__(self, threshold=FAILURE_THRESHOLD, cooldown=COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+        self.lock = threading.Lock()
+
+    def allow(self):
+        """Return True if a call may go ahead"""
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            # Half-open: let one call through to see whether the host recovered
+            if time.monotonic() - self.opened_at >= self.cooldown and not self.trial_running:
+                self.trial_running = True
+                return True
+            return False
+
+    def succeeded(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_running = False
+
+    def failed(self):
+        with self.lock:
+            self.failures += 1
+            self.trial_running = False
+            if self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+
+
+class ProbeRunner:
+    """Runs probes with deadlines, falling back to cached answers when a host is failing"""
+
+    def __init__(self, cache_file=PROBE_CACHE, timeout=PROBE_TIMEOUT):
+        self.cache_file = cache_file
+        self.timeout = timeout
+        self.breakers = {}
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('probes', {})
+        except Exception as e:
+            print(f"Error loading probe cache: {e}")
+            self.entries = {}
+
+    def save(self):
+        try:
+            with self.lock:
+                data = {'probes': dict(self.entries)}
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        except Exception as e:
+            print(f"Error saving probe cache: {e}")
+
+    def breaker(self, executable):
+        with self.lock:
+            if executable not in self.breakers:
+                self.breakers[executable] = CircuitBreaker()
+            return self.breakers[executable]
+
+    def cached(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            raise ProbeFailed(f"No answer for {key}")
+        return entry['output']
+
+    def forget(self, executable):
+        """Drop the cached answers of a host, e.g. one that is no longer installed"""
+        prefix = f"{executable}|"
+        with self.lock:
+            keys = [key for key in self.entries if key.startswith(prefix)]
+            for key in keys:
+                del self.entries[key]
+        if keys:
+            self.save()
+
+    def run(self, script, executable='powershell.exe', timeout=None, cached_only=False):
+        """Run a -Command probe and return its stripped output.
+
+        Returns the last good answer when the host fails or its circuit is
+        open, and raises ProbeFailed if there is none. With cached_only the
+        last good answer is returned without starting PowerShell.
+        """
+        key = f"{executable}|{script}"
+        breaker = self.breaker(executable)
+        if cached_only or not breaker.allow():
+            return self.cached(key)
+
+        try:
+            result = run_powershell(['-Command', script], executable=executable,
+                                    timeout=timeout or self.timeout)
+        except FileNotFoundError as e:
+            # Not a hiccup: the host isn't installed (any more), so its old answers are wrong
+            breaker.succeeded()
+            self.forget(executable)
+            raise ProbeFailed(f"{executable} not found: {e}")
+        except (subprocess.TimeoutExpired, OSError) as e:
+            breaker.failed()
+            print(f"Probe failed on {executable}: {e}")
+            return self.cached(key)
+
+        breaker.succeeded()
+        output = result.stdout.strip()
+        # Only answers from a working host are worth keeping
+        if result.returncode == 0:
+            with self.lock:
+                changed = self.entries.get(key, {}).get('output') != output
+                self.entries[key] = {'output': output, 'time': time.time()}
+            if changed:
+                self.save()
+        return output
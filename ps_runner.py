@@ -0,0 +1,200 @@
+"""Common runner for PowerShell processes, with per-session telemetry.
+
+Probes and queries whose output is captured go through run_powershell().
+Paths that manage their own process (script runs, module jobs, elevated
+launches, warm hosts) report it with start_record():
+
+    record = start_record(command)
+    process = subprocess.Popen(command, ...)
+    record.spawned()
+    ...
+    record.finish(process.returncode)
+
+Every record holds the command, spawn latency, run time, exit code, stdout
+size and whether it timed out; report() aggregates them per command for the
+Diagnostics tab.
+"""
+import subprocess
+import threading
+import time
+from collections import deque
+
+from background_tasks import TaskCancelled, kill_process, new_session_kwargs
+from execution import powershell_command
+
+# Individual records kept for the report; the per-command totals cover the whole session
+MAX_RECORDS = 500
+
+# Longest command label shown in the report
+MAX_LABEL_LENGTH = 80
+
+
+def describe(args):
+    """Return a short label for a PowerShell command line, e.g. the -Command text"""
+    args = list(args)
+    for option in ('-Command', '-File'):
+        if option in args and args.index(option) + 1 < len(args):
+            text = ' '.join(args[args.index(option) + 1].split())
+            label = text if option == '-Command' else f"-File {text}"
+            break
+    else:
+        label = '-EncodedCommand ...' if '-EncodedCommand' in args else ' '.join(args)
+    return label if len(label) <= MAX_LABEL_LENGTH else label[:MAX_LABEL_LENGTH - 3] + '...'
+
+
+class ProcessRecord:
+    """Telemetry of one PowerShell process"""
+
+    __slots__ = ('label', 'executable', 'started', 'start', 'spawn_ms', 'run_ms', 'exit_code',
+                 'stdout_bytes', 'timed_out', 'elevated', 'error')
+
+    def __init__(self, command, label=None, elevated=False):
+        command = list(command)
+        self.label = label or describe(command[1:])
+        self.executable = command[0] if command else ''
+        self.started = time.time()
+        self.start = time.perf_counter()
+        self.spawn_ms = None
+        self.run_ms = None
+        self.exit_code = None
+        self.stdout_bytes = None
+        self.timed_out = False
+        self.elevated = elevated
+        self.error = None
+
+    def spawned(self):
+        """Mark the process as started"""
+        self.spawn_ms = (time.perf_counter() - self.start) * 1000
+
+    def finish(self, exit_code, stdout_bytes=None, timed_out=False, error=None):
+        """Mark the process as exited and add the record to the session telemetry"""
+        self.run_ms = (time.perf_counter() - self.start) * 1000 - (self.spawn_ms or 0)
+        self.exit_code = exit_code
+        self.stdout_bytes = stdout_bytes
+        self.timed_out = timed_out
+        self.error = error
+        telemetry.add(self)
+
+    @property
+    def failed(self):
+        return bool(self.error or self.timed_out or self.exit_code)
+
+    def as_dict(self):
+        return {
+            'command': self.label,
+            'executable': self.executable,
+            'started': time.strftime('%H:%M:%S', time.localtime(self.started)),
+            'spawn_ms': round(self.spawn_ms, 1) if self.spawn_ms is not None else None,
+            'run_ms': round(self.run_ms, 1) if self.run_ms is not None else None,
+            'exit_code': self.exit_code,
+            'stdout_bytes': self.stdout_bytes,
+            'timed_out': self.timed_out,
+            'elevated': self.elevated,
+            'error': self.error
+        }
+
+
+class SessionTelemetry:
+    """Records of every PowerShell process started in this session"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.session_start = time.time()
+        self.records = deque(maxlen=MAX_RECORDS)
+        self.commands = {}
+
+    def add(self, record):
+        with self.lock:
+            self.records.append(record)
+            totals = self.commands.get(record.label)
+            if totals is None:
+                totals = self.commands[record.label] = {
+                    'command': record.label, 'count': 0, 'failures': 0, 'timeouts': 0,
+                    'spawn_ms': 0.0, 'run_ms': 0.0, 'max_run_ms': 0.0, 'stdout_bytes': 0
+                }
+            totals['count'] += 1
+            totals['failures'] += record.failed
+            totals['timeouts'] += record.timed_out
+            totals['spawn_ms'] += record.spawn_ms or 0
+            totals['run_ms'] += record.run_ms or 0
+            totals['max_run_ms'] = max(totals['max_run_ms'], record.run_ms or 0)
+            totals['stdout_bytes'] += record.stdout_bytes or 0
+
+    def report(self):
+        """Return the session's totals, per-command aggregates (costliest first) and recent records"""
+        with self.lock:
+            commands = [dict(totals) for totals in self.commands.values()]
+            records = [record.as_dict() for record in self.records]
+        for totals in commands:
+            totals['mean_spawn_ms'] = round(totals['spawn_ms'] / totals['count'], 1)
+            totals['mean_run_ms'] = round(totals['run_ms'] / totals['count'], 1)
+            for key in ('spawn_ms', 'run_ms', 'max_run_ms'):
+                totals[key] = round(totals[key], 1)
+        commands.sort(key=lambda totals: totals['spawn_ms'] + totals['run_ms'], reverse=True)
+        return {
+            'session_start': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.session_start)),
+            'processes': sum(totals['count'] for totals in commands),
+            'spawn_ms': round(sum(totals['spawn_ms'] for totals in commands), 1),
+            'run_ms': round(sum(totals['run_ms'] for totals in commands), 1),
+            'commands': commands,
+            'recent': records
+        }
+
+    def reset(self):
+        with self.lock:
+            self.records.clear()
+            self.commands.clear()
+
+
+telemetry = SessionTelemetry()
+
+
+def start_record(command, label=None, elevated=False):
+    """Start timing a PowerShell process started by the caller"""
+    return ProcessRecord(command, label, elevated)
+
+
+def run_powershell(args, executable='powershell.exe', timeout=None, command=None, label=None, token=None, **kwargs):
+    """Run PowerShell with the given arguments and capture its output as text.
+
+    Behaves like subprocess.run(powershell_command(executable) + args,
+    capture_output=True, text=True, timeout=timeout): returns a
+    CompletedProcess and raises TimeoutExpired or OSError. `command`
+    replaces the powershell_command() prefix. With a TaskToken, cancelling
+    the token kills the process and TaskCancelled is raised.
+    """
+    full_command = (command or powershell_command(executable)) + list(args)
+    record = start_record(full_command, label)
+    try:
+        process = subprocess.Popen(
+            full_command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            **new_session_kwargs(),
+            **kwargs
+        )
+    except OSError as e:
+        record.spawned()
+        record.finish(None, error=str(e))
+        raise
+    record.spawned()
+    if token:
+        token.attach(process)
+
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        kill_process(process)
+        stdout, stderr = process.communicate()
+        record.finish(None, len(stdout or ''), timed_out=True)
+        raise subprocess.TimeoutExpired(full_command, timeout, stdout, stderr)
+    finally:
+        if token:
+            token.detach(process)
+    if token and token.cancelled:
+        record.finish(process.returncode, len(stdout or ''), error='cancelled')
+        raise TaskCancelled(record.label)
+    record.finish(process.returncode, len(stdout or ''))
+    return subprocess.CompletedProcess(full_command, process.returncode, stdout, stderr)
@@ -0,0 +1,120 @@
+import math
+import sqlite3
+import threading
+from collections import deque
+
+# Only the most recent runs of a script count towards its percentiles
+PERCENTILE_WINDOW = 100
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class RunHistory:
+    """Append-only SQLite store of script runs"""
+
+    def __init__(self, db_file='run_history.db'):
+        self.db_file = db_file
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(db_file, check_same_thread=False)
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                script_path TEXT NOT NULL,
+                start_time REAL NOT NULL,
+                duration REAL,
+                exit_code INTEGER,
+                status TEXT,
+                output_size INTEGER,
+                peak_memory INTEGER,
+                elevated INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        self.connection.execute(
+            'CREATE INDEX IF NOT EXISTS runs_by_script ON runs (script_path, start_time)')
+        self.connection.commit()
+        # Per-script stats, loaded on first use and kept up to date by record_run
+        self.summaries = None
+        self.windows = {}
+
+    def record_run(self, run):
+        """Append a finished ScriptRun to the history"""
+        if run.start_time is None:
+            return
+        try:
+            with self.lock:
+                self.connection.execute(
+                    'INSERT INTO runs (script_path, start_time, duration, exit_code, status, '
+                    'output_size, peak_memory, elevated) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (run.script_path, run.start_time, run.duration, run.exit_code, run.status,
+                     run.output_size, run.peak_memory, 1 if run.elevated else 0))
+                self.connection.commit()
+                if self.summaries is not None:
+                    self.add_to_summary(run.script_path, run.start_time, run.duration, run.status)
+        except Exception as e:
+            print(f"Error recording run history: {e}")
+
+    def recent_runs(self, script_path, limit=20):
+        """Return the most recent runs of a script as dicts, newest first"""
+        with self.lock:
+            cursor = self.connection.execute(
+                'SELECT start_time, duration, exit_code, status, output_size, peak_memory, elevated '
+                'FROM runs WHERE script_path = ? ORDER BY start_time DESC LIMIT ?',
+                (script_path, limit))
+            rows = cursor.fetchall()
+        keys = ('start_time', 'duration', 'exit_code', 'status', 'output_size', 'peak_memory', 'elevated')
+        return [dict(zip(keys, row)) for row in rows]
+
+    def stats(self, script_path=None):
+        """Return {script_path: {'last_run', 'runs', 'p50', 'p95'}} for one or all scripts"""
+        with self.lock:
+            if self.summaries is None:
+                self.load_summaries()
+            if script_path is not None:
+                entry = self.summaries.get(script_path)
+                return {script_path: dict(entry)} if entry else {}
+            return {path: dict(entry) for path, entry in self.summaries.items()}
+
+    def load_summaries(self):
+        """Read run counts and the recent durations of every script; called with the lock held"""
+        self.summaries = {}
+        self.windows = {}
+        for path, runs, last_run in self.connection.execute(
+                'SELECT script_path, COUNT(*), MAX(start_time) FROM runs GROUP BY script_path'):
+            self.summaries[path] = {'last_run': last_run, 'runs': runs, 'p50': None, 'p95': None}
+
+        # Only the last PERCENTILE_WINDOW timed runs per script are read; cancelled runs would skew the timings
+        rows = self.connection.execute(
+            'SELECT script_path, duration FROM ('
+            '  SELECT script_path, start_time, duration, ROW_NUMBER() OVER ('
+            '    PARTITION BY script_path ORDER BY start_time DESC) AS position'
+            "  FROM runs WHERE duration IS NOT NULL AND status IS NOT 'cancelled')"
+            ' WHERE position <= ? ORDER BY script_path, start_time',
+            (PERCENTILE_WINDOW,))
+        for path, duration in rows:
+            self.windows.setdefault(path, deque(maxlen=PERCENTILE_WINDOW)).append(duration)
+        for path in self.windows:
+            self.update_percentiles(path)
+
+    def add_to_summary(self, path, start_time, duration, status):
+        """Fold a newly recorded run into the loaded stats; called with the lock held"""
+        entry = self.summaries.setdefault(path, {'last_run': start_time, 'runs': 0, 'p50': None, 'p95': None})
+        entry['runs'] += 1
+        entry['last_run'] = max(entry['last_run'], start_time)
+        if duration is not None and status != 'cancelled':
+            self.windows.setdefault(path, deque(maxlen=PERCENTILE_WINDOW)).append(duration)
+            self.update_percentiles(path)
+
+    def update_percentiles(self, path):
+        durations = sorted(self.windows[path])
+        self.summaries[path]['p50'] = percentile(durations, 0.50)
+        self.summaries[path]['p95'] = percentile(durations, 0.95)
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,113 @@
+import json
+import os
+import threading
+
+from instrumentation import timed
+from script_metadata import extract_file
+
+# Below this many stale scripts the process pool costs more than it saves
+PROCESS_POOL_THRESHOLD = 32
+
+
+class ScriptIndex:
+    """Cache of extracted script metadata, keyed by full path and invalidated by mtime"""
+
+    def __init__(self, index_file='script_index.json'):
+        self.index_file = index_file
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        try:
+            if os.path.exists(self.index_file):
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('scripts', {})
+        except Exception as e:
+            print(f"Error loading script index: {e}")
+            self.entries = {}
+
+    def save(self):
+        try:
+            with self.lock:
+                data = {'scripts': dict(self.entries)}
+            with open(self.index_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        except Exception as e:
+            print(f"Error saving script index: {e}")
+
+    def get(self, path):
+        """Return the cached metadata for a script (possibly stale), or None"""
+        entry = self.entries.get(path)
+        return entry['metadata'] if entry else None
+
+    def paths(self):
+        """Return the paths of all indexed scripts (the last scan)"""
+        return list(self.entries)
+
+    def stale_paths(self, paths):
+        """Return the paths whose cached metadata is missing or older than the file"""
+        stale = []
+        for path in paths:
+            entry = self.entries.get(path)
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            if not entry or entry.get('mtime') != mtime:
+                stale.append(path)
+        return stale
+
+    def prune(self, paths):
+        """Drop entries for scripts that are no longer part of the scan"""
+        keep = set(paths)
+        with self.lock:
+            for path in [p for p in self.entries if p not in keep]:
+                del self.entries[path]
+
+    @timed('scan.metadata')
+    def refresh(self, paths, on_result=None, max_workers=None, cancelled=None):
+        """Extract metadata for stale scripts across a process pool and update the cache.
+
+        on_result(path, metadata) is called (from the calling thread) for every
+        script that was re-extracted. Returns the list of updated paths. If the
+        `cancelled` event is set, extraction stops early, keeping and returning
+        what is done.
+        """
+        stale = self.stale_paths(paths)
+        if not stale:
+            return []
+
+        updated = []
+        if len(stale) < PROCESS_POOL_THRESHOLD:
+            results = map(extract_file, stale)
+            self.store_results(results, on_result, cancelled, updated)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                chunksize = max(1, len(stale) // ((max_workers or os.cpu_count() or 1) * 4))
+                results = executor.map(extract_file, stale, chunksize=chunksize)
+                if not self.store_results(results, on_result, cancelled, updated):
+                    # Drop the chunks that haven't started; leaving the block waits for the rest
+                    executor.shutdown(cancel_futures=True)
+
+        self.save()
+        return updated
+
+    def store_results(self, results, on_result, cancelled=None, updated=None):
+        """Store extraction results, adding the stored paths to `updated`.
+
+        Returns False if stopped by the cancelled event, True once all results are stored.
+        """
+        for path, mtime, metadata in results:
+            if cancelled and cancelled.is_set():
+                return False
+            if metadata is None:
+                continue
+            with self.lock:
+                self.entries[path] = {'mtime': mtime, 'metadata': metadata}
+            if updated is not None:
+                updated.append(path)
+            if on_result:
+                on_result(path, metadata)
+        return True
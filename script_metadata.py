@@ -0,0 +1,214 @@
+import os
+import re
+
+# Comment-based help keywords we keep (the rest are ignored)
+HELP_KEYWORDS = ('SYNOPSIS', 'DESCRIPTION', 'NOTES', 'EXAMPLE')
+OTHER_HELP_KEYWORDS = ('PARAMETER', 'LINK', 'INPUTS', 'OUTPUTS', 'COMPONENT', 'ROLE', 'FUNCTIONALITY')
+
+HELP_BLOCK_RE = re.compile(r'<#(.*?)#>', re.S)
+HELP_KEYWORD_RE = re.compile(r'^\s*\.([A-Za-z]+)\b(.*)$')
+REQUIRES_RE = re.compile(r'^\s*#requires\s+(.+)$', re.I | re.M)
+IMPORT_MODULE_RE = re.compile(r'\bImport-Module\s+(?:-Name\s+)?[\'"]?([\w.\-\\/:]+)', re.I)
+USING_MODULE_RE = re.compile(r'^\s*using\s+module\s+[\'"]?([\w.\-\\/:]+)', re.I | re.M)
+PARAM_START_RE = re.compile(r'\bparam\s*\(', re.I)
+# Attributes and types before the variable; array types like [int[]] contain brackets
+PARAM_VAR_RE = re.compile(r'((?:\[(?:[^\[\]]|\[\])+\]\s*)*)\$(\w+)')
+TYPE_RE = re.compile(r'\[([\w.]+(?:\[\])?)\]')
+ATTRIBUTE_NAMES = ('parameter', 'validateset', 'validatenotnullorempty', 'validatenotnull',
+                   'validatescript', 'validaterange', 'validatepattern', 'validatelength',
+                   'alias', 'allownull', 'allowemptystring', 'cmdletbinding')
+
+# Only read the head of very large files; help and param blocks live at the top
+MAX_READ_BYTES = 256 * 1024
+
+
+def empty_metadata():
+    return {
+        'synopsis': '',
+        'description': '',
+        'params': [],
+        'requires': [],
+        'modules': []
+    }
+
+
+def parse_help(content):
+    """Parse comment-based help sections (.SYNOPSIS, .DESCRIPTION, ...)"""
+    sections = {}
+
+    # Prefer a <# ... #> block, fall back to a run of single-line comments
+    blocks = [m.group(1) for m in HELP_BLOCK_RE.finditer(content)]
+    if not blocks:
+        comment_lines = []
+        for line in content.splitlines():
+            stripped = line.strip()
+            if stripped.startswith('#') and not stripped.lower().startswith('#requires'):
+                comment_lines.append(stripped.lstrip('#'))
+            elif comment_lines:
+                blocks.append('\n'.join(comment_lines))
+                comment_lines = []
+        if comment_lines:
+            blocks.append('\n'.join(comment_lines))
+
+    for block in blocks:
+        current = None
+        for line in block.splitlines():
+            match = HELP_KEYWORD_RE.match(line)
+            if match and match.group(1).upper() in HELP_KEYWORDS + OTHER_HELP_KEYWORDS:
+                keyword = match.group(1).upper()
+                # Only the first occurrence of a section is kept (e.g. the first .EXAMPLE)
+                if keyword in HELP_KEYWORDS and keyword not in sections:
+                    current = keyword
+                    sections[current] = []
+                else:
+                    current = None
+                continue
+            if current:
+                sections[current].append(line.strip())
+        if 'SYNOPSIS' in sections:
+            break
+
+    return {key: ' '.join(line for line in lines if line).strip() for key, lines in sections.items()}
+
+
+def find_param_block(content):
+    """Return the text inside the script-level param(...) block, or None"""
+    match = PARAM_START_RE.search(content)
+    if not match:
+        return None
+
+    # Skip param blocks that belong to a function defined before the script's own block
+    function_match = re.search(r'\bfunction\s+[\w\-]+', content[:match.start()], re.I)
+    if function_match:
+        return None
+
+    depth = 0
+    start = match.end()
+    for index in range(match.end() - 1, len(content)):
+        char = content[index]
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                return content[start:index]
+    return None
+
+
+def strip_default_value(declaration):
+    """Cut a parameter declaration at its top-level '=' (attribute arguments are kept)"""
+    depth = 0
+    for index, char in enumerate(declaration):
+        if char in '([{':
+            depth += 1
+        elif char in ')]}':
+            depth -= 1
+        elif char == '=' and depth == 0:
+            return declaration[:index]
+    return declaration
+
+
+def parse_params(content):
+    """Parse the script's param() block into a list of parameter descriptions"""
+    # Help text and comments may mention param( in examples
+    code = HELP_BLOCK_RE.sub('', content)
+    code = re.sub(r'(?m)^\s*#.*$', '', code)
+    block = find_param_block(code)
+    if block is None:
+        return []
+
+    # Split on top-level commas so attribute arguments stay with their parameter
+    params = []
+    seen = set()
+    depth = 0
+    segment = []
+    segments = []
+    for char in block:
+        if char in '([{':
+            depth += 1
+        elif char in ')]}':
+            depth -= 1
+        if char == ',' and depth == 0:
+            segments.append(''.join(segment))
+            segment = []
+        else:
+            segment.append(char)
+    segments.append(''.join(segment))
+
+    for segment in segments:
+        # Ignore anything after the default value assignment
+        declaration = strip_default_value(segment)
+        match = None
+        for match in PARAM_VAR_RE.finditer(declaration):
+            pass
+        if not match:
+            continue
+        name = match.group(2)
+        if name.lower() in seen:
+            continue
+        seen.add(name.lower())
+
+        param_type = ''
+        for type_match in TYPE_RE.finditer(match.group(1)):
+            if type_match.group(1).lower() not in ATTRIBUTE_NAMES:
+                param_type = type_match.group(1)
+        mandatory = bool(re.search(r'Mandatory\s*(=\s*\$true)?\s*[,)]', segment, re.I))
+        params.append({'name': name, 'type': param_type, 'mandatory': mandatory})
+    return params
+
+
+def parse_requires(content):
+    """Return the #Requires statements of a script (without the #Requires prefix)"""
+    return [match.group(1).strip() for match in REQUIRES_RE.finditer(content)]
+
+
+def parse_modules(content, requires):
+    """Return the modules a script imports, via Import-Module, using module or #Requires -Modules"""
+    modules = []
+    for match in IMPORT_MODULE_RE.finditer(content):
+        modules.append(match.group(1))
+    for match in USING_MODULE_RE.finditer(content):
+        modules.append(match.group(1))
+    for requirement in requires:
+        req_match = re.search(r'-Modules?\s+(.+)$', requirement, re.I)
+        if not req_match:
+            continue
+        for name in re.split(r'\s*,\s*', req_match.group(1)):
+            # Hashtable specifications, e.g. @{ModuleName='Az'; ModuleVersion='1.0'}
+            spec = re.search(r'ModuleName\s*=\s*[\'"]([^\'"]+)', name, re.I)
+            name = spec.group(1) if spec else name.strip(' \'"@{}')
+            if name and '=' not in name:
+                modules.append(name)
+
+    unique = []
+    seen = set()
+    for name in modules:
+        name = os.path.basename(name.replace('\\', '/')) if ('/' in name or '\\' in name) else name
+        if name.lower() not in seen:
+            seen.add(name.lower())
+            unique.append(name)
+    return unique
+
+
+def parse_metadata(content):
+    """Extract help, params, requirements and imported modules from script text"""
+    metadata = empty_metadata()
+    help_sections = parse_help(content)
+    metadata['synopsis'] = help_sections.get('SYNOPSIS', '')
+    metadata['description'] = help_sections.get('DESCRIPTION', '')
+    metadata['params'] = parse_params(content)
+    metadata['requires'] = parse_requires(content)
+    metadata['modules'] = parse_modules(content, metadata['requires'])
+    return metadata
+
+
+def extract_file(path):
+    """Extract metadata for a single script file. Runs inside worker processes."""
+    try:
+        mtime = os.path.getmtime(path)
+        with open(path, 'r', encoding='utf-8-sig', errors='replace') as f:
+            content = f.read(MAX_READ_BYTES)
+        return path, mtime, parse_metadata(content)
+    except Exception as e:
+        print(f"Error extracting metadata from {path}: {e}")
+        return path, None, None
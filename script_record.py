@@ -0,0 +1,33 @@
+import os
+import sys
+
+
+class ScriptRecord:
+    """A script found in one of the script folders.
+
+    Only the full path is stored per script. The folder string is interned so
+    every script of a folder shares one copy, the favorites set is shared with
+    AppData, and name, relative path and favorite state are derived on access.
+    """
+
+    __slots__ = ('full_path', 'folder', 'favorites')
+
+    def __init__(self, full_path, folder, favorites=frozenset()):
+        self.full_path = full_path
+        self.folder = sys.intern(folder)
+        self.favorites = favorites
+
+    @property
+    def name(self):
+        return os.path.basename(self.full_path)
+
+    @property
+    def relative_path(self):
+        return os.path.relpath(self.full_path, self.folder)
+
+    @property
+    def is_favorite(self):
+        return self.full_path in self.favorites
+
+    def __repr__(self):
+        return f"ScriptRecord({self.full_path!r})"
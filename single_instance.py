@@ -0,0 +1,55 @@
+import os
+import sys
+
+LOCK_FILE = 'app.lock'
+
+
+class InstanceLock:
+    """An exclusive, non-blocking lock on a file, held for the life of the process.
+
+    The operating system drops the lock when the process exits, so a crashed
+    instance never leaves a stale lock behind.
+    """
+
+    def __init__(self, lock_file=LOCK_FILE):
+        self.lock_file = lock_file
+        self.file = None
+
+    def acquire(self):
+        """Return True if this process now holds the lock, False if another instance does"""
+        file = open(self.lock_file, 'a+')
+        try:
+            if sys.platform == 'win32':
+                import msvcrt
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            file.close()
+            return False
+
+        # Record the owner for troubleshooting; the lock itself is what counts
+        file.seek(0)
+        file.truncate()
+        file.write(str(os.getpid()))
+        file.flush()
+        self.file = file
+        return True
+
+    def release(self):
+        if self.file is None:
+            return
+        try:
+            if sys.platform == 'win32':
+                import msvcrt
+                self.file.seek(0)
+                msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        except OSError:
+            pass
+        self.file.close()
+        self.file = None
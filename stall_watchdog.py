@@ -0,0 +1,104 @@
+import os
+import sys
+import threading
+import time
+
+import instrumentation
+
+STALL_LOG = 'stalls.log'
+
+# The Tk thread counts as stalled once a heartbeat is this many seconds late
+DEFAULT_THRESHOLD = 1.0
+
+# How often the heartbeat is scheduled and the watcher checks it, in seconds
+HEARTBEAT_INTERVAL = 0.25
+
+
+class StallWatchdog:
+    """Detect when the Tk main loop stops servicing events and log what it was doing.
+
+    A heartbeat scheduled with after() records when the main loop last ran; a
+    watcher thread compares that with the clock. When the heartbeat is late by
+    more than `threshold`, the main thread's Python stack is captured with
+    sys._current_frames() and logged, followed by the total duration once the
+    loop recovers.
+    """
+
+    def __init__(self, root, threshold=DEFAULT_THRESHOLD, log_file=STALL_LOG,
+                 max_bytes=1024 * 1024, backup_count=3):
+        self.root = root
+        self.threshold = threshold
+        self.log_file = log_file
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.logger = None
+        self.main_thread_id = None
+        self.last_beat = None
+        self.stop_event = threading.Event()
+        self.after_id = None
+
+    def start(self):
+        """Start the heartbeat and the watcher; must be called on the Tk thread"""
+        import logging
+        from logging.handlers import RotatingFileHandler
+
+        self.logger = logging.getLogger('powershell_manager.stalls')
+        self.logger.propagate = False
+        if not self.logger.handlers:
+            handler = RotatingFileHandler(self.log_file, maxBytes=self.max_bytes,
+                                          backupCount=self.backup_count, encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+            self.logger.addHandler(handler)
+            self.logger.setLevel(logging.INFO)
+
+        self.main_thread_id = threading.get_ident()
+        self.beat()
+        threading.Thread(target=self.watch, name='stall-watchdog', daemon=True).start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.after_id:
+            try:
+                self.root.after_cancel(self.after_id)
+            except Exception:
+                pass
+            self.after_id = None
+
+    def beat(self):
+        self.last_beat = time.monotonic()
+        if not self.stop_event.is_set():
+            self.after_id = self.root.after(int(HEARTBEAT_INTERVAL * 1000), self.beat)
+
+    def capture_main_stack(self):
+        """Return the main thread's current Python stack as text"""
+        import traceback
+        frame = sys._current_frames().get(self.main_thread_id)
+        if frame is None:
+            return "  (main thread stack unavailable)\n"
+        return ''.join(traceback.format_stack(frame))
+
+    def watch(self):
+        stall_start = None
+        last_check = time.monotonic()
+        while not self.stop_event.wait(HEARTBEAT_INTERVAL):
+            now = time.monotonic()
+
+            # The watcher itself didn't run for a while: the machine slept, not the UI
+            if now - last_check > HEARTBEAT_INTERVAL + self.threshold:
+                stall_start = None
+                self.last_beat = now
+            last_check = now
+
+            late = now - self.last_beat - HEARTBEAT_INTERVAL
+            if stall_start is None:
+                if late > self.threshold:
+                    stall_start = self.last_beat + HEARTBEAT_INTERVAL
+                    self.logger.warning(
+                        f"UI stall: main loop unresponsive for {late:.2f} s (pid {os.getpid()})\n"
+                        f"{self.capture_main_stack()}")
+            elif late <= 0:
+                # The heartbeat ran again; the stall ended at that beat
+                duration = self.last_beat - stall_start
+                self.logger.warning(f"UI stall ended after {duration:.2f} s")
+                instrumentation.record('ui.stall', duration * 1000)
+                stall_start = None
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The app is a set of top-level modules; make them importable from the tests
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_DIR not in sys.path:
+    sys.path.insert(0, REPO_DIR)
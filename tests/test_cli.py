@@ -0,0 +1,109 @@
+import json
+import os
+import sys
+
+import pytest
+
+import cli
+from conftest import REPO_DIR
+from execution import INTERPRETER_ENV
+from script_record import ScriptRecord
+from ui_snapshot import UISnapshot
+
+FAKE_POWERSHELL = f'"{sys.executable}" "{os.path.join(REPO_DIR, "fake_powershell.py")}"'
+
+
+@pytest.fixture
+def scripts_folder(tmp_path, monkeypatch):
+    """A settings folder with two script folders and a snapshot of their scripts"""
+    settings = tmp_path / 'settings'
+    settings.mkdir()
+    monkeypatch.chdir(settings)
+    tools = tmp_path / 'tools'
+    (tools / 'nested').mkdir(parents=True)
+    other = tmp_path / 'other'
+    other.mkdir()
+    (tools / 'Backup.ps1').write_text('Write-Output "backing up"\nexit 0\n', encoding='utf-8')
+    (tools / 'nested' / 'Cleanup.ps1').write_text('Write-Error "disk full"\nexit 3\n', encoding='utf-8')
+    (other / 'cleanup.ps1').write_text('exit 0\n', encoding='utf-8')
+
+    favorite = str(tools / 'Backup.ps1')
+    (settings / 'app_settings.json').write_text(json.dumps({
+        'folders': [str(tools), str(other)], 'favorites': [favorite]}), encoding='utf-8')
+    snapshot = UISnapshot()
+    snapshot.store_scripts([ScriptRecord(favorite, str(tools), {favorite}),
+                            ScriptRecord(str(tools / 'nested' / 'Cleanup.ps1'), str(tools))])
+    snapshot.save()
+    return tmp_path
+
+
+def records(*paths):
+    return [ScriptRecord(str(path), os.path.dirname(str(path))) for path in paths]
+
+
+def test_find_script_by_path_and_name(scripts_folder, monkeypatch):
+    tools = scripts_folder / 'tools'
+    scripts = records(tools / 'Backup.ps1', tools / 'nested' / 'Cleanup.ps1')
+    monkeypatch.chdir(tools)
+    assert cli.find_script(scripts, os.path.join('nested', 'Cleanup.ps1')) == str(tools / 'nested' / 'Cleanup.ps1')
+    assert cli.find_script(scripts, 'backup') == str(tools / 'Backup.ps1')
+    assert cli.find_script(scripts, 'BACKUP.PS1') == str(tools / 'Backup.ps1')
+    assert cli.find_script(scripts, 'missing') is None
+
+
+def test_find_script_with_an_ambiguous_name(scripts_folder):
+    scripts = records(scripts_folder / 'tools' / 'nested' / 'Cleanup.ps1', scripts_folder / 'other' / 'cleanup.ps1')
+    with pytest.raises(SystemExit) as error:
+        cli.find_script(scripts, 'cleanup')
+    assert 'matches several scripts' in str(error.value)
+
+
+def test_list_json_comes_from_the_snapshot(scripts_folder, capsys):
+    assert cli.main(['list', '--json']) == 0
+    rows = json.loads(capsys.readouterr().out)
+    # other/cleanup.ps1 isn't in the snapshot, so it isn't listed without --rescan
+    assert [(row['name'], row['favorite']) for row in rows] == [('Backup.ps1', True), ('Cleanup.ps1', False)]
+    assert rows[0]['path'] == str(scripts_folder / 'tools' / 'Backup.ps1')
+
+    assert cli.main(['list', '--favorites', '--json']) == 0
+    assert [row['name'] for row in json.loads(capsys.readouterr().out)] == ['Backup.ps1']
+
+    assert cli.main(['list', '--rescan', '--json']) == 0
+    assert len(json.loads(capsys.readouterr().out)) == 3
+
+
+def test_search_json(scripts_folder, capsys):
+    assert cli.main(['search', 'nested', '--json']) == 0
+    assert [row['name'] for row in json.loads(capsys.readouterr().out)] == ['Cleanup.ps1']
+    assert cli.main(['search', 'nothing-like-this', '--json']) == 0
+    assert json.loads(capsys.readouterr().out) == []
+
+
+def test_run_exits_with_the_script_exit_code(scripts_folder, monkeypatch, capsys):
+    monkeypatch.setenv(INTERPRETER_ENV, FAKE_POWERSHELL)
+    assert cli.main(['run', 'Backup']) == 0
+    assert capsys.readouterr().out == 'backing up\n'
+
+    assert cli.main(['run', 'Cleanup', '--json']) == 3
+    result = json.loads(capsys.readouterr().out)
+    assert result['status'] == 'failed' and result['exit_code'] == 3
+    assert result['output'] == [{'stream': 'stderr', 'line': 'disk full'}]
+
+    assert cli.main(['run', 'missing']) == 2
+    assert 'Script not found' in capsys.readouterr().err
+
+
+def test_modules_sort_by_version(scripts_folder, monkeypatch, capsys):
+    modules_file = scripts_folder / 'modules.json'
+    modules_file.write_text(json.dumps([
+        {'Name': 'Pester', 'Version': '10.0.0', 'Path': 'p10', 'Description': ''},
+        {'Name': 'az.accounts', 'Version': {'Major': 2, 'Minor': 1, 'Build': 0, 'Revision': -1},
+         'Path': 'a', 'Description': ''},
+        {'Name': 'Pester', 'Version': '9.0.0', 'Path': 'p9', 'Description': ''},
+    ]), encoding='utf-8')
+    monkeypatch.setenv(INTERPRETER_ENV, FAKE_POWERSHELL)
+    monkeypatch.setenv('PSM_FAKE_MODULES', str(modules_file))
+    assert cli.main(['modules', '--json']) == 0
+    rows = json.loads(capsys.readouterr().out)
+    assert [(row['name'], row['version']) for row in rows] == [
+        ('az.accounts', '2.1.0'), ('Pester', '9.0.0'), ('Pester', '10.0.0')]
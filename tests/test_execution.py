@@ -0,0 +1,124 @@
+import os
+import sys
+import time
+
+import pytest
+
+from conftest import REPO_DIR
+from execution import CANCELLED, COMPLETED, FAILED, BatchRun, ExecutionManager
+
+FAKE_POWERSHELL = [sys.executable, os.path.join(REPO_DIR, 'fake_powershell.py')]
+
+
+def write_script(folder, name, *lines):
+    path = folder / name
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture
+def manager():
+    manager = ExecutionManager(max_concurrent=2, interpreter=FAKE_POWERSHELL)
+    yield manager
+    manager.disable_fast_run()
+
+
+def test_run_captures_output_and_exit_code(manager, tmp_path):
+    script = write_script(tmp_path, 'fail.ps1', 'Write-Output "hello"', 'Write-Error "oops"', 'exit 3')
+    run = manager.submit(script)
+    assert run.done.wait(10)
+    assert run.status == FAILED
+    assert run.exit_code == 3
+    assert sorted(run.output) == [('stderr', 'oops'), ('stdout', 'hello')]
+    assert run.duration is not None
+
+
+def test_concurrency_limit(manager, tmp_path):
+    script = write_script(tmp_path, 'slow.ps1', 'Start-Sleep -Milliseconds 300')
+    runs = [manager.submit(script) for _ in range(4)]
+    time.sleep(0.1)
+    assert manager.active_count() == 4
+    assert sum(run.process is not None for run in runs) <= 2
+    for run in runs:
+        assert run.done.wait(10)
+    assert all(run.status == COMPLETED for run in runs)
+
+
+def test_cancel_queued_and_running(tmp_path):
+    manager = ExecutionManager(max_concurrent=1, interpreter=FAKE_POWERSHELL)
+    script = write_script(tmp_path, 'sleep.ps1', 'Start-Sleep -Seconds 30')
+    running = manager.submit(script)
+    queued = manager.submit(script)
+    time.sleep(0.2)
+    manager.cancel(queued)
+    assert queued.status == CANCELLED and queued.process is None
+    manager.cancel(running)
+    assert running.done.wait(10)
+    assert running.status == CANCELLED
+
+
+def test_sequential_batch_stops_after_a_failure(manager, tmp_path):
+    ok = write_script(tmp_path, 'ok.ps1', 'exit 0')
+    bad = write_script(tmp_path, 'bad.ps1', 'exit 1')
+    batch = BatchRun(manager, [ok, bad, ok], sequential=True)
+    batch.start()
+    assert batch.done.wait(10)
+    assert [item.status for item in batch.items] == [COMPLETED, FAILED, 'skipped']
+
+
+def test_fast_run_uses_a_warm_host(manager, tmp_path):
+    failures = []
+    manager.enable_fast_run(1, on_failure=failures.append)
+    deadline = time.monotonic() + 10
+    while not manager.warm_pool.idle and time.monotonic() < deadline:
+        time.sleep(0.05)
+    run = manager.submit(write_script(tmp_path, 'fast.ps1', 'Write-Output "warm"', 'exit 2'))
+    assert run.done.wait(10)
+    assert run.fast and run.exit_code == 2
+    assert run.output == [('stdout', 'warm')]
+    assert failures == []
+
+
+def test_elevated_run_keeps_the_console_interactive(monkeypatch, tmp_path):
+    import execution
+    launched = []
+    monkeypatch.setattr(execution, 'shell_execute_elevated',
+                        lambda executable, params, directory: launched.append((executable, params, directory)))
+    monkeypatch.setattr(execution, 'wait_for_process_handle', lambda handle: 0)
+    monkeypatch.delenv(execution.INTERPRETER_ENV, raising=False)
+    script = write_script(tmp_path, 'admin script.ps1', 'Read-Host "Name"')
+
+    run = ExecutionManager().submit_elevated(script)
+    assert run.done.wait(10)
+    assert run.status == COMPLETED and run.elevated
+    assert launched == [('powershell.exe', f'-File "{script}"', str(tmp_path))]
+
+
+def test_cancel_while_the_process_is_starting(manager, tmp_path, monkeypatch):
+    import subprocess
+    popen = subprocess.Popen
+
+    def cancel_during_launch(*args, **kwargs):
+        manager.cancel(manager.runs[-1])
+        return popen(*args, **kwargs)
+
+    monkeypatch.setattr(subprocess, 'Popen', cancel_during_launch)
+    run = manager.submit(write_script(tmp_path, 'sleep.ps1', 'Start-Sleep -Seconds 30'))
+    assert run.done.wait(10)
+    assert run.status == CANCELLED
+
+
+def test_batch_cancel_while_a_script_is_being_submitted(manager, tmp_path):
+    script = write_script(tmp_path, 'sleep.ps1', 'Start-Sleep -Seconds 30')
+    batch = BatchRun(manager, [script, script], sequential=True)
+    submit = manager.submit
+
+    def cancel_during_submit(path):
+        run = submit(path)
+        batch.cancel()
+        return run
+
+    manager.submit = cancel_during_submit
+    batch.start()
+    assert batch.done.wait(10)
+    assert [item.status for item in batch.items] == [CANCELLED, 'skipped']
@@ -0,0 +1,17 @@
+import os
+import subprocess
+import sys
+
+from conftest import REPO_DIR
+
+
+def test_gui_imports_within_budget():
+    """import_budget.py measures in fresh interpreters, so run it as a script"""
+    result = subprocess.run(
+        [sys.executable, os.path.join(REPO_DIR, 'import_budget.py'), '--runs', '3'],
+        capture_output=True,
+        text=True,
+        cwd=REPO_DIR
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert 'OK: within import budget' in result.stdout
@@ -0,0 +1,60 @@
+import os
+import socket
+import stat
+import sys
+
+import pytest
+
+import local_rpc
+from local_rpc import INVALID_PARAMS, RpcClient, RpcError, RpcServer, default_endpoint_file
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason="connects to the Unix socket directly")
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    server = RpcServer()
+    server.register('echo', lambda text: text)
+    server.start()
+    yield server
+    server.close()
+
+
+def test_call_and_invalid_params(server):
+    with RpcClient() as client:
+        assert client.call('echo', text='hello') == 'hello'
+        with pytest.raises(RpcError) as error:
+            client.call('echo', wrong='hello')
+        assert error.value.code == INVALID_PARAMS
+
+
+def test_endpoint_file_is_private(server):
+    assert stat.S_IMODE(os.stat(server.endpoint_file).st_mode) == 0o600
+
+
+def test_a_client_stuck_in_the_handshake_doesnt_block_others(server):
+    address, _ = local_rpc.default_address()
+    stuck = socket.socket(socket.AF_UNIX)
+    stuck.connect(address)
+    try:
+        with RpcClient(timeout=5) as client:
+            assert client.call('echo', text='still here') == 'still here'
+    finally:
+        stuck.close()
+
+
+def test_wrong_key_is_refused(server, tmp_path):
+    from multiprocessing import AuthenticationError
+    from multiprocessing.connection import Client
+    address, family = local_rpc.default_address()
+    with pytest.raises(AuthenticationError):
+        Client(address, family=family, authkey=b'wrong')
+
+
+def test_windows_endpoint_lives_in_local_app_data(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, 'platform', 'win32')
+    monkeypatch.setenv('LOCALAPPDATA', str(tmp_path / 'Local'))
+    first = default_endpoint_file(str(tmp_path / 'a'))
+    assert first.startswith(str(tmp_path / 'Local' / 'PowerShellScriptManager'))
+    assert first != default_endpoint_file(str(tmp_path / 'b'))
@@ -0,0 +1,86 @@
+from background_tasks import TaskGenerations
+from module_dependencies import DependencyGraph, parse_required_modules, satisfies
+
+MANIFEST = '''@{
+    ModuleVersion = '2.1.0'
+    # RequiredModules = @('Commented.Out')
+    RequiredModules = @(
+        'Az.Accounts',
+        @{ ModuleName = 'PackageManagement'; ModuleVersion = '1.4.7' },
+        @{ModuleName="PowerShellGet"; RequiredVersion="2.2.5"}  # pinned
+        @{ ModuleName = 'Pester'; ModuleVersion = '4.0'; MaximumVersion = '4.*' }
+    )
+    <# RequiredModules = 'Block.Comment' #>
+    FunctionsToExport = @('Get-Thing')
+}
+'''
+
+
+def requirement(name, min_version=None, required_version=None, max_version=None):
+    return {'name': name, 'min_version': min_version, 'required_version': required_version,
+            'max_version': max_version}
+
+
+def test_parse_required_modules():
+    assert parse_required_modules(MANIFEST) == [
+        requirement('Az.Accounts'),
+        requirement('PackageManagement', min_version='1.4.7'),
+        requirement('PowerShellGet', required_version='2.2.5'),
+        requirement('Pester', min_version='4.0', max_version='4.*'),
+    ]
+
+
+def test_single_required_module_without_array():
+    assert parse_required_modules("@{ RequiredModules = 'Az.Accounts'; ModuleVersion = '1.0' }") == [
+        requirement('Az.Accounts')]
+
+
+def test_manifest_without_required_modules():
+    assert parse_required_modules("@{ ModuleVersion = '1.0' }") == []
+
+
+def test_satisfies():
+    assert satisfies('1.4.7', requirement('X', min_version='1.4.7'))
+    assert not satisfies('1.4.6', requirement('X', min_version='1.4.7'))
+    assert satisfies('2.2.5', requirement('X', required_version='2.2.5'))
+    assert not satisfies('2.2.6', requirement('X', required_version='2.2.5'))
+    assert satisfies('4.10.1', requirement('X', min_version='4.0', max_version='4.*'))
+    assert not satisfies('5.0.0', requirement('X', min_version='4.0', max_version='4.*'))
+    assert not satisfies('3.0', requirement('X', max_version='2.9'))
+
+
+def write_module(root, name, version, manifest):
+    folder = root / name / version
+    folder.mkdir(parents=True)
+    path = folder / f'{name}.psd1'
+    path.write_text(manifest, encoding='utf-8')
+    return (name, version, str(path))
+
+
+def test_graph_reverse_edges_and_breakage(tmp_path):
+    modules = [
+        write_module(tmp_path, 'Base', '1.0', "@{ ModuleVersion = '1.0' }"),
+        write_module(tmp_path, 'Base', '2.0', "@{ ModuleVersion = '2.0' }"),
+        write_module(tmp_path, 'Mid', '1.0', "@{ RequiredModules = @(@{ModuleName='Base'; ModuleVersion='2.0'}) }"),
+        write_module(tmp_path, 'Top', '1.0', "@{ RequiredModules = @('Mid') }"),
+    ]
+    graph = DependencyGraph(str(tmp_path / 'cache.json'))
+    assert graph.build(modules)
+
+    assert graph.required_by('Base') == [('Mid', '1.0')]
+    # Base 1.0 doesn't meet Mid's requirement, so removing 2.0 breaks Mid and with it Top
+    assert graph.breaks_if_uninstalled('Base', '2.0') == [('Mid', '1.0'), ('Top', '1.0')]
+    assert graph.breaks_if_uninstalled('Base', '1.0') == []
+
+    # Unchanged manifests come from the cache
+    assert not DependencyGraph(str(tmp_path / 'cache.json')).build(modules)
+
+
+def test_cancelled_build_leaves_the_graph_alone(tmp_path):
+    modules = [write_module(tmp_path, 'Base', '1.0', "@{ ModuleVersion = '1.0' }")]
+    graph = DependencyGraph(str(tmp_path / 'cache.json'))
+    builds = TaskGenerations()
+    superseded = builds.start()
+    builds.start()
+    assert not graph.build(modules, superseded)
+    assert not graph.ready and graph.modules == {}
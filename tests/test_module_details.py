@@ -0,0 +1,107 @@
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import module_details
+from conftest import REPO_DIR
+from module_details import ModuleDetailsCache
+
+FAKE_POWERSHELL = [sys.executable, os.path.join(REPO_DIR, 'fake_powershell.py')]
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """Stub fetch_module_details; fetches of 'Slow' block until cancelled or released"""
+    stub = SimpleNamespace(names=[], priorities=[], running=threading.Event(), release=threading.Event())
+
+    def fetch(command, name, path, low_priority=False, token=None):
+        stub.names.append(name)
+        stub.priorities.append(low_priority)
+        if name == 'Slow':
+            stub.running.set()
+            while not stub.release.wait(0.01):
+                if token and token.cancelled:
+                    return None
+        return {'Name': name}, []
+
+    monkeypatch.setattr(module_details, 'fetch_module_details', fetch)
+    return stub
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ModuleDetailsCache(str(tmp_path / 'details.json'), command=FAKE_POWERSHELL)
+
+
+def module(name):
+    return (name, '1.0', f'{name}.psd1')
+
+
+def wait_for(cache, *names):
+    """Request modules as the details window does and wait for all of them"""
+    results = {}
+    done = threading.Event()
+
+    def callback(name):
+        def store(details):
+            results[name] = details
+            if len(results) == len(names):
+                done.set()
+        return store
+
+    for name in names:
+        cache.request(*module(name), callback=callback(name))
+    assert done.wait(10)
+    return results
+
+
+def test_a_new_selection_replaces_queued_prefetches(fetches, cache):
+    cache.prefetch([module('Slow'), module('A'), module('B')])
+    assert fetches.running.wait(10)
+
+    # The selection moved: Slow is killed and A and B are never fetched
+    cache.prefetch([module('C')])
+    assert wait_for(cache, 'D') == {'D': ({'Name': 'D'}, [])}
+    wait_for(cache, 'C')
+    assert fetches.names[0] == 'Slow' and sorted(fetches.names[1:]) == ['C', 'D']
+    assert cache.get(*module('Slow')) is None
+
+
+def test_shown_modules_go_before_prefetches(fetches, cache):
+    with cache.lock:
+        # Queue everything before the worker can pick anything up
+        cache.prefetches.extend([module('A'), module('B')])
+        cache.requests.append(module('Shown'))
+        cache.start_worker()
+    deadline = time.monotonic() + 10
+    while len(fetches.names) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert fetches.names == ['Shown', 'A', 'B']
+    assert fetches.priorities == [False, True, True]
+
+
+def test_a_shown_module_is_not_cancelled_by_a_new_selection(fetches, cache):
+    cache.prefetch([module('Slow')])
+    assert fetches.running.wait(10)
+    shown = threading.Event()
+    cache.request(*module('Slow'), callback=lambda details: shown.set())
+    cache.prefetch([module('C')])
+    fetches.release.set()
+
+    assert shown.wait(10)
+    assert cache.get(*module('Slow')) == ({'Name': 'Slow'}, [])
+    wait_for(cache, 'C')
+    assert fetches.names == ['Slow', 'C']
+
+
+def test_details_from_fake_powershell(cache):
+    key = ('PackageManagement', '1.0.0.1',
+           r'C:\Program Files\WindowsPowerShell\Modules\PackageManagement\1.0.0.1\PackageManagement.psd1')
+    done = threading.Event()
+    cache.request(*key, callback=lambda details: done.set())
+    assert done.wait(10)
+    assert cache.get(*key)[0]['Name'] == 'PackageManagement'
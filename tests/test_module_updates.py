@@ -0,0 +1,146 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+import zipfile
+
+import pytest
+
+import module_updates
+from module_updates import LocalFolderFeed, ResponseCache, check_updates, latest_of, make_feed
+
+NUSPEC = '''<?xml version="1.0" encoding="utf-8"?>
+<package xmlns="http://schemas.microsoft.com/packaging/2013/05/nuspec.xsd">
+  <metadata>
+    <id>{id}</id>
+    <version>{version}</version>
+  </metadata>
+</package>
+'''
+
+
+def write_package(folder, package_id, version):
+    path = folder / f'{package_id}.{version}.nupkg'
+    with zipfile.ZipFile(path, 'w') as package:
+        package.writestr(f'{package_id}.nuspec', NUSPEC.format(id=package_id, version=version))
+        package.writestr(f'lib/{package_id}.nuspec', NUSPEC.format(id='Nested', version='99.0'))
+    return path
+
+
+def test_latest_of_skips_prereleases():
+    assert latest_of(['1.9.0', '1.10.0', '2.0.0-beta1']) == '1.10.0'
+    assert latest_of(['1.9.0', '2.0.0-beta1'], include_prerelease=True) == '2.0.0-beta1'
+    assert latest_of([]) is None
+
+
+def test_local_folder_feed_reads_nuspecs(tmp_path):
+    write_package(tmp_path, 'Pester', '4.10.1')
+    write_package(tmp_path, 'Pester', '5.5.0')
+    (tmp_path / 'sub').mkdir()
+    write_package(tmp_path / 'sub', 'Az.Accounts', '2.12.1')
+    (tmp_path / 'broken.nupkg').write_bytes(b'not a zip')
+
+    feed = make_feed(str(tmp_path))
+    assert isinstance(feed, LocalFolderFeed)
+    assert feed.latest_version('pester') == '5.5.0'
+    assert feed.latest_version('Az.Accounts') == '2.12.1'
+    assert feed.latest_version('Nested') is None
+    assert feed.latest_version('Missing') is None
+
+
+class FakeResponse:
+    def __init__(self, body, etag):
+        self.body = body
+        self.headers = {'ETag': etag}
+
+    def read(self):
+        return self.body.encode('utf-8')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Stub urlopen with a server that answers 304 when the ETag matches"""
+    state = {'body': '<feed>v1</feed>', 'etag': '"1"', 'requests': []}
+
+    def urlopen(request, timeout=None):
+        sent_etag = request.get_header('If-none-match')
+        state['requests'].append(sent_etag)
+        if sent_etag == state['etag']:
+            raise urllib.error.HTTPError(request.full_url, 304, 'Not Modified', {}, None)
+        return FakeResponse(state['body'], state['etag'])
+
+    monkeypatch.setattr(urllib.request, 'urlopen', urlopen)
+    return state
+
+
+def test_fresh_responses_come_from_the_cache(server, tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.json'), ttl=60)
+    assert cache.fetch('https://feed/a') == '<feed>v1</feed>'
+    assert cache.fetch('https://feed/a') == '<feed>v1</feed>'
+    assert server['requests'] == [None]
+
+
+def test_expired_responses_are_revalidated_with_their_etag(server, tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.json'), ttl=0)
+    cache.fetch('https://feed/a')
+    assert cache.fetch('https://feed/a') == '<feed>v1</feed>'
+    assert server['requests'] == [None, '"1"']
+
+    # A changed feed answers with the new body and ETag
+    server['body'], server['etag'] = '<feed>v2</feed>', '"2"'
+    assert cache.fetch('https://feed/a') == '<feed>v2</feed>'
+    assert cache.entries['https://feed/a']['etag'] == '"2"'
+
+
+def test_save_prunes_entries_that_cant_be_reused(tmp_path, monkeypatch):
+    cache_file = tmp_path / 'cache.json'
+    cache = ResponseCache(str(cache_file), ttl=60, retention=3600)
+    now = 10000.0
+    monkeypatch.setattr(module_updates.time, 'time', lambda: now)
+    cache.entries = {
+        'fresh': {'etag': None, 'fetched': now - 10, 'body': ''},
+        'revalidate': {'etag': '"1"', 'fetched': now - 600, 'body': ''},
+        'expired': {'etag': None, 'fetched': now - 600, 'body': ''},
+        'abandoned': {'etag': '"1"', 'fetched': now - 7200, 'body': ''},
+    }
+    cache.save()
+    assert sorted(json.loads(cache_file.read_text())['responses']) == ['fresh', 'revalidate']
+    assert sorted(ResponseCache(str(cache_file)).entries) == ['fresh', 'revalidate']
+
+
+class FakeFeed:
+    def __init__(self, versions):
+        self.versions = versions
+        self.closed = False
+
+    def latest_version(self, name):
+        if name not in self.versions:
+            raise KeyError(name)
+        return self.versions[name]
+
+    def close(self):
+        self.closed = True
+
+
+def test_check_updates_compares_the_highest_installed_version():
+    feed = FakeFeed({'Pester': '5.5.0', 'Az.Accounts': '2.12.1'})
+    results = []
+    modules = [('Pester', '4.10.1'), ('Pester', '5.5.0'), ('Az.Accounts', '2.9.0'), ('Missing', '1.0')]
+
+    latest = check_updates(modules, feed, on_result=lambda *result: results.append(result))
+    assert latest == {'Pester': '5.5.0', 'Az.Accounts': '2.12.1', 'Missing': None}
+    assert sorted(results) == [('Az.Accounts', '2.12.1', True), ('Missing', None, False),
+                               ('Pester', '5.5.0', False)]
+    assert feed.closed
+
+
+def test_cancelled_check_skips_lookups():
+    cancelled = threading.Event()
+    cancelled.set()
+    assert check_updates([('Pester', '4.10.1')], FakeFeed({}), cancelled=cancelled) == {'Pester': None}
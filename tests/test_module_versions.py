@@ -0,0 +1,37 @@
+from module_versions import format_version, is_prerelease, parse_version
+
+
+def test_four_part_versions_sort_numerically():
+    versions = ['1.10.0', '1.2.0.1', '1.2', '2.0.0.0', '1.2.0']
+    assert sorted(versions, key=parse_version) == ['1.2', '1.2.0', '1.2.0.1', '1.10.0', '2.0.0.0']
+
+
+def test_missing_parts_are_zero():
+    assert parse_version('1.2') == parse_version('1.2.0.0')
+    assert parse_version('v1.2.3') == parse_version('1.2.3')
+
+
+def test_prereleases_sort_before_the_release():
+    versions = ['1.2.3', '1.2.3-rc.1', '1.2.3-beta.11', '1.2.3-beta.2', '1.2.3-beta', '1.2.2']
+    assert sorted(versions, key=parse_version) == [
+        '1.2.2', '1.2.3-beta', '1.2.3-beta.2', '1.2.3-beta.11', '1.2.3-rc.1', '1.2.3']
+
+
+def test_build_metadata_is_ignored():
+    assert parse_version('1.2.3+build.5') == parse_version('1.2.3')
+
+
+def test_text_sorts_before_versions():
+    assert parse_version('Unknown') < parse_version('0.0.1')
+    assert not is_prerelease('Unknown')
+
+
+def test_is_prerelease():
+    assert is_prerelease('3.0.0-preview4')
+    assert not is_prerelease('3.0.0')
+
+
+def test_format_version():
+    assert format_version({'Major': 1, 'Minor': 2, 'Build': 3, 'Revision': -1}) == '1.2.3'
+    assert format_version('5.1.0') == '5.1.0'
+    assert format_version(None) == 'N/A'
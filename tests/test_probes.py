@@ -0,0 +1,76 @@
+import os
+import sys
+
+import pytest
+
+from conftest import REPO_DIR
+from execution import INTERPRETER_ENV
+from probes import CircuitBreaker, ProbeFailed, ProbeRunner
+
+FAKE_POWERSHELL = f'"{sys.executable}" "{os.path.join(REPO_DIR, "fake_powershell.py")}"'
+HANGING_POWERSHELL = f'"{sys.executable}" -c "import time; time.sleep(30)"'
+
+
+def test_breaker_opens_after_threshold_failures():
+    breaker = CircuitBreaker(threshold=3, cooldown=60)
+    for _ in range(2):
+        breaker.failed()
+    assert breaker.allow() and not breaker.is_open
+    breaker.failed()
+    assert breaker.is_open
+    assert not breaker.allow()
+
+
+def test_breaker_lets_one_trial_through_after_cooldown():
+    breaker = CircuitBreaker(threshold=1, cooldown=0)
+    breaker.failed()
+    assert breaker.allow()
+    # Only one trial at a time while half-open
+    assert not breaker.allow()
+    breaker.failed()
+    assert breaker.is_open and breaker.allow()
+    breaker.succeeded()
+    assert not breaker.is_open
+    assert breaker.allow() and breaker.allow()
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(threshold=2, cooldown=60)
+    breaker.failed()
+    breaker.succeeded()
+    breaker.failed()
+    assert not breaker.is_open
+
+
+@pytest.fixture
+def runner(tmp_path):
+    return ProbeRunner(str(tmp_path / 'probe_cache.json'), timeout=10)
+
+
+def test_answers_are_cached(runner, monkeypatch, tmp_path):
+    monkeypatch.setenv(INTERPRETER_ENV, FAKE_POWERSHELL)
+    assert runner.run('Get-ExecutionPolicy') == 'RemoteSigned'
+    reloaded = ProbeRunner(str(tmp_path / 'probe_cache.json'))
+    assert reloaded.run('Get-ExecutionPolicy', cached_only=True) == 'RemoteSigned'
+    with pytest.raises(ProbeFailed):
+        reloaded.run('$PROFILE', cached_only=True)
+
+
+def test_timeout_falls_back_to_the_cache_and_opens_the_breaker(runner, monkeypatch):
+    monkeypatch.setenv(INTERPRETER_ENV, FAKE_POWERSHELL)
+    runner.run('Get-ExecutionPolicy')
+    monkeypatch.setenv(INTERPRETER_ENV, HANGING_POWERSHELL)
+    runner.breaker('powershell.exe').threshold = 1
+    assert runner.run('Get-ExecutionPolicy', timeout=0.5) == 'RemoteSigned'
+    assert runner.breaker('powershell.exe').is_open
+    with pytest.raises(ProbeFailed):
+        runner.run('$PROFILE')
+
+
+def test_missing_host_forgets_its_answers(runner, monkeypatch):
+    runner.entries['pwsh|(Get-Host).Version.ToString()'] = {'output': '7.4.1', 'time': 0}
+    runner.entries['powershell.exe|Get-ExecutionPolicy'] = {'output': 'RemoteSigned', 'time': 0}
+    monkeypatch.setenv(INTERPRETER_ENV, 'psm-missing-powershell-host')
+    with pytest.raises(ProbeFailed):
+        runner.run('(Get-Host).Version.ToString()', executable='pwsh')
+    assert list(runner.entries) == ['powershell.exe|Get-ExecutionPolicy']
@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+
+import pytest
+
+import run_history
+from run_history import RunHistory, percentile
+
+
+def make_run(path, start_time, duration, status='completed'):
+    return SimpleNamespace(script_path=path, start_time=start_time, duration=duration, exit_code=0,
+                           status=status, output_size=0, peak_memory=None, elevated=False)
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = RunHistory(str(tmp_path / 'run_history.db'))
+    yield history
+    history.close()
+
+
+def test_percentile():
+    assert percentile([], 0.5) is None
+    assert percentile([1, 2, 3, 4], 0.5) == 2
+    assert percentile(list(range(1, 101)), 0.95) == 95
+
+
+def test_stats_count_runs_and_skip_cancelled_timings(history):
+    history.record_run(make_run('a.ps1', 1, 1.0))
+    history.record_run(make_run('a.ps1', 2, 3.0))
+    history.record_run(make_run('a.ps1', 3, 100.0, status='cancelled'))
+    history.record_run(make_run('b.ps1', 4, None, status='failed'))
+
+    stats = history.stats()
+    assert stats['a.ps1'] == {'last_run': 3, 'runs': 3, 'p50': 1.0, 'p95': 3.0}
+    assert stats['b.ps1'] == {'last_run': 4, 'runs': 1, 'p50': None, 'p95': None}
+    assert history.stats('missing.ps1') == {}
+
+
+def test_percentiles_use_the_most_recent_runs(history, monkeypatch, tmp_path):
+    monkeypatch.setattr(run_history, 'PERCENTILE_WINDOW', 3)
+    for start, duration in enumerate([50.0, 50.0, 1.0, 2.0, 3.0]):
+        history.record_run(make_run('a.ps1', start, duration))
+    assert history.stats('a.ps1')['a.ps1']['p95'] == 3.0
+
+    # Runs recorded after the stats were loaded are folded in
+    history.record_run(make_run('a.ps1', 5, 4.0))
+    assert history.stats('a.ps1')['a.ps1'] == {'last_run': 5, 'runs': 6, 'p50': 3.0, 'p95': 4.0}
+
+    # A fresh instance reads the same stats from the database
+    reopened = RunHistory(str(tmp_path / 'run_history.db'))
+    assert reopened.stats() == history.stats()
+    reopened.close()
@@ -0,0 +1,77 @@
+from script_metadata import extract_file, parse_metadata
+
+SCRIPT = '''#Requires -Version 5.1
+#Requires -Modules ActiveDirectory, @{ModuleName='Az.Accounts'; ModuleVersion='2.0'}
+<#
+.SYNOPSIS
+    Back up a folder.
+.DESCRIPTION
+    Copies the folder to the backup share
+    and keeps the last five copies.
+.PARAMETER Path
+    Folder to back up. Example: param($NotAParam)
+.EXAMPLE
+    .\\Backup.ps1 -Path C:\\Data
+#>
+[CmdletBinding()]
+param(
+    [Parameter(Mandatory = $true)]
+    [ValidateNotNullOrEmpty()]
+    [string]$Path,
+
+    [ValidateSet('Full', 'Incremental')]
+    [string]$Mode = 'Full',
+
+    [int[]]$Keep = @(1, 2),
+
+    [switch]$WhatIf
+)
+Import-Module -Name Storage
+using module .\\Helpers\\Shared.psm1
+'''
+
+
+def test_help_sections():
+    metadata = parse_metadata(SCRIPT)
+    assert metadata['synopsis'] == 'Back up a folder.'
+    assert metadata['description'] == 'Copies the folder to the backup share and keeps the last five copies.'
+
+
+def test_params_with_attributes_and_defaults():
+    params = parse_metadata(SCRIPT)['params']
+    assert params == [
+        {'name': 'Path', 'type': 'string', 'mandatory': True},
+        {'name': 'Mode', 'type': 'string', 'mandatory': False},
+        {'name': 'Keep', 'type': 'int[]', 'mandatory': False},
+        {'name': 'WhatIf', 'type': 'switch', 'mandatory': False},
+    ]
+
+
+def test_requires_and_modules():
+    metadata = parse_metadata(SCRIPT)
+    assert metadata['requires'][0] == '-Version 5.1'
+    assert metadata['modules'] == ['Storage', 'Shared.psm1', 'ActiveDirectory', 'Az.Accounts']
+
+
+def test_single_line_comment_help():
+    metadata = parse_metadata('# .SYNOPSIS\n# Says hello\nWrite-Output hello\n')
+    assert metadata['synopsis'] == 'Says hello'
+    assert metadata['params'] == []
+
+
+def test_function_param_block_is_not_the_script_param_block():
+    content = 'function Get-Thing {\n    param([string]$Name)\n}\nGet-Thing -Name x\n'
+    assert parse_metadata(content)['params'] == []
+
+
+def test_extract_file(tmp_path):
+    script = tmp_path / 'Backup.ps1'
+    script.write_text(SCRIPT, encoding='utf-8-sig')
+    path, mtime, metadata = extract_file(str(script))
+    assert path == str(script)
+    assert mtime == script.stat().st_mtime
+    assert metadata['synopsis'] == 'Back up a folder.'
+
+
+def test_extract_missing_file(tmp_path):
+    assert extract_file(str(tmp_path / 'missing.ps1'))[1:] == (None, None)
@@ -0,0 +1,83 @@
+import itertools
+import threading
+import time
+from collections import OrderedDict
+
+# Interval between drains while there is work, about one display frame
+FRAME_MS = 16
+
+# Interval between checks for work once the queue has been empty for a while
+IDLE_MS = 50
+
+# Tk time spent on queued callbacks per frame; the rest waits for the next frame
+FRAME_BUDGET_MS = 10
+
+# Frames without work before falling back to the idle interval
+IDLE_AFTER_FRAMES = 30
+
+
+class UIDispatcher:
+    """Runs callbacks posted from worker threads on the Tk thread, a frame at a time.
+
+    Worker threads never touch Tk: post() only adds to a locked queue, which a
+    single after() loop on the Tk thread drains. Callbacks posted with the same
+    key are coalesced, so only the latest one runs: a run that changes status
+    five times between two frames updates its row once. Unkeyed callbacks run
+    in the order they were posted. A frame stops running callbacks once its
+    budget is spent, so a burst of updates never freezes the window.
+    """
+
+    def __init__(self, root, frame_ms=FRAME_MS, idle_ms=IDLE_MS, budget_ms=FRAME_BUDGET_MS):
+        self.root = root
+        self.frame_ms = frame_ms
+        self.idle_ms = idle_ms
+        self.budget = budget_ms / 1000
+        self.pending = OrderedDict()
+        self.lock = threading.Lock()
+        self.counter = itertools.count()
+        self.idle_frames = 0
+        self.after_id = None
+
+    def start(self):
+        """Start draining; must be called on the Tk thread"""
+        if self.after_id is None:
+            self.after_id = self.root.after(self.frame_ms, self.drain)
+
+    def stop(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+    def post(self, callback, key=None):
+        """Run callback() on the Tk thread in the next frame; safe to call from any thread.
+
+        A later post with the same key replaces a callback that hasn't run yet.
+        """
+        with self.lock:
+            if key is None:
+                key = next(self.counter)
+            else:
+                # Move it to the end, so it runs after everything posted before it
+                self.pending.pop(('key', key), None)
+                key = ('key', key)
+            self.pending[key] = callback
+
+    def drain(self):
+        deadline = time.perf_counter() + self.budget
+        ran = 0
+        while True:
+            with self.lock:
+                if not self.pending:
+                    break
+                _, callback = self.pending.popitem(last=False)
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in UI callback: {e}")
+            ran += 1
+            if time.perf_counter() > deadline:
+                break
+
+        self.idle_frames = 0 if ran else self.idle_frames + 1
+        delay = self.frame_ms if self.idle_frames < IDLE_AFTER_FRAMES else self.idle_ms
+        self.after_id = self.root.after(delay, self.drain)
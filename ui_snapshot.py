@@ -0,0 +1,60 @@
+import json
+import os
+
+from script_record import ScriptRecord
+
+SNAPSHOT_VERSION = 1
+
+
+class UISnapshot:
+    """Compact record of the script lists as last shown, used to paint the window before scanning"""
+
+    def __init__(self, snapshot_file='ui_snapshot.json'):
+        self.snapshot_file = snapshot_file
+        self.scripts = []
+        self.selection = None
+        self.load()
+
+    def load(self):
+        try:
+            if os.path.exists(self.snapshot_file):
+                with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == SNAPSHOT_VERSION:
+                    self.scripts = [tuple(entry) for entry in data.get('scripts', [])]
+                    self.selection = data.get('selection')
+        except Exception as e:
+            print(f"Error loading UI snapshot: {e}")
+            self.scripts = []
+            self.selection = None
+
+    def save(self):
+        try:
+            # Write to a temporary file first so an interrupted save never leaves a broken snapshot
+            temp_file = self.snapshot_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': SNAPSHOT_VERSION,
+                    'scripts': [list(entry) for entry in self.scripts],
+                    'selection': self.selection
+                }, f, separators=(',', ':'))
+            os.replace(temp_file, self.snapshot_file)
+        except Exception as e:
+            print(f"Error saving UI snapshot: {e}")
+
+    def store_scripts(self, scripts):
+        """Remember the scripts currently shown (ScriptRecords as returned by AppData)"""
+        self.scripts = [(script.full_path, script.folder, 1 if script.is_favorite else 0)
+                        for script in scripts]
+
+    def paths(self):
+        return [entry[0] for entry in self.scripts]
+
+    def get_scripts(self, favorites=None):
+        """Return the snapshot as ScriptRecords, like AppData.get_all_powershell_scripts.
+
+        Favorite state comes from `favorites` (AppData.favorites) if given, else from the snapshot.
+        """
+        if favorites is None:
+            favorites = {full_path for full_path, _, is_favorite in self.scripts if is_favorite}
+        return [ScriptRecord(full_path, folder, favorites) for full_path, folder, _ in self.scripts]
@@ -0,0 +1,234 @@
+import base64
+import subprocess
+import sys
+import threading
+
+from ps_runner import start_record
+
+# PowerShell side of a warm host. It keeps a fresh runspace opened ahead of time,
+# reads "<id>\t<path>" requests from stdin and streams "<id> O|E <line>" output
+# followed by "<id> X <exit code>" back over stdout.
+HOST_SCRIPT = r'''
+$ErrorActionPreference = 'Continue'
+[Console]::OutputEncoding = [System.Text.Encoding]::UTF8
+$PreloadModules = @(__MODULES__)
+
+function New-WarmRunspace {
+    $iss = [System.Management.Automation.Runspaces.InitialSessionState]::CreateDefault()
+    if ($PreloadModules.Count -gt 0) { $iss.ImportPSModule([string[]]$PreloadModules) }
+    $runspace = [System.Management.Automation.Runspaces.RunspaceFactory]::CreateRunspace($iss)
+    $runspace.Open()
+    $runspace
+}
+
+$Runner = {
+    param($ScriptPath, $RunId)
+    Set-Location -LiteralPath (Split-Path -Parent $ScriptPath)
+    $global:LASTEXITCODE = 0
+    & $ScriptPath *>&1 | ForEach-Object {
+        $kind = if ($_ -is [System.Management.Automation.ErrorRecord]) { 'E' } else { 'O' }
+        foreach ($line in (($_ | Out-String -Width 4096).TrimEnd() -split "`r?`n")) {
+            [Console]::Out.WriteLine("$RunId $kind $line")
+        }
+        [Console]::Out.Flush()
+    }
+    $global:LASTEXITCODE
+}
+
+$NextRunspace = New-WarmRunspace
+[Console]::Out.WriteLine('READY')
+[Console]::Out.Flush()
+
+while ($null -ne ($Request = [Console]::In.ReadLine())) {
+    $RunId, $ScriptPath = $Request -split "`t", 2
+    $ExitCode = 0
+    $Shell = [powershell]::Create()
+    $Shell.Runspace = $NextRunspace
+    try {
+        [void]$Shell.AddScript($Runner).AddArgument($ScriptPath).AddArgument($RunId)
+        $Result = $Shell.Invoke()
+        if ($Result.Count -gt 0 -and $null -ne $Result[-1]) { $ExitCode = [int]$Result[-1] }
+    } catch {
+        [Console]::Out.WriteLine("$RunId E $($_.Exception.Message)")
+        $ExitCode = 1
+    }
+    $Shell.Dispose()
+    $NextRunspace.Dispose()
+    [Console]::Out.WriteLine("$RunId X $ExitCode")
+    [Console]::Out.Flush()
+    $NextRunspace = New-WarmRunspace
+}
+'''
+
+
+class HostDiedError(Exception):
+    pass
+
+
+class WarmHost:
+    """A long-running PowerShell process that runs scripts in fresh runspaces"""
+
+    def __init__(self, command, modules=()):
+        self.command = list(command)
+        self.modules = list(modules)
+        self.process = None
+        self.record = None
+        self.error = None
+
+    def start(self):
+        """Start the host and wait until its first runspace is ready. Returns success."""
+        modules = ', '.join("'" + name.replace("'", "''") + "'" for name in self.modules)
+        script = HOST_SCRIPT.replace('__MODULES__', modules)
+        encoded = base64.b64encode(script.encode('utf-16-le')).decode('ascii')
+
+        command = self.command + ['-NoLogo', '-NoProfile', '-NonInteractive', '-EncodedCommand', encoded]
+        # Spawn latency of a warm host counts until its runspace is ready
+        self.record = start_record(command, label='warm host')
+        kwargs = {}
+        if sys.platform == 'win32':
+            kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+        try:
+            self.process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                **kwargs
+            )
+            while True:
+                line = self.process.stdout.readline()
+                if not line:
+                    self.error = "exited before it was ready"
+                    self.stop()
+                    return False
+                if line.strip() == 'READY':
+                    self.record.spawned()
+                    return True
+        except Exception as e:
+            print(f"Error starting warm PowerShell host: {e}")
+            self.error = str(e)
+            self.stop()
+            return False
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def run_script(self, run_id, script_path, on_output):
+        """Run a script in a fresh runspace, calling on_output(stream, line). Returns the exit code."""
+        process = self.process
+        if process is None:
+            raise HostDiedError("PowerShell host is not running")
+        try:
+            process.stdin.write(f"{run_id}\t{script_path}\n")
+            process.stdin.flush()
+        except Exception as e:
+            raise HostDiedError(str(e))
+
+        prefix = f"{run_id} "
+        while True:
+            line = process.stdout.readline()
+            if not line:
+                raise HostDiedError("PowerShell host exited")
+            line = line.rstrip('\r\n')
+            if not line.startswith(prefix):
+                # Output written straight to the console by the script
+                on_output('stdout', line)
+                continue
+            kind, _, text = line[len(prefix):].partition(' ')
+            if kind == 'X':
+                try:
+                    return int(text)
+                except ValueError:
+                    return None
+            on_output('stderr' if kind == 'E' else 'stdout', text)
+
+    def stop(self):
+        if self.process is None:
+            return
+        exit_code = self.process.poll()
+        try:
+            if exit_code is None:
+                self.process.kill()
+        except Exception:
+            pass
+        if self.record:
+            if self.record.spawn_ms is None:
+                self.record.spawned()
+            self.record.finish(exit_code, error=self.error)
+            self.record = None
+        self.process = None
+
+
+class WarmHostPool:
+    """Keeps a number of pre-warmed PowerShell hosts ready for fast runs.
+
+    on_failure(error) is called, once per pool, when a host fails to start;
+    runs then fall back to normal processes.
+    """
+
+    def __init__(self, command, size=1, modules=(), on_failure=None):
+        self.command = list(command)
+        self.size = max(1, int(size))
+        self.modules = list(modules)
+        self.on_failure = on_failure
+        self.failure_reported = False
+        self.idle = []
+        self.lock = threading.Lock()
+        self.closed = False
+        for _ in range(self.size):
+            self.spawn()
+
+    def spawn(self):
+        """Start a replacement host in the background"""
+        def start_host():
+            host = WarmHost(self.command, self.modules)
+            if not host.start():
+                self.report_failure(host.error)
+                return
+            with self.lock:
+                if not self.closed:
+                    self.idle.append(host)
+                    return
+            host.stop()
+
+        threading.Thread(target=start_host, daemon=True).start()
+
+    def report_failure(self, error):
+        with self.lock:
+            if self.closed or self.failure_reported:
+                return
+            self.failure_reported = True
+        print(f"Warm PowerShell host failed to start: {error}")
+        if self.on_failure:
+            self.on_failure(error)
+
+    def acquire(self):
+        """Return an idle ready host, or None if all are busy or still warming up"""
+        with self.lock:
+            while self.idle:
+                host = self.idle.pop()
+                if host.alive:
+                    return host
+        return None
+
+    def release(self, host):
+        """Return a host after a run; dead hosts are replaced"""
+        with self.lock:
+            if host.alive and not self.closed:
+                self.idle.append(host)
+                return
+        host.stop()
+        if not self.closed:
+            self.spawn()
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            hosts = self.idle
+            self.idle = []
+        for host in hosts:
+            host.stop()